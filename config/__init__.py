@@ -3,12 +3,14 @@ environments (development, production, etc.)
 """
  
 from .environment import detect_environment, load_environment_variables, get_environment_config
-from .database import get_mariadb_config, get_mongodb_config
+from .database import MariaDBConfig, MongoDBConfig, get_mariadb_config, get_mongodb_config
 
 __all__ = [
     'detect_environment', 
     'load_environment_variables', 
     'get_environment_config',
+    'MariaDBConfig',
+    'MongoDBConfig',
     'get_mariadb_config',
     'get_mongodb_config'
 ]
@@ -1,42 +1,75 @@
 """Provides utilities for detecting the application environment."""
 
 import os
+import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from dotenv import load_dotenv
-
 logger = logging.getLogger(__name__)
 
-ENV_DEV = "dev"
-ENV_PROD = "prod"
-ENV_TEST = "test"
+ENV_DEV = sys.intern("dev")
+ENV_PROD = sys.intern("prod")
+ENV_TEST = sys.intern("test")
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
+_ENV_FILENAMES = {ENV_DEV: ".env.dev", ENV_PROD: ".env.prod", ENV_TEST: ".env.test"}
+_ENV_FILES = {env: PROJECT_ROOT / filename for env, filename in _ENV_FILENAMES.items()}
+_DEFAULT_ENV = PROJECT_ROOT / ".env"
+
 
+@lru_cache(maxsize=1)
 def detect_environment() -> str:
     """Detect the current environment based on environment variables.
+    The returned name is case-folded and interned, so it is identical to the ENV_* constants.
+    Detection runs once per process; call detect_environment.cache_clear() to re-detect.
     
     Returns:
         str: The detected environment (etc. dev, prod, test)
     """
-    env = os.environ.get('APP_ENVIRONMENT')
+    env = (os.environ.get('APP_ENVIRONMENT') or '').casefold()
     if env:
-        logger.info(f"Environment explicitly set to: {env}")
-        return env.lower()
+        logger.info("Environment explicitly set to: %s", env)
+        return sys.intern(env)
     
-    if os.environ.get('DOCKER_ENVIRONMENT'):
+    docker_env = os.environ.get('DOCKER_ENVIRONMENT')
+    if docker_env:
         logger.info("Running in Docker environment")
-        return os.environ.get('DOCKER_ENVIRONMENT', ENV_DEV).lower()
+        return sys.intern(docker_env.casefold())
     
-    logger.info(f"No environment specified, defaulting to: {ENV_DEV}")
+    logger.info("No environment specified, defaulting to: %s", ENV_DEV)
     return ENV_DEV
 
 
+@lru_cache(maxsize=None)
+def _resolve_env_file(env: str) -> Optional[Path]:
+    """Resolve which .env file should be loaded for an environment.
+    The decision is cached, including the case where no file exists.
+
+    Args:
+        env (str): Environment name
+
+    Returns:
+        Optional[Path]: Path of the .env file to load, or None if there is none
+    """
+    env_path = _ENV_FILES.get(env) or PROJECT_ROOT / f".env.{env}"
+    if env_path.exists():
+        return env_path
+    
+    if _DEFAULT_ENV.exists():
+        logger.info("Environment file %s not found, loading from %s", env_path, _DEFAULT_ENV)
+        return _DEFAULT_ENV
+    
+    logger.warning("No environment file found at %s or %s", env_path, _DEFAULT_ENV)
+    return None
+
+
+@lru_cache(maxsize=1)
 def load_environment_variables(env: Optional[str] = None) -> str:
     """Load environment variables from the appropriate .env file.
+    The result is cached, so each .env file is parsed at most once per process.
 
     Args:
         env (Optional[str], optional): Optional environment name override. Defaults to None.
@@ -47,36 +80,28 @@ def load_environment_variables(env: Optional[str] = None) -> str:
     if env is None:
         env = detect_environment()
     
-    env_file = f".env.{env}"
-    env_path = PROJECT_ROOT / env_file
-    
-    if env_path.exists():
-        logger.info(f"Loading environment from {env_path}")
+    env_path = _resolve_env_file(env)
+    if env_path is not None:
+        # Imported lazily so deployments without a .env file never load python-dotenv
+        from dotenv import load_dotenv
+        logger.info("Loading environment from %s", env_path)
         load_dotenv(env_path)
-    else:
-        default_env_path = PROJECT_ROOT / ".env"
-        if default_env_path.exists():
-            logger.info(f"Environment file {env_path} not found, loading from {default_env_path}")
-            load_dotenv(default_env_path)
-        else:
-            logger.warning(f"No environment file found at {env_path} or {default_env_path}")
     
     return env
 
 
+@lru_cache(maxsize=1)
 def get_environment_config() -> Dict[str, Any]:
     """Get general environment configuration.
+    The configuration is built once and cached for the lifetime of the process.
     
     Returns:
         Dict[str, Any]: Environment configuration
     """
-    env = load_environment_variables()
+    env = load_environment_variables(detect_environment())
     
     return {
         "environment": env,
-        "debug": env.lower() != ENV_PROD,
+        "debug": env != ENV_PROD,
         "project_name": os.environ.get('COMPOSE_PROJECT_NAME', 'recipe_analysis'),
     }
-
-
-current_env = load_environment_variables()
@@ -3,11 +3,13 @@ mediates between action repositories and domain models.
 """
 
 import logging
-from typing import List, Optional, Dict
+from collections import defaultdict
+from typing import List, Optional, Dict, Tuple
 
 from models.symbol import SymbolType
 from models.instruction import Action, ActionArity
-from repositories.symbol_repository import SymbolRepository
+from repositories.symbol_repository import get_symbol_repository, get_symbol_cache
+from controllers.decorators import safe_repo_call
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +21,26 @@ class ActionController:
     
     def __init__(self):
         """Initialize the action controller with required dependencies."""
-        self.repository = SymbolRepository(SymbolType.ACTION)
+        self.repository = get_symbol_repository(SymbolType.ACTION)
+        # Shared with every controller of this type and cleared by the repository after each write
+        self._cache = get_symbol_cache(SymbolType.ACTION)
 
     # Read Operations
-    def get_all_actions(self) -> List[Action]:
+    @safe_repo_call(tuple, "Error retrieving all actions")
+    def get_all_actions(self) -> Tuple[Action, ...]:
         """Get all actions in the system.
+        The result is cached and shared between calls, so it is returned as a tuple.
         
         Returns:
-            List[Action]: List of all available actions
+            Tuple[Action, ...]: Immutable tuple of all available actions
         """
-        try:
-            return self.repository.get_all()
-        except Exception as e:
-            logger.error(f"Error retrieving all actions: {e}")
-            return []
+        actions = self._cache.get('all')
+        if actions is None:
+            actions = tuple(self.repository.get_all())
+            self._cache['all'] = actions
+        return actions
 
+    @safe_repo_call(None, "Error retrieving action {action_id}")
     def get_action_by_id(self, action_id: int) -> Optional[Action]:
         """Get an action by ID.
         
@@ -43,11 +50,7 @@ class ActionController:
         Returns:
             Optional[Action]: The action if found, None otherwise
         """
-        try:
-            return self.repository.get_by_id(action_id)
-        except Exception as e:
-            logger.error(f"Error retrieving action {action_id}: {e}")
-            return None
+        return self.repository.get_by_id(action_id)
 
     def get_all_action_identities(self) -> List[str]:
         """Get all action identities.
@@ -66,20 +69,26 @@ class ActionController:
         return self.repository.get_all_properties()
     
     # Search Operations
-    def find_actions_by_name(self, name: str) -> List[Action]:
+    @safe_repo_call(tuple, "Error searching actions by name '{name}'")
+    def find_actions_by_name(self, name: str) -> Tuple[Action, ...]:
         """Find actions by name.
+        Results are cached briefly per case-insensitive name; blank names match nothing.
         
         Args:
             name (str): Name or partial name to search for
             
         Returns:
-            List[Action]: List of matching actions
+            Tuple[Action, ...]: Immutable tuple of matching actions
         """
-        try:
-            return self.repository.find_symbols_by_name(name)
-        except Exception as e:
-            logger.error(f"Error searching actions by name '{name}': {e}")
-            return []
+        key = name.casefold()
+        if not key.strip():
+            return ()
+        
+        actions = self._cache.get(('name', key))
+        if actions is None:
+            actions = tuple(self.repository.find_symbols_by_name(name))
+            self._cache[('name', key)] = actions
+        return actions
     
     def find_action_identities_by_name(self, name_pattern: str) -> List[str]:
         """Find action identities by name pattern.
@@ -104,6 +113,7 @@ class ActionController:
         return self.repository.find_properties_by_name(name_pattern)
 
     # Create/Update/Delete Operations
+    @safe_repo_call(None, "Error creating action")
     def create(self, action: Action) -> Optional[Action]:
         """Add a new action to the system.
         
@@ -113,12 +123,9 @@ class ActionController:
         Returns:
             Optional[Action]: The added action with ID assigned, or None if failed
         """
-        try:
-            return self.repository.create(action)
-        except Exception as e:
-            logger.error(f"Error creating action: {e}")
-            return None
+        return self.repository.create(action)
 
+    @safe_repo_call(False, "Error updating action")
     def update(self, action: Action) -> bool:
         """Update an existing action.
         
@@ -132,13 +139,10 @@ class ActionController:
             logger.error("Cannot update action without ID")
             return False
             
-        try:
-            updated = self.repository.update(action)
-            return updated is not None
-        except Exception as e:
-            logger.error(f"Error updating action: {e}")
-            return False
+        updated = self.repository.update(action)
+        return updated is not None
         
+    @safe_repo_call(False, "Error deleting action {action_id}")
     def delete(self, action_id: int) -> bool:
         """Delete an action.
         
@@ -148,57 +152,38 @@ class ActionController:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        try:
-            return self.repository.delete(action_id)
-        except Exception as e:
-            logger.error(f"Error deleting action {action_id}: {e}")
-            return False
+        return self.repository.delete(action_id)
 
     # Analysis Methods
+    @safe_repo_call(dict, "Error grouping actions by complexity")
     def get_actions_by_complexity(self) -> dict:
         """Get actions grouped by their complexity (arity).
         
         Returns:
             dict: Dictionary with arity as key and list of actions as value
         """
-        try:
-            all_actions = self.get_all_actions()
-            complexity_groups = {}
-            
-            for action in all_actions:
-                arity = action.arity if action.arity else ActionArity.VARIABLE
-                if arity not in complexity_groups:
-                    complexity_groups[arity] = []
-                complexity_groups[arity].append(action)
-            
-            return complexity_groups
-        except Exception as e:
-            logger.error(f"Error grouping actions by complexity: {e}")
-            return {}
+        complexity_groups = defaultdict(list)
+        for action in self.get_all_actions():
+            complexity_groups[action.arity or ActionArity.VARIABLE].append(action)
+        
+        return dict(complexity_groups)
 
+    @safe_repo_call(dict, "Error getting action statistics")
     def get_action_statistics(self) -> dict:
         """Get statistics about actions in the system.
+        Derived from a single grouping pass over all actions.
         
         Returns:
             dict: Dictionary containing action statistics
         """
-        try:
-            all_actions = self.get_all_actions()
-            total_count = len(all_actions)
-            
-            arity_counts = {}
-            for action in all_actions:
-                arity = action.arity if action.arity else ActionArity.VARIABLE
-                arity_counts[arity] = arity_counts.get(arity, 0) + 1
-            
-            return {
-                'total_actions': total_count,
-                'arity_distribution': arity_counts,
-                'most_common_arity': max(arity_counts, key=arity_counts.get) if arity_counts else None
-            }
-        except Exception as e:
-            logger.error(f"Error getting action statistics: {e}")
-            return {}
+        complexity_groups = self.get_actions_by_complexity()
+        arity_counts = {arity: len(actions) for arity, actions in complexity_groups.items()}
+        
+        return {
+            'total_actions': sum(arity_counts.values()),
+            'arity_distribution': arity_counts,
+            'most_common_arity': max(arity_counts, key=arity_counts.get, default=None)
+        }
 
     def get_all_action_property_values(self) -> Dict[str, List[str]]:
         """Get all action property keys and their values.
@@ -0,0 +1,51 @@
+"""Provides decorators shared by controllers for uniform error handling
+around repository calls.
+"""
+
+import functools
+import inspect
+import logging
+from typing import Any, Callable, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def _format_message(message: str, signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """Format message with the call's arguments, falling back to the raw template.
+
+    A call that failed because its arguments did not match the signature must
+    still log the original error, so binding and formatting errors are ignored.
+    """
+    try:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return message.format(**bound.arguments)
+    except (TypeError, KeyError, IndexError, ValueError, AttributeError):
+        return message
+
+
+def safe_repo_call(default: Any, message: str) -> Callable[[F], F]:
+    """Log and swallow exceptions raised by a controller method.
+
+    Args:
+        default (Any): Value returned when the call fails. If callable (e.g. list, dict),
+            it is called to build a fresh value so callers never share a mutable default.
+        message (str): Error message template, formatted with the method's arguments by name
+            (e.g. "Error retrieving action {action_id}")
+
+    Returns:
+        Callable[[F], F]: Decorator wrapping the method
+    """
+    def decorator(fn: F) -> F:
+        log = logging.getLogger(fn.__module__)
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                log.error("%s: %s", _format_message(message, signature, args, kwargs), e)
+                return default() if callable(default) else default
+        return wrapper
+    return decorator
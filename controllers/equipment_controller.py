@@ -3,11 +3,12 @@ mediates between equipment repositories and domain models.
 """
 
 import logging
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from models.symbol import SymbolType
 from models.equipment import Equipment
-from repositories.symbol_repository import SymbolRepository
+from repositories.symbol_repository import get_symbol_repository, get_symbol_cache
+from controllers.decorators import safe_repo_call
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +20,26 @@ class EquipmentController:
     
     def __init__(self):
         """Initialize the equipment controller with required dependencies."""
-        self.repository = SymbolRepository(SymbolType.EQUIPMENT)
+        self.repository = get_symbol_repository(SymbolType.EQUIPMENT)
+        # Shared with every controller of this type and cleared by the repository after each write
+        self._cache = get_symbol_cache(SymbolType.EQUIPMENT)
 
     # Read Operations
-    def get_all_equipment(self) -> List[Equipment]:
+    @safe_repo_call(tuple, "Error retrieving all equipment")
+    def get_all_equipment(self) -> Tuple[Equipment, ...]:
         """Get all equipment items in the system.
+        The result is cached and shared between calls, so it is returned as a tuple.
         
         Returns:
-            List[Equipment]: List of all available equipment items
+            Tuple[Equipment, ...]: Immutable tuple of all available equipment items
         """
-        try:
-            return self.repository.get_all()
-        except Exception as e:
-            logger.error(f"Error retrieving all equipment: {e}")
-            return []
+        equipment_items = self._cache.get('all')
+        if equipment_items is None:
+            equipment_items = tuple(self.repository.get_all())
+            self._cache['all'] = equipment_items
+        return equipment_items
 
+    @safe_repo_call(None, "Error retrieving equipment {entity_id}")
     def get_equipment_by_id(self, entity_id: int) -> Optional[Equipment]:
         """Get an equipment item by ID.
         
@@ -43,11 +49,7 @@ class EquipmentController:
         Returns:
             Optional[Equipment]: The equipment if found, None otherwise
         """
-        try:
-            return self.repository.get_by_id(entity_id)
-        except Exception as e:
-            logger.error(f"Error retrieving equipment {entity_id}: {e}")
-            return None
+        return self.repository.get_by_id(entity_id)
 
     def get_all_equipment_identities(self) -> List[str]:
         """Get all equipment identities.
@@ -74,20 +76,26 @@ class EquipmentController:
         return self.repository.get_all_property_values()
 
     # Search Operations
-    def find_equipment_by_name(self, name: str) -> List[Equipment]:
+    @safe_repo_call(tuple, "Error searching equipment by name '{name}'")
+    def find_equipment_by_name(self, name: str) -> Tuple[Equipment, ...]:
         """Find equipment by name.
+        Results are cached briefly per case-insensitive name; blank names match nothing.
         
         Args:
             name (str): Name or partial name to search for
             
         Returns:
-            List[Equipment]: List of matching equipment items
+            Tuple[Equipment, ...]: Immutable tuple of matching equipment items
         """
-        try:
-            return self.repository.find_symbols_by_name(name)
-        except Exception as e:
-            logger.error(f"Error searching equipment by name '{name}': {e}")
-            return []
+        key = name.casefold()
+        if not key.strip():
+            return ()
+        
+        equipment_items = self._cache.get(('name', key))
+        if equipment_items is None:
+            equipment_items = tuple(self.repository.find_symbols_by_name(name))
+            self._cache[('name', key)] = equipment_items
+        return equipment_items
         
     def find_equipment_identities_by_name(self, name_pattern: str) -> List[str]:
         """Find equipment identities by name pattern.
@@ -112,6 +120,7 @@ class EquipmentController:
         return self.repository.find_properties_by_name(name_pattern)
 
     # Create/Update/Delete Operations             
+    @safe_repo_call(None, "Error creating equipment")
     def create(self, equipment: Equipment) -> Optional[Equipment]:
         """Add a new equipment item to the system.
         
@@ -121,12 +130,9 @@ class EquipmentController:
         Returns:
             Optional[Equipment]: The added equipment with ID assigned, or None if failed
         """
-        try:
-            return self.repository.create(equipment)
-        except Exception as e:
-            logger.error(f"Error creating equipment: {e}")
-            return None
+        return self.repository.create(equipment)
 
+    @safe_repo_call(False, "Error updating equipment")
     def update(self, equipment: Equipment) -> bool:
         """Update an existing equipment item.
         
@@ -140,13 +146,10 @@ class EquipmentController:
             logger.error("Cannot update equipment without ID")
             return False
             
-        try:
-            updated = self.repository.update(equipment)
-            return updated is not None
-        except Exception as e:
-            logger.error(f"Error updating equipment: {e}")
-            return False
+        updated = self.repository.update(equipment)
+        return updated is not None
         
+    @safe_repo_call(False, "Error deleting equipment {entity_id}")
     def delete(self, entity_id: int) -> bool:
         """Delete an equipment item.
         
@@ -156,8 +159,4 @@ class EquipmentController:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        try:
-            return self.repository.delete(entity_id)
-        except Exception as e:
-            logger.error(f"Error deleting equipment {entity_id}: {e}")
-            return False
+        return self.repository.delete(entity_id)
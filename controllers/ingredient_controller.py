@@ -3,11 +3,12 @@ mediates between ingredient repositories and domain models.
 """
 
 import logging
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from models.symbol import SymbolType
 from models.ingredient import Ingredient
-from repositories.symbol_repository import SymbolRepository
+from repositories.symbol_repository import get_symbol_repository, get_symbol_cache
+from controllers.decorators import safe_repo_call
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +20,26 @@ class IngredientController:
     
     def __init__(self):
         """Initialize the ingredient controller with required dependencies."""
-        self.repository = SymbolRepository(SymbolType.INGREDIENT)
+        self.repository = get_symbol_repository(SymbolType.INGREDIENT)
+        # Shared with every controller of this type and cleared by the repository after each write
+        self._cache = get_symbol_cache(SymbolType.INGREDIENT)
 
     # Read Operations
-    def get_all_ingredients(self) -> List[Ingredient]:
+    @safe_repo_call(tuple, "Error retrieving all ingredients")
+    def get_all_ingredients(self) -> Tuple[Ingredient, ...]:
         """Get all ingredients in the system.
+        The result is cached and shared between calls, so it is returned as a tuple.
         
         Returns:
-            List[Ingredient]: List of all available ingredients
+            Tuple[Ingredient, ...]: Immutable tuple of all available ingredients
         """
-        try:
-            return self.repository.get_all()
-        except Exception as e:
-            logger.error(f"Error retrieving all ingredients: {e}")
-            return []
+        ingredients = self._cache.get('all')
+        if ingredients is None:
+            ingredients = tuple(self.repository.get_all())
+            self._cache['all'] = ingredients
+        return ingredients
 
+    @safe_repo_call(None, "Error retrieving ingredient {ingredient_id}")
     def get_ingredient_by_id(self, ingredient_id: int) -> Optional[Ingredient]:
         """Get an ingredient by ID.
         
@@ -43,11 +49,7 @@ class IngredientController:
         Returns:
             Optional[Ingredient]: The ingredient if found, None otherwise
         """
-        try:
-            return self.repository.get_by_id(ingredient_id)
-        except Exception as e:
-            logger.error(f"Error retrieving ingredient {ingredient_id}: {e}")
-            return None
+        return self.repository.get_by_id(ingredient_id)
 
     def get_all_ingredient_identities(self) -> List[str]:
         """Get all ingredient identities.
@@ -74,20 +76,26 @@ class IngredientController:
         return self.repository.get_all_property_values()
 
     # Search Operations
-    def find_ingredients_by_name(self, name: str) -> List[Ingredient]:
+    @safe_repo_call(tuple, "Error searching ingredients by name '{name}'")
+    def find_ingredients_by_name(self, name: str) -> Tuple[Ingredient, ...]:
         """Find ingredients by name.
+        Results are cached briefly per case-insensitive name; blank names match nothing.
         
         Args:
             name (str): Name or partial name to search for
             
         Returns:
-            List[Ingredient]: List of matching ingredients
+            Tuple[Ingredient, ...]: Immutable tuple of matching ingredients
         """
-        try:
-            return self.repository.find_symbols_by_name(name)
-        except Exception as e:
-            logger.error(f"Error searching ingredients by name '{name}': {e}")
-            return []
+        key = name.casefold()
+        if not key.strip():
+            return ()
+        
+        ingredients = self._cache.get(('name', key))
+        if ingredients is None:
+            ingredients = tuple(self.repository.find_symbols_by_name(name))
+            self._cache[('name', key)] = ingredients
+        return ingredients
     
     def find_ingredient_identities_by_name(self, name_pattern: str) -> List[str]:
         """Find ingredient identities by name pattern.
@@ -112,6 +120,7 @@ class IngredientController:
         return self.repository.find_properties_by_name(name_pattern)
 
     # Create/Update/Delete Operations
+    @safe_repo_call(None, "Error creating ingredient")
     def create(self, ingredient: Ingredient) -> Optional[Ingredient]:
         """Add a new ingredient to the system.
         
@@ -121,12 +130,9 @@ class IngredientController:
         Returns:
             Optional[Ingredient]: The added ingredient with ID assigned, or None if failed
         """
-        try:
-            return self.repository.create(ingredient)
-        except Exception as e:
-            logger.error(f"Error creating ingredient: {e}")
-            return None
+        return self.repository.create(ingredient)
 
+    @safe_repo_call(False, "Error updating ingredient")
     def update(self, ingredient: Ingredient) -> bool:
         """Update an existing ingredient.
         
@@ -140,13 +146,10 @@ class IngredientController:
             logger.error("Cannot update ingredient without ID")
             return False
             
-        try:
-            updated = self.repository.update(ingredient)
-            return updated is not None
-        except Exception as e:
-            logger.error(f"Error updating ingredient: {e}")
-            return False
+        updated = self.repository.update(ingredient)
+        return updated is not None
         
+    @safe_repo_call(False, "Error deleting ingredient {ingredient_id}")
     def delete(self, ingredient_id: int) -> bool:
         """Delete an ingredient.
         
@@ -156,8 +159,4 @@ class IngredientController:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        try:
-            return self.repository.delete(ingredient_id)
-        except Exception as e:
-            logger.error(f"Error deleting ingredient {ingredient_id}: {e}")
-            return False
+        return self.repository.delete(ingredient_id)
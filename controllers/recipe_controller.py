@@ -3,13 +3,22 @@ mediates between recipe repositories and domain models.
 """
 
 import logging
+import re
 from typing import List, Dict, Optional, Any, Union
+import bson
 from bson import ObjectId
 
-from repositories.recipe_repository import RecipeRepository
+from repositories.recipe_repository import RecipeRepository, get_recipe_repository, INGREDIENT_NAME_LC_INDEX
+from repositories.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Fields needed to summarize or analyze a recipe without fetching the whole document
+RECIPE_SUMMARY_PROJECTION = {'title': 1, 'ingredients': 1, 'instructions': 1}
+
+# Fields needed to report stored complexity metrics
+RECIPE_COMPLEXITY_PROJECTION = {'title': 1, 'complexity_metrics': 1}
+
 class RecipeController:
     """Mediates between recipe repositories and application logic,
     providing a higher-level interface for recipe-related operations.
@@ -17,8 +26,23 @@ class RecipeController:
     
     def __init__(self):
         """Initialize the recipe controller with required dependencies."""
-        self.recipe_repository = RecipeRepository()
+        self.recipe_repository = get_recipe_repository()
+        self._recipe_cache = TTLCache(maxsize=1024, ttl=60)
+        self._relational_ids = TTLCache(maxsize=1024)
     
+    # Recipe Cache
+    # Recipes are cached as encoded BSON: the bytes are immutable, so neither the caller that
+    # cached a recipe nor any later reader can modify the cached document, and encoding and
+    # decoding run in C instead of walking the document in Python as a deep copy would
+    def _get_cached_recipe(self, key: str) -> Optional[Dict[str, Any]]:
+        """Decode a cached recipe into a new document the caller owns."""
+        encoded = self._recipe_cache.get(key)
+        return bson.decode(encoded) if encoded is not None else None
+
+    def _cache_recipe(self, key: str, recipe: Dict[str, Any]) -> None:
+        """Cache a fetched recipe in encoded form."""
+        self._recipe_cache[key] = bson.encode(recipe)
+
     # Read Operations
     def get_all_recipes(self) -> List[Dict[str, Any]]:
         """Get all recipes in the system.
@@ -26,14 +50,12 @@ class RecipeController:
         Returns:
             List[Dict[str, Any]]: List of all available recipes
         """
-        try:
-            return self.recipe_repository.get_all()
-        except Exception as e:
-            logger.error(f"Error retrieving all recipes: {e}")
-            return []
+        return self.recipe_repository.get_all()
 
     def get_recipe_by_id(self, recipe_id: Union[str, ObjectId]) -> Optional[Dict[str, Any]]:
         """Get a recipe by MongoDB ObjectId.
+        Recently fetched recipes are served from an in-memory LRU cache;
+        each call returns its own copy, which the caller may modify.
         
         Args:
             recipe_id (Union[str, ObjectId]): Recipe ObjectId
@@ -41,11 +63,29 @@ class RecipeController:
         Returns:
             Optional[Dict[str, Any]]: The recipe if found, None otherwise
         """
-        try:
-            return self.recipe_repository.get_by_id(recipe_id)
-        except Exception as e:
-            logger.error(f"Error retrieving recipe {recipe_id}: {e}")
-            return None
+        key = str(recipe_id)
+        recipe = self._get_cached_recipe(key)
+        if recipe is None:
+            recipe = self.recipe_repository.get_by_id(recipe_id)
+            if recipe is not None:
+                self._cache_recipe(key, recipe)
+        return recipe
+
+    def get_recipe_summary(self, recipe_id: Union[str, ObjectId]) -> Optional[Dict[str, Any]]:
+        """Get only the title, ingredients and instructions of a recipe.
+        A cached full recipe is reused; otherwise only those fields are fetched.
+        
+        Args:
+            recipe_id (Union[str, ObjectId]): Recipe ObjectId
+            
+        Returns:
+            Optional[Dict[str, Any]]: The recipe summary if found, None otherwise
+        """
+        recipe = self._get_cached_recipe(str(recipe_id))
+        if recipe is not None:
+            # Match the fields the projection would return (MongoDB includes _id by default)
+            return {field: recipe[field] for field in ('_id', *RECIPE_SUMMARY_PROJECTION) if field in recipe}
+        return self.recipe_repository.get_by_id_projected(recipe_id, RECIPE_SUMMARY_PROJECTION)
 
     def get_recipe_by_relational_id(self, recipe_id: int) -> Optional[Dict[str, Any]]:
         """Get a recipe by its relational database ID.
@@ -56,11 +96,16 @@ class RecipeController:
         Returns:
             Optional[Dict[str, Any]]: The recipe if found, None otherwise
         """
-        try:
-            return self.recipe_repository.get_by_relational_id(recipe_id)
-        except Exception as e:
-            logger.error(f"Error retrieving recipe by relational ID {recipe_id}: {e}")
-            return None
+        object_id = self._relational_ids.get(recipe_id)
+        if object_id is not None:
+            return self.get_recipe_by_id(object_id)
+        
+        recipe = self.recipe_repository.get_by_relational_id(recipe_id)
+        if recipe is not None:
+            object_id = str(recipe['_id'])
+            self._relational_ids[recipe_id] = object_id
+            self._cache_recipe(object_id, recipe)
+        return recipe
 
     # Search Operations
     def find_recipes_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -72,11 +117,7 @@ class RecipeController:
         Returns:
             List[Dict[str, Any]]: List of matching recipes
         """
-        try:
-            return self.recipe_repository.find_by(criteria)
-        except Exception as e:
-            logger.error(f"Error finding recipes by criteria: {e}")
-            return []
+        return self.recipe_repository.find_by(criteria)
 
     def find_recipes_by_relational_criteria(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Find recipes by relational database criteria.
@@ -87,11 +128,7 @@ class RecipeController:
         Returns:
             List[Dict[str, Any]]: List of matching recipe documents
         """
-        try:
-            return self.recipe_repository.find_by_relational_criteria(criteria)
-        except Exception as e:
-            logger.error(f"Error finding recipes by relational criteria: {e}")
-            return []
+        return self.recipe_repository.find_by_relational_criteria(criteria)
         
     def find_recipes_by_title(self, title: str) -> List[Dict[str, Any]]:
         """Find recipes by title.
@@ -102,48 +139,65 @@ class RecipeController:
         Returns:
             List[Dict[str, Any]]: List of matching recipes
         """
-        try:
-            return self.recipe_repository.find_by_name(title)
-        except Exception as e:
-            logger.error(f"Error searching recipes by title '{title}': {e}")
-            return []
+        return self.recipe_repository.find_by_name(title)
 
-    def find_recipes_by_ingredient(self, ingredient_name: str) -> List[Dict[str, Any]]:
+    def find_recipes_by_ingredient(self, ingredient_name: str, limit: int = 0) -> List[Dict[str, Any]]:
         """Find recipes that use a specific ingredient.
+        Searches the text index over ingredient names in a single query, ordered by relevance.
+        
+        The name is matched as a phrase of whole, stemmed words (case-insensitive), not as a substring:
+        "tomatoes" finds "tomato", but "tom" does not find "tomato", and a name made up only of
+        stop words (e.g. "of the") finds nothing. For substring matching use
+        find_recipes_by_ingredient_prefix(ingredient_name, contains=True).
         
         Args:
             ingredient_name (str): Name of the ingredient
+            limit (int, optional): Maximum number of recipes to return, 0 for no limit. Defaults to 0.
             
         Returns:
             List[Dict[str, Any]]: List of matching recipes
         """
-        try:
-            logger.info(f"Searching for recipes with ingredient: '{ingredient_name}'")
+        logger.info("Searching for recipes with ingredient: '%s'", ingredient_name)
+        
+        # Search the name as a phrase; embedded quotes would end the phrase early
+        phrase = ingredient_name.replace('"', ' ').strip()
+        if not phrase:
+            return []
+        
+        # Best matches first; the score is only sorted on, not added to the returned documents
+        pipeline = [
+            {"$match": {"$text": {"$search": f'"{phrase}"', "$caseSensitive": False}}},
+            {"$sort": {"score": {"$meta": "textScore"}}}
+        ]
+        if limit:
+            pipeline.append({"$limit": limit})
+        logger.debug("Using pipeline: %s", pipeline)
+        
+        results = self.recipe_repository.aggregate(pipeline)
+        logger.info("Found %s recipes", len(results))
+        return results
             
-            # Try structured ingredient search first
-            query = {
-                "ingredients.name": {"$regex": f".*{ingredient_name}.*", "$options": "i"}
-            }
-            logger.info(f"Using query: {query}")
-            results = self.recipe_repository.find_by(query)
+    def find_recipes_by_ingredient_prefix(self, ingredient_name: str, contains: bool = False) -> List[Dict[str, Any]]:
+        """Find recipes with an ingredient whose name starts with the given text (case-insensitive).
+        Matches against the lowercase 'ingredients.name_lc' field, so the anchored query can use its index.
+        Ingredients stored as plain strings rather than objects with a 'name' have no 'name_lc' and are
+        never matched; find_recipes_by_ingredient searches them through the text index.
+        
+        Args:
+            ingredient_name (str): Name or name prefix of the ingredient
+            contains (bool, optional): Match the text anywhere in the name instead of only as a prefix;
+                this cannot use the index efficiently. Defaults to False.
             
-            if results:
-                logger.info(f"Found {len(results)} recipes")
-                return results
-                
-            # Fallback to broader search
-            logger.info("No results with first query, trying alternative search")
-            query = {
-                "$or": [
-                    {"ingredients": {"$regex": f".*{ingredient_name}.*", "$options": "i"}},
-                    {"ingredients.name": {"$regex": f".*{ingredient_name}.*", "$options": "i"}}
-                ]
-            }
-            return self.recipe_repository.find_by(query)
-                
-        except Exception as e:
-            logger.error(f"Error searching for recipes with ingredient '{ingredient_name}': {e}")
-            return []
+        Returns:
+            List[Dict[str, Any]]: List of matching recipes
+        """
+        pattern = re.escape(ingredient_name.lower())
+        if contains:
+            return self.recipe_repository.find_by({"ingredients.name_lc": {"$regex": pattern}})
+        return self.recipe_repository.find_by(
+            {"ingredients.name_lc": {"$regex": f"^{pattern}"}},
+            hint=INGREDIENT_NAME_LC_INDEX
+        )
             
     # Create/Update/Delete Operations
     def create(self, recipe_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -158,7 +212,7 @@ class RecipeController:
         try:
             return self.recipe_repository.create(recipe_data)
         except Exception as e:
-            logger.error(f"Error creating recipe: {e}")
+            logger.error("Error creating recipe: %s", e)
             return None
         
     def update(self, recipe_data: Dict[str, Any]) -> bool:
@@ -178,8 +232,48 @@ class RecipeController:
             updated = self.recipe_repository.update(recipe_data)
             return updated is not None
         except Exception as e:
-            logger.error(f"Error updating recipe: {e}")
+            logger.error("Error updating recipe: %s", e)
             return False
+        finally:
+            # After the write, so a concurrent read cannot re-cache the old document
+            self._recipe_cache.pop(str(recipe_data['_id']))
+        
+    def create_many(self, recipes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several recipes in both MongoDB and MariaDB with bulk writes.
+        
+        Args:
+            recipes (List[Dict[str, Any]]): Recipe data
+            
+        Returns:
+            List[Dict[str, Any]]: The created recipes with IDs assigned, empty if failed
+        """
+        try:
+            return self.recipe_repository.create_many(recipes)
+        except Exception as e:
+            logger.error("Error creating recipes: %s", e)
+            return []
+
+    def update_many(self, recipes: List[Dict[str, Any]]) -> int:
+        """Update several existing recipes in both MongoDB and MariaDB with bulk writes.
+        
+        Args:
+            recipes (List[Dict[str, Any]]): Recipe data, each with an _id field
+            
+        Returns:
+            int: Number of recipes modified
+        """
+        if any('_id' not in recipe for recipe in recipes):
+            logger.error("Cannot update recipe without MongoDB _id")
+            return 0
+            
+        try:
+            return self.recipe_repository.update_many(recipes)
+        except Exception as e:
+            logger.error("Error updating recipes: %s", e)
+            return 0
+        finally:
+            for recipe in recipes:
+                self._recipe_cache.pop(str(recipe['_id']))
         
     def delete(self, recipe_id: Union[str, ObjectId]) -> bool:
         """Delete a recipe from both MongoDB and MariaDB.
@@ -193,8 +287,10 @@ class RecipeController:
         try:
             return self.recipe_repository.delete(recipe_id)
         except Exception as e:
-            logger.error(f"Error deleting recipe {recipe_id}: {e}")
+            logger.error("Error deleting recipe %s: %s", recipe_id, e)
             return False
+        finally:
+            self._recipe_cache.pop(str(recipe_id))
 
     def delete_by_relational_id(self, recipe_id: int) -> bool:
         """Delete a recipe by its relational database ID.
@@ -208,8 +304,12 @@ class RecipeController:
         try:
             return self.recipe_repository.delete_by_relational_id(recipe_id)
         except Exception as e:
-            logger.error(f"Error deleting recipe by relational ID {recipe_id}: {e}")
+            logger.error("Error deleting recipe by relational ID %s: %s", recipe_id, e)
             return False
+        finally:
+            object_id = self._relational_ids.pop(recipe_id)
+            if object_id is not None:
+                self._recipe_cache.pop(object_id)
     
     # Metadata Operations
     def get_relational_metadata(self, recipe_id: Union[str, ObjectId]) -> Optional[Dict[str, Any]]:
@@ -224,7 +324,7 @@ class RecipeController:
         try:
             return self.recipe_repository.get_relational_metadata(recipe_id)
         except Exception as e:
-            logger.error(f"Error getting relational metadata for {recipe_id}: {e}")
+            logger.error("Error getting relational metadata for %s: %s", recipe_id, e)
             return None
 
     def sync_metadata_to_relational(self, recipe_data: Dict[str, Any]) -> bool:
@@ -239,8 +339,11 @@ class RecipeController:
         try:
             return self.recipe_repository.sync_metadata_to_relational(recipe_data)
         except Exception as e:
-            logger.error(f"Error syncing metadata to relational: {e}")
+            logger.error("Error syncing metadata to relational: %s", e)
             return False
+        finally:
+            if '_id' in recipe_data:
+                self._recipe_cache.pop(str(recipe_data['_id']))
     
     # Analysis Methods
     def analyze_recipe_complexity(self, recipe_id: Union[str, ObjectId]) -> Optional[Dict[str, Any]]:
@@ -254,39 +357,22 @@ class RecipeController:
             Optional[Dict[str, Any]]: Complexity analysis results, or None if recipe not found
         """
         try:
-            recipe = self.get_recipe_by_id(recipe_id)
+            recipe = self.recipe_repository.get_by_id_projected(recipe_id, RECIPE_COMPLEXITY_PROJECTION)
+            if recipe and 'complexity_metrics' not in recipe:
+                # Recipes stored before metrics were precomputed fall back to computing them here
+                recipe = self.get_recipe_summary(recipe_id)
             if not recipe:
-                logger.warning(f"Recipe with ID {recipe_id} not found for complexity analysis")
+                logger.warning("Recipe with ID %s not found for complexity analysis", recipe_id)
                 return None
-                
-            ingredient_count = len(recipe.get('ingredients', []))
-            
-            # Count steps by analyzing instructions
-            instructions = recipe.get('instructions', '')
-            if isinstance(instructions, str):
-                # Split by newlines or periods to estimate steps
-                steps = [s.strip() for s in instructions.replace('\n', '.').split('.') if s.strip()]
-            elif isinstance(instructions, list):
-                steps = instructions
-            else:
-                steps = []
-                
-            step_count = len(steps)
-            
-            # Calculate complexity score: 0.6 * ingredient_count + 0.4 * step_count
-            complexity_score = 0.6 * ingredient_count + 0.4 * step_count
             
+            metrics = recipe.get('complexity_metrics') or RecipeRepository.compute_complexity_metrics(recipe)
             return {
                 'recipe_id': str(recipe_id),
                 'title': recipe.get('title', 'Untitled'),
-                'complexity_metrics': {
-                    'ingredient_count': ingredient_count,
-                    'step_count': step_count,
-                    'complexity_score': round(complexity_score, 1)
-                }
+                'complexity_metrics': metrics
             }
         except Exception as e:
-            logger.error(f"Error analyzing recipe complexity for {recipe_id}: {e}")
+            logger.error("Error analyzing recipe complexity for %s: %s", recipe_id, e)
             return None
         
     def export_recipe_as_json(self, recipe_id: Union[str, ObjectId]) -> Optional[str]:
@@ -301,8 +387,23 @@ class RecipeController:
         try:
             return self.recipe_repository.serialize(recipe_id)
         except ValueError as e:
-            logger.warning(f"Recipe not found for export: {e}")
+            logger.warning("Recipe not found for export: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error exporting recipe {recipe_id}: {e}")
+            logger.error("Error exporting recipe %s: %s", recipe_id, e)
+            return None
+
+    def export_recipes_as_json(self, recipe_ids: List[Union[str, ObjectId]]) -> Optional[str]:
+        """Export several recipes as a single JSON array string.
+        
+        Args:
+            recipe_ids (List[Union[str, ObjectId]]): Recipe IDs
+            
+        Returns:
+            str: JSON array of the found recipes, or None if the export failed
+        """
+        try:
+            return self.recipe_repository.serialize_many(recipe_ids)
+        except Exception as e:
+            logger.error("Error exporting recipes %s: %s", recipe_ids, e)
             return None
@@ -3,10 +3,10 @@ and conversion between database records and domain models.
 """
 
 import logging
-from typing import List, Optional, TypeVar, Generic, Type
+from typing import List, Optional, TypeVar, Generic, Type, Sequence, Dict
 
 from models.symbol import Symbol, SymbolType
-from repositories.symbol_repository import SymbolRepository
+from repositories.symbol_repository import get_symbol_repository, get_symbol_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +25,11 @@ class SymbolController(Generic[S]):
             symbol_class (Type[S], optional): The symbol class this controller manages. Defaults to None.
             symbol_type (SymbolType, optional): The type of symbols this controller manages. Defaults to None.
         """
-        self.repository = SymbolRepository()
+        self.repository = get_symbol_repository()
         self.symbol_class = symbol_class
         self.symbol_type = symbol_type
+        # Shared by all symbol controllers and cleared by the repository after each write
+        self._symbol_cache = get_symbol_cache()
 
     # Read Operations
     def get_all_symbols(self) -> List[Symbol]:
@@ -36,14 +38,13 @@ class SymbolController(Generic[S]):
         Returns:
             List[Symbol]: List of all Symbol instances across all types
         """
-        try:
-            return self.repository.get_all()
-        except Exception as e:
-            logger.error(f"Error retrieving all symbols: {e}")
-            return []
+        return self.repository.get_all()
 
     def get_symbol_by_id(self, symbol_id: int) -> Optional[Symbol]:
         """Retrieve a specific symbol by its database ID.
+        Recently retrieved symbols are served from a short-lived cache. The returned symbol is the
+        cached instance shared with other callers and must not be modified in place; to change it,
+        build a new Symbol with the same entity_id and pass it to update_symbol.
         
         Args:
             symbol_id (int): ID of the symbol to retrieve
@@ -51,11 +52,39 @@ class SymbolController(Generic[S]):
         Returns:
             Optional[Symbol]: The symbol if found, None otherwise
         """
-        try:
-            return self.repository.get_by_id(symbol_id)
-        except Exception as e:
-            logger.error(f"Error retrieving symbol {symbol_id}: {e}")
-            return None
+        symbol = self._symbol_cache.get(('id', symbol_id))
+        if symbol is None:
+            symbol = self.repository.get_by_id(symbol_id)
+            if symbol is not None:
+                self._symbol_cache[('id', symbol_id)] = symbol
+        return symbol
+
+    def get_symbols_by_ids(self, symbol_ids: Sequence[int]) -> Dict[int, Symbol]:
+        """Retrieve several symbols by their database IDs.
+        Cached symbols are reused and the rest are fetched together instead of one query per ID.
+        As with get_symbol_by_id, the returned symbols are shared and must not be modified.
+        
+        Args:
+            symbol_ids (Sequence[int]): IDs of the symbols to retrieve
+            
+        Returns:
+            Dict[int, Symbol]: Found symbols keyed by ID; missing IDs are omitted
+        """
+        symbols = {}
+        missing = []
+        for symbol_id in symbol_ids:
+            symbol = self._symbol_cache.get(('id', symbol_id))
+            if symbol is None:
+                missing.append(symbol_id)
+            else:
+                symbols[symbol_id] = symbol
+        
+        if missing:
+            fetched = self.repository.get_by_ids(missing)
+            for symbol_id, symbol in fetched.items():
+                self._symbol_cache[('id', symbol_id)] = symbol
+            symbols.update(fetched)
+        return symbols
     
     # Search Operations
     def find_symbols_by_name(self, name: str) -> List[Symbol]:
@@ -67,11 +96,7 @@ class SymbolController(Generic[S]):
         Returns:
             List[Symbol]: List of matching symbols
         """
-        try:
-            return self.repository.find_symbols_by_name(name)
-        except Exception as e:
-            logger.error(f"Error searching symbols by name '{name}': {e}")
-            return []
+        return self.repository.find_symbols_by_name(name)
 
     # Create/Update/Delete Operations
     def create_symbol(self, symbol: Symbol) -> Optional[Symbol]:
@@ -86,7 +111,7 @@ class SymbolController(Generic[S]):
         try:
             return self.repository.create(symbol)
         except Exception as e:
-            logger.error(f"Error creating symbol: {e}")
+            logger.error("Error creating symbol: %s", e)
             return None
         
     def update_symbol(self, symbol: Symbol) -> bool:
@@ -102,7 +127,7 @@ class SymbolController(Generic[S]):
             updated = self.repository.update(symbol)
             return updated is not None
         except Exception as e:
-            logger.error(f"Error updating symbol: {e}")
+            logger.error("Error updating symbol: %s", e)
             return False
         
     def delete_symbol(self, symbol_id: int) -> bool:
@@ -117,5 +142,5 @@ class SymbolController(Generic[S]):
         try:
             return self.repository.delete(symbol_id)
         except Exception as e:
-            logger.error(f"Error deleting symbol {symbol_id}: {e}")
+            logger.error("Error deleting symbol %s: %s", symbol_id, e)
             return False
\ No newline at end of file
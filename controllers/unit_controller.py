@@ -3,14 +3,18 @@ mediates between unit repositories and domain models.
 """
 
 import logging
-from typing import List, Optional, Dict
+from collections import defaultdict
+from types import MappingProxyType
+from typing import List, Optional, Dict, Mapping, Tuple
 
 from models.symbol import SymbolType
 from models.measurement import Unit
-from repositories.symbol_repository import SymbolRepository
+from repositories.symbol_repository import get_symbol_repository, get_symbol_cache
 
 logger = logging.getLogger(__name__)
 
+COMMON_MEASUREMENT_TYPES = ("VOLUME", "MASS", "TEMPERATURE", "TIME")
+
 
 class UnitController:
     """Mediates between unit repositories and domain models,
@@ -19,7 +23,9 @@ class UnitController:
     
     def __init__(self):
         """Initialize the unit controller with required dependencies."""
-        self.repository = SymbolRepository(SymbolType.UNIT)
+        self.repository = get_symbol_repository(SymbolType.UNIT)
+        # Shared with every unit controller and cleared by the repository after each write
+        self._meta_cache = get_symbol_cache(SymbolType.UNIT)
 
     # Read Operations
     def get_all_units(self) -> List[Unit]:
@@ -28,11 +34,7 @@ class UnitController:
         Returns:
             List[Unit]: List of all available units
         """
-        try:
-            return self.repository.get_all()
-        except Exception as e:
-            logger.error(f"Error retrieving all units: {e}")
-            return []
+        return self.repository.get_all()
 
     def get_unit_by_id(self, unit_id: int) -> Optional[Unit]:
         """Get a unit by ID.
@@ -43,35 +45,55 @@ class UnitController:
         Returns:
             Optional[Unit]: The unit if found, None otherwise
         """
-        try:
-            return self.repository.get_by_id(unit_id)
-        except Exception as e:
-            logger.error(f"Error retrieving unit {unit_id}: {e}")
-            return None
+        return self.repository.get_by_id(unit_id)
 
-    def get_all_unit_identities(self) -> List[str]:
+    def get_all_unit_identities(self) -> Tuple[str, ...]:
         """Get all unit identities.
+        The result is cached briefly and shared between calls, so it is returned as a tuple.
+        An empty result (also returned when the query fails) is not cached.
         
         Returns:
-            List[str]: List of all unit identity names
+            Tuple[str, ...]: Immutable tuple of all unit identity names
         """
-        return self.repository.get_all_identities()
+        identities = self._meta_cache.get('identities')
+        if identities is None:
+            identities = tuple(self.repository.get_all_identities())
+            if identities:
+                self._meta_cache['identities'] = identities
+        return identities
     
-    def get_all_unit_properties(self) -> List[str]:
+    def get_all_unit_properties(self) -> Tuple[str, ...]:
         """Get all unit property keys.
+        The result is cached briefly and shared between calls, so it is returned as a tuple.
+        An empty result (also returned when the query fails) is not cached.
         
         Returns:
-            List[str]: List of all unit property keys
+            Tuple[str, ...]: Immutable tuple of all unit property keys
         """
-        return self.repository.get_all_properties()
+        properties = self._meta_cache.get('properties')
+        if properties is None:
+            properties = tuple(self.repository.get_all_properties())
+            if properties:
+                self._meta_cache['properties'] = properties
+        return properties
 
-    def get_all_unit_property_values(self) -> Dict[str, List[str]]:
+    def get_all_unit_property_values(self) -> Dict[str, Tuple[str, ...]]:
         """Get all unit property keys and their values.
+        The result is cached briefly and shared between calls, so values are returned as tuples.
+        An empty result (also returned when the query fails) is not cached.
         
         Returns:
-            Dict[str, List[str]]: Dictionary with property keys as keys and list of values as values
+            Dict[str, Tuple[str, ...]]: Dictionary with property keys as keys and tuple of values as values
         """
-        return self.repository.get_all_property_values()
+        property_values = self._meta_cache.get('property_values')
+        if property_values is None:
+            property_values = {
+                key: tuple(values)
+                for key, values in self.repository.get_all_property_values().items()
+            }
+            if property_values:
+                self._meta_cache['property_values'] = property_values
+        return property_values
 
     # Search Operations
     def find_units_by_name(self, name: str) -> List[Unit]:
@@ -83,11 +105,7 @@ class UnitController:
         Returns:
             List[Unit]: List of matching units
         """
-        try:
-            return self.repository.find_symbols_by_name(name)
-        except Exception as e:
-            logger.error(f"Error searching units by name '{name}': {e}")
-            return []
+        return self.repository.find_symbols_by_name(name)
 
     def find_units_by_identity(self, identity: str) -> List[Unit]:
         """Find units by their hierarchical identity.
@@ -98,11 +116,7 @@ class UnitController:
         Returns:
             List[Unit]: List of units with the specified identity
         """
-        try:
-            return self.repository.find_identities_by_name(identity)
-        except Exception as e:
-            logger.error(f"Error searching units by identity '{identity}': {e}")
-            return []
+        return self.repository.find_by_identities([identity]).get(identity, [])
     
     def find_unit_identities_by_name(self, name_pattern: str) -> List[str]:
         """Find unit identities by name pattern.
@@ -139,7 +153,7 @@ class UnitController:
         try:
             return self.repository.create(unit)
         except Exception as e:
-            logger.error(f"Error creating unit: {e}")
+            logger.error("Error creating unit: %s", e)
             return None
 
     def update(self, unit: Unit) -> bool:
@@ -159,7 +173,7 @@ class UnitController:
             updated = self.repository.update(unit)
             return updated is not None
         except Exception as e:
-            logger.error(f"Error updating unit: {e}")
+            logger.error("Error updating unit: %s", e)
             return False
         
     def delete(self, unit_id: int) -> bool:
@@ -174,7 +188,7 @@ class UnitController:
         try:
             return self.repository.delete(unit_id)
         except Exception as e:
-            logger.error(f"Error deleting unit {unit_id}: {e}")
+            logger.error("Error deleting unit %s: %s", unit_id, e)
             return False
 
     # Analysis and Categorization Methods
@@ -185,53 +199,68 @@ class UnitController:
             dict: Dictionary with measurement type as key and list of units as value
         """
         try:
-            all_units = self.get_all_units()
-            type_groups = {}
+            type_groups = defaultdict(list)
             
-            for unit in all_units:
+            # Stream units in batches rather than materializing the full list first
+            for unit in self.repository.iter_all():
                 # Group by primary identity (first one alphabetically if multiple)
-                primary_identity = min(unit.identities) if unit.identities else "UNKNOWN"
-                
-                if primary_identity not in type_groups:
-                    type_groups[primary_identity] = []
-                type_groups[primary_identity].append(unit)
+                type_groups[unit.primary_identity or "UNKNOWN"].append(unit)
             
-            return type_groups
+            return dict(type_groups)
         except Exception as e:
-            logger.error(f"Error grouping units by measurement type: {e}")
+            logger.error("Error grouping units by measurement type: %s", e)
             return {}
 
-    def get_volume_units(self) -> List[Unit]:
+    def get_common_measurement_units(self) -> Mapping[str, Tuple[Unit, ...]]:
+        """Get volume, mass, temperature and time units, fetched together in one query.
+        The result is cached briefly and shared between calls, so it is returned
+        as a read-only mapping of tuples. A result without any units (also returned when the
+        query fails) is not cached.
+        
+        Returns:
+            Mapping[str, Tuple[Unit, ...]]: Read-only mapping with measurement type as key and tuple of units as value
+        """
+        common_units = self._meta_cache.get('common_units')
+        if common_units is None:
+            common_units = MappingProxyType({
+                identity: tuple(units)
+                for identity, units in self.repository.find_by_identities(list(COMMON_MEASUREMENT_TYPES)).items()
+            })
+            if any(common_units.values()):
+                self._meta_cache['common_units'] = common_units
+        return common_units
+
+    def get_volume_units(self) -> Tuple[Unit, ...]:
         """Get all volume measurement units.
         
         Returns:
-            List[Unit]: List of volume units
+            Tuple[Unit, ...]: Immutable tuple of volume units
         """
-        return self.find_units_by_identity("VOLUME")
+        return self.get_common_measurement_units()["VOLUME"]
 
-    def get_mass_units(self) -> List[Unit]:
+    def get_mass_units(self) -> Tuple[Unit, ...]:
         """Get all mass/weight measurement units.
         
         Returns:
-            List[Unit]: List of mass units
+            Tuple[Unit, ...]: Immutable tuple of mass units
         """
-        return self.find_units_by_identity("MASS")
+        return self.get_common_measurement_units()["MASS"]
 
-    def get_temperature_units(self) -> List[Unit]:
+    def get_temperature_units(self) -> Tuple[Unit, ...]:
         """Get all temperature measurement units.
         
         Returns:
-            List[Unit]: List of temperature units
+            Tuple[Unit, ...]: Immutable tuple of temperature units
         """
-        return self.find_units_by_identity("TEMPERATURE")
+        return self.get_common_measurement_units()["TEMPERATURE"]
 
-    def get_time_units(self) -> List[Unit]:
+    def get_time_units(self) -> Tuple[Unit, ...]:
         """Get all time measurement units.
         
         Returns:
-            List[Unit]: List of time units
+            Tuple[Unit, ...]: Immutable tuple of time units
         """
-        return self.find_units_by_identity("TIME")
+        return self.get_common_measurement_units()["TIME"]
 
     def get_unit_statistics(self) -> dict:
         """Get statistics about units in the system.
@@ -240,22 +269,17 @@ class UnitController:
             dict: Dictionary containing unit statistics
         """
         try:
-            all_units = self.get_all_units()
-            total_count = len(all_units)
-            
-            identity_counts = {}
-            for unit in all_units:
-                for identity in unit.identities:
-                    identity_counts[identity] = identity_counts.get(identity, 0) + 1
-            
+            # Counts are grouped in SQL rather than by materializing every unit
+            identity_counts = self.repository.count_by_identity()
+
             return {
-                'total_units': total_count,
+                'total_units': self.repository.count_symbols(),
                 'identity_distribution': identity_counts,
                 'most_common_identity': max(identity_counts, key=identity_counts.get) if identity_counts else None,
-                'units_without_identity': sum(1 for unit in all_units if not unit.identities)
+                'units_without_identity': self.repository.count_symbols(without_identity=True)
             }
         except Exception as e:
-            logger.error(f"Error getting unit statistics: {e}")
+            logger.error("Error getting unit statistics: %s", e)
             return {}
 
     def validate_unit_for_measurement_type(self, unit: Unit, expected_identity: str) -> bool:
@@ -271,5 +295,5 @@ class UnitController:
         try:
             return expected_identity in unit.identities
         except Exception as e:
-            logger.error(f"Error validating unit {unit.name} for identity {expected_identity}: {e}")
+            logger.error("Error validating unit %s for identity %s: %s", unit.name, expected_identity, e)
             return False
@@ -26,6 +26,42 @@ catch (e) {
     quit(1)
 }
 
+// Create the text index used for ingredient searches
+try {
+    db[collectionName].createIndex(
+        { "ingredients.name": "text", "ingredients": "text" },
+        { name: "ingredients_text" }
+    );
+    print(`Created ingredient text index on ${collectionName}`);
+}
+catch (e) {
+    printerr(`ERROR: ingredient text index could not be created: ${e}`);
+}
+
+// Create the index used for case-insensitive ingredient name prefix searches
+try {
+    db[collectionName].createIndex(
+        { "ingredients.name_lc": 1 },
+        { name: "ingredients.name_lc_1" }
+    );
+    print(`Created ingredient name index on ${collectionName}`);
+}
+catch (e) {
+    printerr(`ERROR: ingredient name index could not be created: ${e}`);
+}
+
+// Create the index used to sort and filter recipes by complexity
+try {
+    db[collectionName].createIndex(
+        { "complexity_metrics.complexity_score": 1 },
+        { name: "complexity_metrics.complexity_score_1" }
+    );
+    print(`Created complexity score index on ${collectionName}`);
+}
+catch (e) {
+    printerr(`ERROR: complexity score index could not be created: ${e}`);
+}
+
 // Import data from JSON project files
 print(`Importing all files from ${dataDir} as JSON objects`)
 try {
@@ -36,6 +72,15 @@ try {
         try {
             const fileContent = fs.readFileSync(filePath, 'utf8');
             const recipeData = JSON.parse(fileContent);
+            // Store a lowercase copy of each ingredient name for prefix searches,
+            // as RecipeRepository does when it creates or updates a recipe
+            if (Array.isArray(recipeData.ingredients)) {
+                recipeData.ingredients.forEach(ingredient => {
+                    if (ingredient && typeof ingredient === 'object' && typeof ingredient.name === 'string') {
+                        ingredient.name_lc = ingredient.name.toLowerCase();
+                    }
+                });
+            }
             db[collectionName].insertOne(recipeData);
         }
         catch (e) {
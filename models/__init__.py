@@ -4,7 +4,7 @@ ingredients, equipment, actions, and their relationships.
 
 from .symbol import SymbolType, Symbol
 from .instruction import ActionArity, Action, IngredientUsage, EquipmentUsage, Instruction
-from .recipe import Recipe
+from .recipe import Recipe, InstructionColumns
 from .item import Item
 from .ingredient import Ingredient, IntermediateIngredient
 from .equipment import Equipment, IntermediateEquipment
@@ -16,7 +16,7 @@ from .dimensions import Dimensions, DimensionsAbs, DimensionsRel
 __all__ = [
     'SymbolType', 'Symbol',
     'ActionArity', 'Action', 'IngredientUsage', 'EquipmentUsage', 'Instruction',
-    'Recipe',
+    'Recipe', 'InstructionColumns',
     'Item', 'Ingredient', 'IntermediateIngredient', 'Equipment', 'IntermediateEquipment',
     'Unit', 'Measurement', 'MeasurementAbs', 'MeasurementRel',
     'Temperature', 'TemperatureAbs', 'TemperatureRel',
@@ -2,41 +2,44 @@
 supporting both absolute and relative dimensions with appropriate units.
 """
 
-from typing import List
+from array import array
+from typing import Iterable
 
 from models.measurement import Unit, Quantification
 
 
 class Dimensions(Quantification):
     """Abstract base class for dimensional measurements."""
-    pass
+    __slots__ = ()
 
 
 class DimensionsAbs(Dimensions):
     """Absolute dimensions with exact values."""
+    __slots__ = ('values',)
     
-    def __init__(self, values: List[float], unit: Unit):
+    def __init__(self, values: Iterable[float], unit: Unit):
         """Initialize a DimensionsAbs instance.
         
         Args:
-            values: List of dimension values (1-3 values for 1D, 2D, or 3D)
+            values: Dimension values (1-3 values for 1D, 2D, or 3D), stored as a packed float64 array
             unit: Length unit
         """
         super().__init__(unit)
-        self.values = values
+        self.values = array('d', values)
 
 
 class DimensionsRel(Dimensions):
     """Relative dimensions with min/max ranges."""
+    __slots__ = ('values_min', 'values_max')
     
-    def __init__(self, values_min: List[float], values_max: List[float], unit: Unit):
+    def __init__(self, values_min: Iterable[float], values_max: Iterable[float], unit: Unit):
         """Initialize a DimensionsRel instance.
         
         Args:
-            values_min: List of minimum dimension values
-            values_max: List of maximum dimension values
+            values_min: Minimum dimension values, stored as a packed float64 array
+            values_max: Maximum dimension values, stored as a packed float64 array
             unit: Length unit
         """
         super().__init__(unit)
-        self.values_min = values_min
-        self.values_max = values_max
+        self.values_min = array('d', values_min)
+        self.values_max = array('d', values_max)
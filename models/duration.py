@@ -7,11 +7,12 @@ from models.measurement import Unit, Quantification
 
 class Duration(Quantification):
     """Abstract base class for duration measurements."""
-    pass
+    __slots__ = ()
 
 
 class DurationAbs(Duration):
     """Absolute duration with exact value."""
+    __slots__ = ('value',)
     
     def __init__(self, value: float, unit: Unit):
         """Initialize a DurationAbs instance.
@@ -26,6 +27,7 @@ class DurationAbs(Duration):
 
 class DurationRel(Duration):
     """Relative duration with min/max range."""
+    __slots__ = ('value_min', 'value_max')
     
     def __init__(self, value_min: float, value_max: float, unit: Unit):
         """Initialize a DurationRel instance.
@@ -2,11 +2,16 @@
 includes hierarchical organization and categorization.
 """
 
+from itertools import chain
+from weakref import ref
 from typing import Optional, Set, Any, List
 
 from .item import Item
 from .ingredient import Ingredient, IntermediateIngredient
-from .symbol import SymbolType
+from .symbol import SymbolType, Symbol
+
+# Shared by every instance whose set is still empty, so unused sets are not allocated per instance
+_EMPTY_SET: frozenset = frozenset()
 
 
 class Equipment(Item):
@@ -14,6 +19,8 @@ class Equipment(Item):
     equipment items are tools or devices used in food preparation,
     with support for hierarchical organization (e.g., cookware > pots > stockpot)
     """
+    __slots__ = ('contents', '_is_vessel')
+
     def __init__(self,
                  name: str,
                  contents: Optional[Set[Any]] = None,
@@ -30,16 +37,50 @@ class Equipment(Item):
             type=SymbolType.EQUIPMENT,
             **kwargs
         )
-        self.contents = contents or set()
+        self.contents = contents if contents else _EMPTY_SET
+
+    @Symbol.identities.setter
+    def identities(self, value: Set[str]) -> None:
+        """Set the hierarchical identities of the equipment and refresh the cached vessel flag.
+
+        Args:
+            value (Set[str]): The new identity strings
+        """
+        Symbol.identities.fset(self, value)
+        self._is_vessel = "VESSEL" in self.identities
 
     # Predicate Methods
     def is_vessel(self) -> bool:
         """Check if this equipment is a vessel that can store ingredients.
+        The answer is cached and refreshed whenever the identities change through the symbol API.
 
         Returns:
             bool: True if equipment has VESSEL identity (or parent chain resolving to VESSEL)
         """
-        return "VESSEL" in self.identities
+        return self._is_vessel
+
+    # Mutator Methods
+    def add_identity(self, identity: str) -> None:
+        """Add a hierarchical identity to this equipment.
+        
+        Args:
+            identity (str): Hierarchical identity string to add
+        """
+        super().add_identity(identity)
+        self._is_vessel = "VESSEL" in self.identities
+
+    def remove_identity(self, identity: str) -> bool:
+        """Remove a hierarchical identity from this equipment.
+        
+        Args:
+            identity (str): Identity to remove
+            
+        Returns:
+            bool: True if the identity was removed, False if it wasn't found
+        """
+        removed = super().remove_identity(identity)
+        self._is_vessel = "VESSEL" in self.identities
+        return removed
 
     # Vessel Methods
     def get_contents(self) -> List[Any]:
@@ -66,7 +107,10 @@ class Equipment(Item):
         """
         if not self.is_vessel():
             raise ValueError(f"Equipment '{self.name}' is not a vessel and cannot store ingredients")
-        self.contents.add(ingredient)
+        if self.contents:
+            self.contents.add(ingredient)
+        else:
+            self.contents = {ingredient}
 
     def combine_contents(self) -> None:
         """Combine all contents into one IntermediateIngredient
@@ -80,25 +124,21 @@ class Equipment(Item):
         if not self.contents:
             raise ValueError(f"Vessel '{self.name}' has no contents to combine")
         
-        combined_identities = set()
-        combined_properties = {}
-        
-        for item in self.contents:
-            combined_identities.update(item.identities)
-            combined_properties.update(item.properties)
+        combined_identities = set().union(*(item.identities for item in self.contents))
+        combined_properties = dict(chain.from_iterable(item.properties.items() for item in self.contents))
 
         name = "mixture"
 
+        # The vessel's contents set is replaced below, so it is handed over rather than copied
         combined = IntermediateIngredient(
             name=name,
-            source_ingredients=self.contents.copy(),
+            source_ingredients=self.contents,
             vessel=self,
             identities=combined_identities,
             properties=combined_properties
         )
 
-        self.contents.clear()
-        self.contents.add(combined)
+        self.contents = {combined}
 
     def empty_contents(self) -> None:
         """Empty and return all ingredients from this equipment.
@@ -108,7 +148,7 @@ class Equipment(Item):
         """
         if not self.is_vessel():
             raise ValueError(f"Equipment '{self.name}' is not a vessel and cannot empty its contents")
-        self.contents.clear()
+        self.contents = _EMPTY_SET
 
     # String Representations
     def __str__(self) -> str:
@@ -136,10 +176,14 @@ class IntermediateEquipment(Equipment):
     """Represents equipment produced or modified by an instruction.
 
     Attributes:
-        produced_by: Instruction that produces/modifies this equipment.
+        produced_by: Instruction that produces/modifies this equipment (held weakly, since the
+            instruction refers back to this equipment through produces).
         source_equipment: Source equipment used to produce this.
         source_ingredients: Source ingredients used in the modification (if any).
     """
+    __slots__ = ('_produced_by', 'source_equipment', 'source_ingredients')
+    is_intermediate = True
+
     def __init__(self,
                  name: str,
                  produced_by: Optional[Any] = None,
@@ -157,8 +201,19 @@ class IntermediateEquipment(Equipment):
         """
         super().__init__(name=name, **kwargs)
         self.produced_by = produced_by
-        self.source_equipment = source_equipment or set()
-        self.source_ingredients = source_ingredients or set()
+        self.source_equipment = source_equipment if source_equipment else _EMPTY_SET
+        self.source_ingredients = source_ingredients if source_ingredients else _EMPTY_SET
+
+    # Properties
+    @property
+    def produced_by(self) -> Optional[Any]:
+        """Get the instruction that produces/modifies this equipment, or None if it no longer exists."""
+        return self._produced_by() if self._produced_by is not None else None
+
+    @produced_by.setter
+    def produced_by(self, value: Optional[Any]) -> None:
+        """Set the producing instruction, held by weak reference."""
+        self._produced_by = ref(value) if value is not None else None
 
     # Mutator Methods
     def add_source_equipment(self, equipment: Equipment) -> None:
@@ -167,7 +222,10 @@ class IntermediateEquipment(Equipment):
         Args:
             equipment (Equipment): Equipment instance to add as a source
         """
-        self.source_equipment.add(equipment)
+        if self.source_equipment:
+            self.source_equipment.add(equipment)
+        else:
+            self.source_equipment = {equipment}
     
     def remove_source_equipment(self, equipment: Equipment) -> None:
         """Remove source equipment.
@@ -175,7 +233,8 @@ class IntermediateEquipment(Equipment):
         Args:
             equipment (Equipment): Equipment instance to remove from sources
         """
-        self.source_equipment.discard(equipment)
+        if self.source_equipment:
+            self.source_equipment.discard(equipment)
     
     def add_source_ingredient(self, ingredient: Ingredient) -> None:
         """Add a source ingredient used in equipment modification.
@@ -183,7 +242,10 @@ class IntermediateEquipment(Equipment):
         Args:
             ingredient (Ingredient): Ingredient instance to add as a source
         """
-        self.source_ingredients.add(ingredient)
+        if self.source_ingredients:
+            self.source_ingredients.add(ingredient)
+        else:
+            self.source_ingredients = {ingredient}
     
     def remove_source_ingredient(self, ingredient: Ingredient) -> None:
         """Remove a source ingredient.
@@ -191,7 +253,8 @@ class IntermediateEquipment(Equipment):
         Args:
             ingredient (Ingredient): Ingredient instance to remove from sources.
         """
-        self.source_ingredients.discard(ingredient)
+        if self.source_ingredients:
+            self.source_ingredients.discard(ingredient)
 
     # String Representations
     def __str__(self) -> str:
@@ -213,7 +276,7 @@ class IntermediateEquipment(Equipment):
         """
         produced_by_info = f"instruction_{self.produced_by.instruction_id}" if self.produced_by else None
         return (f"IntermediateEquipment(name='{self.name}', "
-                f"type={self.type.value}, "
+                f"type={self.type.name.lower()}, "
                 f"produced_by={produced_by_info}, "
                 f"source_equipment={len(self.source_equipment)}, "
                 f"source_ingredients={len(self.source_ingredients)}, "
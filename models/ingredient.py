@@ -3,16 +3,22 @@ includes hierarchical organization and categorization.
 """
 
 from typing import Optional, Set, Any
+from weakref import ref
 
 from .item import Item
 from .symbol import SymbolType
 
+# Shared by every instance whose set is still empty, so unused sets are not allocated per instance
+_EMPTY_SET: frozenset = frozenset()
+
 
 class Ingredient(Item):
     """Domain model representing an ingredient in recipe analysis,
     ingredients are foods or substances used in recipes, with support
     for hierarchical organization (e.g., vegetables > leafy greens > spinach)
     """
+    __slots__ = ()
+
     def __init__(self, name: str, **kwargs):
         """Initialize an ingredient.
         
@@ -42,7 +48,7 @@ class Ingredient(Item):
             str: Detailed string representation
         """
         return (f"Ingredient(name='{self.name}', "
-            f"type={self.type.value}, "
+            f"type={self.type.name.lower()}, "
             f"entity_id={self.entity_id}, "
             f"identities={len(self.identities)}, "
             f"properties={len(self.properties)})")
@@ -53,10 +59,14 @@ class IntermediateIngredient(Ingredient):
 
     Attributes:
         name: Name of the intermediate ingredient
-        produced_by: Instruction that produces this ingredient.
+        produced_by: Instruction that produces this ingredient (held weakly, since the
+            instruction refers back to this ingredient through produces).
         source_ingredients: Source ingredients used to produce this.
-        vessel: The vessel
+        vessel: The vessel (held weakly, since the vessel holds this ingredient in its contents)
     """
+    __slots__ = ('_produced_by', 'source_ingredients', '_vessel')
+    is_intermediate = True
+
     def __init__(self,
                  name: str,
                  produced_by: Optional[Any] = None,
@@ -73,17 +83,42 @@ class IntermediateIngredient(Ingredient):
         """
         super().__init__(name=name, **kwargs)
         self.produced_by = produced_by
-        self.source_ingredients = source_ingredients or set()
+        self.source_ingredients = source_ingredients if source_ingredients else _EMPTY_SET
         self.vessel = vessel
+
+    # Properties
+    @property
+    def produced_by(self) -> Optional[Any]:
+        """Get the instruction that produces this ingredient, or None if it no longer exists."""
+        return self._produced_by() if self._produced_by is not None else None
+
+    @produced_by.setter
+    def produced_by(self, value: Optional[Any]) -> None:
+        """Set the producing instruction, held by weak reference."""
+        self._produced_by = ref(value) if value is not None else None
+
+    @property
+    def vessel(self) -> Optional[Any]:
+        """Get the vessel this ingredient came from, or None if it no longer exists."""
+        return self._vessel() if self._vessel is not None else None
+
+    @vessel.setter
+    def vessel(self, value: Optional[Any]) -> None:
+        """Set the source vessel, held by weak reference."""
+        self._vessel = ref(value) if value is not None else None
     
     # Mutator methods
     def add_source_ingredient(self, ingredient: 'Ingredient') -> None:
         """Add a source ingredient that contributes to this intermediate ingredient."""
-        self.source_ingredients.add(ingredient)
+        if self.source_ingredients:
+            self.source_ingredients.add(ingredient)
+        else:
+            self.source_ingredients = {ingredient}
     
     def remove_source_ingredient(self, ingredient: 'Ingredient') -> None:
         """Remove a source ingredient."""
-        self.source_ingredients.discard(ingredient)
+        if self.source_ingredients:
+            self.source_ingredients.discard(ingredient)
 
     # String Representations
     def __str__(self) -> str:
@@ -3,8 +3,12 @@ and equipment are used within those instructions; models the relationships betwe
 actions, ingredients, equipment, and produced items.
 """
 
-from enum import Enum
-from typing import Optional, Dict, Set
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Optional, Dict, Set, FrozenSet, Iterable, Iterator, Mapping, Sequence
+from weakref import WeakSet
 
 from .symbol import SymbolType, Symbol
 from .item import Item
@@ -13,15 +17,22 @@ from .ingredient import Ingredient
 from .temperature import Temperature
 from .duration import Duration
 
+# Shared by every instruction whose mapping or edge list is still empty, so unused
+# containers are not allocated per instance; mutators replace them on first insert
+_EMPTY_MAPPING = MappingProxyType({})
+_EMPTY_EDGES: tuple = ()
 
-class ActionArity(Enum):
-    """Represents the arity of actions - how many inputs/outputs they typically have."""
-    UNARY = "unary"           # 1 input -> 1 output (e.g., chop, heat)
-    BINARY = "binary"         # 2 inputs -> 1 output (e.g., mix, combine)
-    TERNARY = "ternary"       # 3 inputs -> 1 output (e.g., complex combinations)
-    N_ARY = "n_ary"           # n inputs -> 1 output (e.g., assemble)
-    SPLITTING = "splitting"   # 1 input -> n outputs (e.g., separate, divide)
-    VARIABLE = "variable"     # variable inputs/outputs
+class ActionArity(IntEnum):
+    """Represents the arity of actions - how many inputs/outputs they typically have.
+    Integer-valued (starting at 1, so every member is truthy) so comparisons are cheap and
+    arities pack into arrays; the member name is the form stored in the database.
+    """
+    UNARY = 1                 # 1 input -> 1 output (e.g., chop, heat)
+    BINARY = 2                # 2 inputs -> 1 output (e.g., mix, combine)
+    TERNARY = 3               # 3 inputs -> 1 output (e.g., complex combinations)
+    N_ARY = 4                 # n inputs -> 1 output (e.g., assemble)
+    SPLITTING = 5             # 1 input -> n outputs (e.g., separate, divide)
+    VARIABLE = 6              # variable inputs/outputs
 
 
 class Action(Symbol):
@@ -34,6 +45,8 @@ class Action(Symbol):
     Attributes:
         arity Optional[ActionArity]: The input/output behavior of this action
     """
+    __slots__ = ('arity',)
+
     def __init__(
         self,
         name: str,
@@ -70,15 +83,17 @@ class Action(Symbol):
             str: Detailed representation with arity info
         """
         return (f"Action(name='{self.name}', "
-                f"type={self.type.value}, "
-                f"arity={self.arity}, "
+                f"type={self.type.name.lower()}, "
+                f"arity={self.arity.name if self.arity else None}, "
                 f"entity_id={self.entity_id}, "
                 f"identities={len(self.identities)}, "
                 f"properties={len(self.properties)})")
 
 
+@dataclass(frozen=True, slots=True)
 class IngredientUsage:
     """Represents how an ingredient is used in a specific instruction.
+    Immutable; use dataclasses.replace to derive a modified usage.
 
     Attributes:
         count (Optional[int]): The number of units of the ingredient used.
@@ -87,28 +102,22 @@ class IngredientUsage:
         quantity_unit (Optional[Symbol]): The unit symbol for the quantity.
         is_optional (bool): Whether this ingredient is optional.
     """
-    def __init__(self,
-                 count: Optional[int] = None,
-                 proportion: Optional[float] = None,
-                 quantity_value: Optional[float] = None,
-                 quantity_unit: Optional[Symbol] = None,
-                 is_optional: bool = False):
-        self.count = count
-        self.proportion = proportion
-        self.quantity_value = quantity_value
-        self.quantity_unit = quantity_unit
-        self.is_optional = is_optional
+    count: Optional[int] = None
+    proportion: Optional[float] = None
+    quantity_value: Optional[float] = None
+    quantity_unit: Optional[Symbol] = None
+    is_optional: bool = False
 
 
+@dataclass(frozen=True, slots=True)
 class EquipmentUsage:
     """Represents how equipment is used in a specific instruction.
+    Immutable; use dataclasses.replace to derive a modified usage.
 
     Attributes:
         count (Optional[int]): The number of units of the equipment used.
     """
-    def __init__(self, 
-                 count: Optional[int] = None):
-        self.count = count
+    count: Optional[int] = None
 
 
 class Instruction:
@@ -117,16 +126,23 @@ class Instruction:
     Attributes:
         instruction_id (int): Unique identifier for this instruction.
         action (Action): The action performed in this instruction.
-        ingredients (Dict[Ingredient, IngredientUsage]): Mapping of ingredients to their usage context.
-        equipment (Dict[Equipment, EquipmentUsage]): Mapping of equipment to their usage context.
+        ingredients (Mapping[Ingredient, IngredientUsage]): Mapping of ingredients to their usage context.
+        equipment (Mapping[Equipment, EquipmentUsage]): Mapping of equipment to their usage context.
         produces (Optional[Item]): The item produced by this instruction.
         temperature (Optional[Temperature]): The temperature required to perform this instruction.
         duration (Optional[Duration]): The duration of this instruction.
         sequence_order (Optional[float]): The order of this instruction in the recipe.
         description (Optional[str]): Text description of this instruction.
-        prerequisites (Optional[Set[Instruction]]): Instructions that must be completed before this one.
-        next (Optional[Set[Instruction]]): Instructions that follow this one.
+        prerequisites (Sequence[Instruction]): Instructions that must be completed before this one, in insertion order.
+        next (Sequence[Instruction]): Instructions that follow this one, in insertion order.
+            Modify prerequisites and next through add_prerequisite/remove_prerequisite
+            (or Recipe.from_edges) so cached transitive closures and recipe orderings are invalidated.
     """
+    __slots__ = ('instruction_id', 'action', 'ingredients', 'equipment', 'produces', 'temperature',
+                 'duration', 'sequence_order', 'description', 'prerequisites', 'next',
+                 '_prerequisite_closure', '_dependent_closure', '_prerequisite_watchers',
+                 '_dependent_watchers', '_recipes', '__weakref__')
+
     def __init__(self,
                  instruction_id: int,
                  action: Action,
@@ -137,42 +153,59 @@ class Instruction:
                  duration: Optional[Duration] = None,
                  sequence_order: Optional[float] = None,
                  description: Optional[str] = None,
-                 prerequisites: Optional[Set['Instruction']] = None,
-                 next: Optional[Set['Instruction']] = None):
+                 prerequisites: Optional[Iterable['Instruction']] = None,
+                 next: Optional[Iterable['Instruction']] = None):
         self.instruction_id = instruction_id
         self.action = action
-        self.ingredients = ingredients or {}
-        self.equipment = equipment or {}
+        self.ingredients = ingredients if ingredients else _EMPTY_MAPPING
+        self.equipment = equipment if equipment else _EMPTY_MAPPING
         self.produces = produces
         self.temperature = temperature
         self.duration = duration
         self.sequence_order = sequence_order
         self.description = description
-        self.prerequisites = prerequisites or set()
-        self.next = next or set()
+        # Edges are kept as duplicate-free lists: iteration is the common access pattern and
+        # insertion order makes traversals reproducible
+        self.prerequisites: Sequence['Instruction'] = (
+            list(dict.fromkeys(prerequisites)) if prerequisites else _EMPTY_EDGES)
+        self.next: Sequence['Instruction'] = list(dict.fromkeys(next)) if next else _EMPTY_EDGES
+        # Cached transitive closures, None until computed or after an edge change invalidates them
+        self._prerequisite_closure: Optional[FrozenSet['Instruction']] = None
+        self._dependent_closure: Optional[FrozenSet['Instruction']] = None
+        # Instructions whose cached closure contains (or belongs to) this one, so an edge change here
+        # drops exactly the closures it can affect; None until the first closure registers
+        self._prerequisite_watchers: Optional[Set['Instruction']] = None
+        self._dependent_watchers: Optional[Set['Instruction']] = None
+        # Recipes containing this instruction, notified of edge changes (see Recipe); None until added
+        self._recipes: Optional[WeakSet] = None
     
     # Accessor Methods
-    def get_input_ingredients(self) -> Dict[Ingredient, IngredientUsage]:
+    def get_input_ingredients(self) -> Mapping[Ingredient, IngredientUsage]:
         """Get all ingredients used in this instruction.
 
         Returns:
-            Dict[Ingredient, IngredientUsage]: Copy of ingredients mapping
+            Mapping[Ingredient, IngredientUsage]: Read-only view of the ingredients mapping
+                (use add_ingredient to modify it, or dict(...) for a mutable copy)
         """
-        return self.ingredients.copy()
+        return MappingProxyType(self.ingredients)
     
-    def get_equipment(self) -> Dict[Equipment, EquipmentUsage]:
+    def get_equipment(self) -> Mapping[Equipment, EquipmentUsage]:
         """Get all equipment used in this instruction.
 
         Returns:
-            Dict[Equipment, EquipmentUsage]: Copy of equipment mapping
+            Mapping[Equipment, EquipmentUsage]: Read-only view of the equipment mapping
+                (use add_equipment to modify it, or dict(...) for a mutable copy)
         """
-        return self.equipment.copy()
+        return MappingProxyType(self.equipment)
+    
+    def iter_input_items(self) -> Iterator[Item]:
+        """Iterate over all input items (ingredients + equipment) without building a set."""
+        yield from self.ingredients
+        yield from self.equipment
     
     def get_input_items(self) -> Set[Item]:
         """Get all input items (ingredients + equipment) for this instruction."""
-        input_items = set(self.ingredients.keys())
-        input_items.update(self.equipment.keys())
-        return input_items
+        return set(self.iter_input_items())
     
     def get_output_items(self) -> Set[Item]:
         """Get all output items produced by this instruction."""
@@ -187,21 +220,94 @@ class Instruction:
     # Mutator Methods
     def add_ingredient(self, ingredient: Ingredient, usage: IngredientUsage) -> None:
         """Add an ingredient usage to this instruction."""
-        self.ingredients[ingredient] = usage
+        if self.ingredients:
+            self.ingredients[ingredient] = usage
+        else:
+            self.ingredients = {ingredient: usage}
     
     def add_equipment(self, equipment: Equipment, usage: EquipmentUsage) -> None:
         """Add an equipment usage to this instruction."""
-        self.equipment[equipment] = usage
+        if self.equipment:
+            self.equipment[equipment] = usage
+        else:
+            self.equipment = {equipment: usage}
     
     def add_prerequisite(self, instruction: 'Instruction') -> None:
-        """Add a prerequisite instruction."""
-        self.prerequisites.add(instruction)
-        instruction.next.add(self)
+        """Add a prerequisite instruction.
+
+        Raises:
+            ValueError: If the new edge would create a cycle (the instruction already depends on this one)
+        """
+        if instruction is self or instruction._depends_on(self):
+            raise ValueError(f"Adding {instruction} as a prerequisite of {self} would create a cycle")
+        if not self.prerequisites:
+            self.prerequisites = [instruction]
+        elif instruction not in self.prerequisites:
+            self.prerequisites.append(instruction)
+        if not instruction.next:
+            instruction.next = [self]
+        elif self not in instruction.next:
+            instruction.next.append(self)
+        Instruction._edge_changed(instruction, self)
     
     def remove_prerequisite(self, instruction: 'Instruction') -> None:
         """Remove a prerequisite instruction."""
-        self.prerequisites.discard(instruction)
-        instruction.next.discard(self)
+        if instruction in self.prerequisites:
+            self.prerequisites.remove(instruction)
+        if self in instruction.next:
+            instruction.next.remove(self)
+        Instruction._edge_changed(instruction, self)
+
+    def _depends_on(self, instruction: 'Instruction') -> bool:
+        """Check whether instruction is a transitive prerequisite of this one.
+        Walks prerequisites depth-first and stops at the first match; unlike get_all_prerequisites
+        it neither reads nor fills the closure caches, so validating an edge costs no invalidation.
+        """
+        visited = {self}
+        stack = [self]
+        while stack:
+            for prerequisite in stack.pop().prerequisites:
+                if prerequisite is instruction:
+                    return True
+                if prerequisite not in visited:
+                    visited.add(prerequisite)
+                    stack.append(prerequisite)
+        return False
+
+    @staticmethod
+    def _edge_changed(prerequisite: 'Instruction', dependent: 'Instruction') -> None:
+        """Drop the cached closures an edge change between two instructions can affect and notify
+        their recipes. Only prerequisite closures containing the dependent and dependent closures
+        containing the prerequisite change, so unrelated cached closures are kept.
+        """
+        if dependent._prerequisite_watchers:
+            for watcher in tuple(dependent._prerequisite_watchers):
+                watcher._drop_prerequisite_closure()
+        if prerequisite._dependent_watchers:
+            for watcher in tuple(prerequisite._dependent_watchers):
+                watcher._drop_dependent_closure()
+        for instruction in (prerequisite, dependent):
+            if instruction._recipes:
+                for recipe in tuple(instruction._recipes):
+                    recipe._edges_changed(instruction)
+
+    def _drop_prerequisite_closure(self) -> None:
+        """Forget the cached prerequisite closure and unregister it from the instructions it contains."""
+        closure = self._prerequisite_closure
+        if closure is not None:
+            self._prerequisite_closure = None
+            for instruction in closure:
+                instruction._prerequisite_watchers.discard(self)
+            self._prerequisite_watchers.discard(self)
+
+    def _drop_dependent_closure(self) -> None:
+        """Forget the cached dependent closure and unregister it from the instructions it contains."""
+        closure = self._dependent_closure
+        if closure is not None:
+            self._dependent_closure = None
+            for instruction in closure:
+                instruction._dependent_watchers.discard(self)
+            self._dependent_watchers.discard(self)
 
     # DAG Analysis Methods
     def is_root_instruction(self) -> bool:
@@ -212,34 +318,59 @@ class Instruction:
         """Check if this instruction has no following instructions (is a leaf node)."""
         return len(self.next) == 0
     
-    def get_all_prerequisites(self) -> Set['Instruction']:
-        """Get all instructions that must be completed before this one (transitive closure)."""
-        visited = set()
-        to_visit = list(self.prerequisites)
-        
-        while to_visit:
-            current = to_visit.pop()
-            if current not in visited:
-                visited.add(current)
-                to_visit.extend(current.prerequisites)
-        
-        return visited
+    def get_all_prerequisites(self) -> FrozenSet['Instruction']:
+        """Get all instructions that must be completed before this one (transitive closure).
+        The result is cached until an edge change upstream of this instruction, and recomputed on the next call.
+        """
+        cached = self._prerequisite_closure
+        if cached is None:
+            # Mark instructions visited when queued so diamonds in the DAG are only queued once
+            visited = set(self.prerequisites)
+            queue = deque(self.prerequisites)
+            
+            while queue:
+                current = queue.popleft()
+                for prerequisite in current.prerequisites:
+                    if prerequisite not in visited:
+                        visited.add(prerequisite)
+                        queue.append(prerequisite)
+            
+            cached = self._prerequisite_closure = frozenset(visited)
+            for instruction in (self, *cached):
+                if instruction._prerequisite_watchers is None:
+                    instruction._prerequisite_watchers = set()
+                instruction._prerequisite_watchers.add(self)
+        return cached
     
-    def get_all_dependents(self) -> Set['Instruction']:
-        """Get all instructions that depend on this one (transitive closure)."""
-        visited = set()
-        to_visit = list(self.next)
-        
-        while to_visit:
-            current = to_visit.pop()
-            if current not in visited:
-                visited.add(current)
-                to_visit.extend(current.next)
-        
-        return visited
+    def get_all_dependents(self) -> FrozenSet['Instruction']:
+        """Get all instructions that depend on this one (transitive closure).
+        The result is cached until an edge change downstream of this instruction, and recomputed on the next call.
+        """
+        cached = self._dependent_closure
+        if cached is None:
+            # Mark instructions visited when queued so diamonds in the DAG are only queued once
+            visited = set(self.next)
+            queue = deque(self.next)
+            
+            while queue:
+                current = queue.popleft()
+                for dependent in current.next:
+                    if dependent not in visited:
+                        visited.add(dependent)
+                        queue.append(dependent)
+            
+            cached = self._dependent_closure = frozenset(visited)
+            for instruction in (self, *cached):
+                if instruction._dependent_watchers is None:
+                    instruction._dependent_watchers = set()
+                instruction._dependent_watchers.add(self)
+        return cached
     
     def has_cycle(self) -> bool:
-        """Check if adding this instruction would create a cycle in the DAG."""
+        """Check if this instruction lies on a cycle in the DAG.
+        Costs a transitive-closure walk (O(N+E)) on a cache miss; use Recipe.validate_dag_structure
+        to check a whole recipe at once.
+        """
         return self in self.get_all_prerequisites()
 
     # String Representations
@@ -3,7 +3,7 @@ with physical attributes for recipe modeling.
 Item inherits from Symbol and adds physical attributes.
 """
 
-from typing import Optional
+from typing import ClassVar, Optional
 
 from .symbol import Symbol, SymbolType
 from .dimensions import Dimensions
@@ -15,7 +15,11 @@ class Item(Symbol):
 
     Attributes:
         dimensions (Optional[Dimensions]): The physical dimensions of an item.
+        is_intermediate (bool): Class-level tag, True for items produced by an instruction.
     """
+    __slots__ = ('_dimensions', '_name_hash')
+    is_intermediate: ClassVar[bool] = False
+
     def __init__(self,
                  name: str,
                  type: SymbolType,
@@ -36,6 +40,17 @@ class Item(Symbol):
         )
         self.dimensions = dimensions
 
+    @Symbol.name.setter
+    def name(self, value: str) -> None:
+        """Set the name of the item (interned by Symbol, so equal names share one
+        string object) and cache its hash for set and dict lookups.
+
+        Args:
+            value (str): The new name of the item
+        """
+        Symbol.name.fset(self, value)
+        self._name_hash = hash(self._name)
+
     @property
     def dimensions(self) -> Optional[Dimensions]:
         """Get the dimensions."""
@@ -49,22 +64,27 @@ class Item(Symbol):
             value (Optional[Dimensions]): Dimensions instance or None
 
         Raises:
-            TypeError: If value is not a Dimensions instance or None
+            TypeError: If value is not a Dimensions instance or None (checked only when
+                assertions are enabled, so bulk loads under -O skip it)
         """
-        if value is not None and not hasattr(value, '__class__'):
+        if __debug__ and value is not None and not isinstance(value, Dimensions):
             raise TypeError("Dimensions must be a Dimensions instance or None")
         self._dimensions = value
     
     # Equality and Hashing
     def __eq__(self, other) -> bool:
-        """Equality comparison based on name."""
+        """Equality comparison based on name (an identity check, since names are interned).
+        Non-items return NotImplemented so Python can defer to the other operand.
+        """
+        if self is other:
+            return True
         if not isinstance(other, Item):
-            return False
-        return self.name == other.name
+            return NotImplemented
+        return self._name is other._name
 
     def __hash__(self) -> int:
-        """Hash method for using items in sets."""
-        return hash(self.name)
+        """Hash method for using items in sets, cached when the name is set."""
+        return self._name_hash
     
     # String Representations
     def __str__(self) -> str:
@@ -73,7 +93,7 @@ class Item(Symbol):
         Returns:
             str: String representation showing name and type
         """
-        return f"{self.name} ({self.type.value})"
+        return f"{self.name} ({self.type.name.lower()})"
 
     def __repr__(self) -> str:
         """Get detailed string representation of the item for debugging.
@@ -82,5 +102,5 @@ class Item(Symbol):
             str: Detailed string representation
         """
         dims_info = f", dimensions={self.dimensions}" if self.dimensions else ""
-        return f"Item(name='{self.name}', type={self.type.value}{dims_info})"
+        return f"Item(name='{self.name}', type={self.type.name.lower()}{dims_info})"
         
@@ -2,8 +2,9 @@
 supporting both absolute measurements and relative (range-based) measurements.
 """
 
-from abc import ABC
-from typing import Optional
+import math
+from typing import Any, Callable, Optional, Tuple
+from weakref import WeakValueDictionary
 
 from .symbol import SymbolType, Symbol
 
@@ -12,6 +13,8 @@ class Unit(Symbol):
     """Represents a unit of measurement used in recipe analysis.
     Units have canonical forms/aliases and dynamic properties.
     """
+    __slots__ = ()
+
     def __init__(self, name: str, **kwargs):
         """Initialize a unit.
 
@@ -45,12 +48,15 @@ class Unit(Symbol):
                 f"properties={len(self.properties)})")
 
 
-class Quantification(ABC):
-    """Abstract base class for all measurement types in recipes.
+class Quantification:
+    """Base class for all measurement types in recipes.
+    Not an ABC: nothing is abstract, and ABCMeta would route every isinstance check
+    against a quantification type (e.g. DurationAbs) through its slower subclass hook.
     
     All quantifications have at minimum a unit (which may be optional in some cases)
     and provide a get_unit method.
     """
+    __slots__ = ('unit', '__weakref__')
     
     def __init__(self, unit: Optional[Symbol] = None):
         """Initialize a Quantification with a unit.
@@ -70,45 +76,118 @@ class Quantification(ABC):
 
 
 class Measurement(Quantification):
-    """Abstract base class for measurements."""
-    pass
+    """Base class for measurements."""
+    __slots__ = ()
+
+
+# Shared measurements handed out by MeasurementAbs.intern/MeasurementRel.intern, kept while referenced.
+# Keys hold the unit's id(): a shared measurement keeps its unit alive, so the id cannot be reused
+# while the entry exists, and keying never hashes or copies the unit's state
+_interned_measurements: 'WeakValueDictionary[Tuple[Any, ...], Measurement]' = WeakValueDictionary()
+
+
+def _intern_measurement(key: Tuple[Any, ...], factory: Callable[[], 'Measurement']) -> 'Measurement':
+    """Get the shared measurement for a key, creating it if missing or if the shared
+    instance was modified after interning.
+    """
+    measurement = _interned_measurements.get(key)
+    if measurement is None or measurement._intern_key() != key:
+        measurement = _interned_measurements[key] = factory()
+    return measurement
 
 
 class MeasurementAbs(Measurement):
     """Absolute measurement.
 
     Attributes:
-        value (Optional[float]): Absolute value
+        value (float): Absolute value, NaN when unknown
     """
-    def __init__(self, unit: Optional[Unit] = None, value: Optional[float] = None):
+    __slots__ = ('value',)
+
+    def __init__(self, unit: Optional[Unit] = None, value: Optional[float] = math.nan):
         """Initialize an absolute measurement.
         
         Args:
             unit: Unit of measurement (optional)
-            value: Absolute value (optional)
+            value: Absolute value (optional); None is stored as NaN so the value is always a float
         """
         super().__init__(unit)
-        self.value = value
+        self.value = math.nan if value is None else float(value)
+
+    @property
+    def has_value(self) -> bool:
+        """Check whether the value is known.
+
+        Returns:
+            bool: False if the value is NaN
+        """
+        return not math.isnan(self.value)
+
+    @classmethod
+    def intern(cls, unit: Optional[Unit] = None, value: Optional[float] = math.nan) -> 'MeasurementAbs':
+        """Get a shared measurement for a unit and value, creating it on first use.
+        Measurements are shared per unit object, not per equal unit. Shared instances must not be modified.
+
+        Args:
+            unit: Unit of measurement (optional)
+            value: Absolute value (optional)
+
+        Returns:
+            MeasurementAbs: The shared measurement
+        """
+        key = (cls, id(unit), math.nan if value is None else value)
+        return _intern_measurement(key, lambda: cls(unit, value))
+
+    def _intern_key(self) -> Tuple[Any, ...]:
+        """Get the key this measurement's current state is interned under."""
+        return (type(self), id(self.unit), self.value)
 
 
 class MeasurementRel(Measurement):
     """Relative measurement (range).
 
     Attributes:
-        value_min (Optional[float]): Minimum value
-        value_max (Optional[float]): Maximum value
+        value_min (float): Minimum value, NaN when unknown
+        value_max (float): Maximum value, NaN when unknown
     """
+    __slots__ = ('value_min', 'value_max')
+
     def __init__(self,
                  unit: Optional[Unit] = None,
-                 value_min: Optional[float] = None,
-                 value_max: Optional[float] = None):
+                 value_min: Optional[float] = math.nan,
+                 value_max: Optional[float] = math.nan):
         """Initialize a relative measurement.
         
+        Args:
+            unit: Unit of measurement (optional)
+            value_min: Minimum value (optional); None is stored as NaN
+            value_max: Maximum value (optional); None is stored as NaN
+        """
+        super().__init__(unit)
+        self.value_min = math.nan if value_min is None else float(value_min)
+        self.value_max = math.nan if value_max is None else float(value_max)
+
+    @classmethod
+    def intern(cls,
+               unit: Optional[Unit] = None,
+               value_min: Optional[float] = math.nan,
+               value_max: Optional[float] = math.nan) -> 'MeasurementRel':
+        """Get a shared measurement for a unit and range, creating it on first use.
+        Measurements are shared per unit object, not per equal unit. Shared instances must not be modified.
+
         Args:
             unit: Unit of measurement (optional)
             value_min: Minimum value (optional)
             value_max: Maximum value (optional)
+
+        Returns:
+            MeasurementRel: The shared measurement
         """
-        super().__init__(unit)
-        self.value_min = value_min
-        self.value_max = value_max
+        key = (cls, id(unit),
+               math.nan if value_min is None else value_min,
+               math.nan if value_max is None else value_max)
+        return _intern_measurement(key, lambda: cls(unit, value_min, value_max))
+
+    def _intern_key(self) -> Tuple[Any, ...]:
+        """Get the key this measurement's current state is interned under."""
+        return (type(self), id(self.unit), self.value_min, self.value_max)
@@ -3,10 +3,41 @@ directed acyclic graph (DAG) of actions and items. Provides methods to build,
 validate, and analyze recipe structures.
 """
 
-from typing import Set, List
+import math
+from array import array
+from collections import Counter, defaultdict, deque
+from typing import Any, Collection, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+from weakref import WeakSet
 
 from .instruction import Action, Instruction
 from .item import Item
+from .duration import DurationAbs
+from .temperature import TemperatureAbs
+
+
+class InstructionColumns(NamedTuple):
+    """Column-oriented snapshot of a recipe's instructions, in topological order.
+    Row i of every column describes the same instruction; missing or relative
+    (range-based) durations and temperatures are stored as NaN, in the instruction's own unit.
+
+    Attributes:
+        instructions (List[Instruction]): Instructions in topological order.
+        instruction_ids (array): Instruction IDs (int64).
+        durations (array): Absolute duration values (float32, ample precision for cooking times).
+        temperatures (array): Absolute temperature values (float32).
+        sequence_orders (array): Sequence orders (float64).
+        prereq_indptr (array): CSR row offsets into prereq_indices, one row per instruction plus one (int64).
+        prereq_indices (array): Row indices of each instruction's in-recipe prerequisites (int64).
+        row_by_id (Dict[int, int]): Row index of each instruction_id.
+    """
+    instructions: List[Instruction]
+    instruction_ids: array
+    durations: array
+    temperatures: array
+    sequence_orders: array
+    prereq_indptr: array
+    prereq_indices: array
+    row_by_id: Dict[int, int]
 
 
 class Recipe:
@@ -15,86 +46,206 @@ class Recipe:
     Attributes:
         recipe_id (int): The unique identifier for this recipe.
         title (str): The title of the recipe.
-        root_instructions (Set[Instruction]): The set of root instructions in the DAG (no prerequisites).
-        all_instructions (Set[Instruction]): The set of all instructions in the DAG.
+        root_instructions (FrozenSet[Instruction]): The set of root instructions in the DAG (no prerequisites).
+        all_instructions (FrozenSet[Instruction]): The set of all instructions in the DAG.
+
+    Node and item analysis reflects each instruction as it was when added; after editing an
+    instruction already in the recipe (e.g. add_ingredient), call refresh_instructions.
     """
-    def __init__(self, recipe_id: int, title: str):
-        self._recipe_id = recipe_id
-        self._title = title
-        self._root_instructions = set()
-        self._all_instructions = set()
+    __slots__ = ('recipe_id', 'title', '_root_instructions', '_all_instructions',
+                 '_action_nodes', '_item_nodes', '_columns', '_by_id', '_derived',
+                 '_action_counts', '_produced_counts', '_consumed_counts', '_counted', '__weakref__')
+
+    def __init__(self, recipe_id: int, title: str, instructions: Optional[Iterable['Instruction']] = None):
+        """Initialize a recipe, optionally with its instructions added in bulk.
+
+        Args:
+            recipe_id (int): The unique identifier for the recipe
+            title (str): The title of the recipe
+            instructions (Optional[Iterable[Instruction]]): Initial instructions. Defaults to None.
+
+        Raises:
+            TypeError: If recipe_id is not an integer or title is not a string
+        """
+        if __debug__ and not isinstance(recipe_id, int):
+            raise TypeError("Recipe ID must be an integer")
+        if __debug__ and not isinstance(title, str):
+            raise TypeError("Title must be a string")
+        # Plain attributes: read on every lookup and never derived, so no property indirection
+        self.recipe_id = recipe_id
+        self.title = title
+        # Insertion-ordered: membership tests stay O(1) and traversals are deterministic
+        self._all_instructions: Dict['Instruction', None] = dict.fromkeys(instructions) if instructions else {}
+        self._root_instructions = {i for i in self._all_instructions if i.is_root_instruction()}
+        self._by_id: Dict[int, 'Instruction'] = {i.instruction_id: i for i in self._all_instructions}
         
         # DAG container properties
         self._action_nodes: Set['Action'] = set()  # All action nodes in the DAG
         self._item_nodes: Set['Item'] = set()      # All item nodes in the DAG
+        # Per-node reference counts over instructions, so removals need no rescan
+        self._action_counts: Counter = Counter()
+        self._produced_counts: Counter = Counter()
+        self._consumed_counts: Counter = Counter()
+        # The action, produced and consumed items each instruction was counted with, so removal
+        # decrements exactly what was added even if the instruction was edited in between
+        self._counted: Dict['Instruction', Tuple[Tuple['Action'], Tuple['Item', ...], Tuple['Item', ...]]] = {}
+        self._columns: Optional[InstructionColumns] = None
+        self._derived: Dict[str, Any] = {}  # Read-only results derived from the instruction collections
         
         # Build DAG from instructions
         self._build_dag_from_instructions()
 
+    @classmethod
+    def from_edges(cls,
+                   recipe_id: int,
+                   title: str,
+                   instructions: Iterable['Instruction'],
+                   edges: Iterable[Tuple[int, int]]) -> 'Recipe':
+        """Build a recipe from instructions and a prerequisite edge list in a single pass,
+        replacing any edges the instructions already had. Edges to instructions outside the
+        recipe are removed from both ends, so no outside instruction keeps a stale back-reference.
+
+        Args:
+            recipe_id (int): The unique identifier for the recipe
+            title (str): The title of the recipe
+            instructions (Iterable[Instruction]): The recipe's instructions
+            edges (Iterable[Tuple[int, int]]): (prerequisite instruction_id, instruction_id) pairs
+
+        Returns:
+            Recipe: The recipe containing all instructions
+
+        Raises:
+            KeyError: If an edge references an unknown instruction_id
+            ValueError: If the edges contain a cycle
+            (in either case no instruction is modified)
+        """
+        by_id = {instruction.instruction_id: instruction for instruction in instructions}
+        prerequisites = defaultdict(list)
+        dependents = defaultdict(list)
+        for src, dst in dict.fromkeys(edges):
+            prerequisites[dst].append(by_id[src])
+            dependents[src].append(by_id[dst])
+        
+        # Kahn's algorithm over the edge list, so a cycle is rejected before any instruction changes
+        in_degree = {instruction_id: len(prerequisites.get(instruction_id, ())) for instruction_id in by_id}
+        ready = [instruction_id for instruction_id, degree in in_degree.items() if degree == 0]
+        ordered = 0
+        while ready:
+            ordered += 1
+            for dependent in dependents.get(ready.pop(), ()):
+                in_degree[dependent.instruction_id] -= 1
+                if in_degree[dependent.instruction_id] == 0:
+                    ready.append(dependent.instruction_id)
+        if ordered != len(by_id):
+            raise ValueError(f"Edges for recipe '{title}' contain a cycle")
+        
+        members = set(by_id.values())
+        for instruction_id, instruction in by_id.items():
+            # Drop back-references held by outside instructions on the edges being replaced
+            for prerequisite in instruction.prerequisites:
+                if prerequisite not in members and instruction in prerequisite.next:
+                    prerequisite.next.remove(instruction)
+                    Instruction._edge_changed(prerequisite, instruction)
+            for dependent in instruction.next:
+                if dependent not in members and instruction in dependent.prerequisites:
+                    dependent.prerequisites.remove(instruction)
+                    Instruction._edge_changed(instruction, dependent)
+            instruction.prerequisites = prerequisites.get(instruction_id, ())
+            instruction.next = dependents.get(instruction_id, ())
+            Instruction._edge_changed(instruction, instruction)
+        return cls(recipe_id, title, by_id.values())
+
     # Properties and Accessor Methods
     @property
-    def recipe_id(self) -> int:
-        """Get the recipe ID."""
-        return self._recipe_id
-    
-    @property
-    def title(self) -> str:
-        """Get the recipe title."""
-        return self._title
-    
-    @property
-    def root_instructions(self) -> Set['Instruction']:
-        """Get the set of root instructions."""
-        return self._root_instructions.copy()
+    def root_instructions(self) -> FrozenSet['Instruction']:
+        """Get the set of root instructions as a read-only snapshot."""
+        return self._view('root_instructions', self._root_instructions)
     
     @property
-    def all_instructions(self) -> Set['Instruction']:
-        """Get the set of all instructions."""
-        return self._all_instructions.copy()
+    def all_instructions(self) -> FrozenSet['Instruction']:
+        """Get the set of all instructions as a read-only snapshot."""
+        return self._view('all_instructions', self._all_instructions)
     
     @property
-    def action_nodes(self) -> Set['Action']:
-        """Get all action nodes in the DAG."""
-        return self._action_nodes.copy()
+    def action_nodes(self) -> FrozenSet['Action']:
+        """Get all action nodes in the DAG as a read-only snapshot."""
+        return self._view('action_nodes', self._action_nodes)
     
     @property
-    def item_nodes(self) -> Set['Item']:
-        """Get all item nodes in the DAG."""
-        return self._item_nodes.copy()
+    def item_nodes(self) -> FrozenSet['Item']:
+        """Get all item nodes in the DAG as a read-only snapshot."""
+        return self._view('item_nodes', self._item_nodes)
+
+    def _view(self, name: str, source: Collection) -> FrozenSet:
+        """Get the cached frozen snapshot of a DAG collection, building it on first access
+        after a change so repeated reads share one immutable set instead of copying.
+        """
+        view = self._derived.get(name)
+        if view is None:
+            view = self._derived[name] = frozenset(source)
+        return view
+
+    def _invalidate_derived(self) -> None:
+        """Drop snapshots and columns derived from the instruction collections."""
+        self._derived.clear()
+        self._columns = None
+
+    def _edges_changed(self, instruction: 'Instruction') -> None:
+        """Called by an instruction of this recipe when one of its edges changes, so orderings
+        and columns are recomputed and its root membership follows its prerequisites.
+        """
+        self._invalidate_derived()
+        if instruction.is_root_instruction():
+            self._root_instructions.add(instruction)
+        else:
+            self._root_instructions.discard(instruction)
+
+    def _register(self, instruction: 'Instruction') -> None:
+        """Subscribe this recipe to the instruction's edge changes."""
+        if instruction._recipes is None:
+            instruction._recipes = WeakSet()
+        instruction._recipes.add(self)
     
     # Mutator Methods
-    @recipe_id.setter
-    def recipe_id(self, value: int) -> None:
-        """Set the recipe ID."""
-        if not isinstance(value, int):
-            raise TypeError("Recipe ID must be an integer")
-        self._recipe_id = value
-    
-    @title.setter
-    def title(self, value: str) -> None:
-        """Set the recipe title."""
-        if not isinstance(value, str):
-            raise TypeError("Title must be a string")
-        self._title = value
-    
     @root_instructions.setter
     def root_instructions(self, value: Set['Instruction']) -> None:
         """Set the root instructions."""
-        if not isinstance(value, set):
+        if __debug__ and not isinstance(value, set):
             raise TypeError("Root instructions must be a set")
         self._root_instructions = value
+        self._derived.clear()
     
     @all_instructions.setter
     def all_instructions(self, value: Set['Instruction']) -> None:
         """Set all instructions."""
-        if not isinstance(value, set):
+        if __debug__ and not isinstance(value, set):
             raise TypeError("All instructions must be a set")
-        self._all_instructions = value
+        for instruction in self._all_instructions:
+            instruction._recipes.discard(self)
+        self._all_instructions = dict.fromkeys(value)
+        self._by_id = {instruction.instruction_id: instruction for instruction in value}
+        self._build_dag_from_instructions()
+
+    def get_instruction(self, instruction_id: int) -> Optional['Instruction']:
+        """Get an instruction of this recipe by ID in constant time.
+
+        Args:
+            instruction_id (int): ID of the instruction
+
+        Returns:
+            Optional[Instruction]: The instruction if it belongs to this recipe, None otherwise
+        """
+        return self._by_id.get(instruction_id)
 
     # DAG management methods
     def add_instruction(self, instruction: 'Instruction') -> None:
         """Add an instruction to the recipe and update DAG."""
-        self._all_instructions.add(instruction)
+        if instruction not in self._all_instructions:
+            self._count_instruction(instruction, 1)
+            self._register(instruction)
+        self._all_instructions[instruction] = None
+        self._by_id[instruction.instruction_id] = instruction
+        self._invalidate_derived()
         if instruction.is_root_instruction():
             self._root_instructions.add(instruction)
         else:
@@ -104,8 +255,7 @@ class Recipe:
         self._action_nodes.add(instruction.action)
         
         # Add input items (ingredients and equipment) to DAG
-        for item in instruction.get_input_items():
-            self._item_nodes.add(item)
+        self._item_nodes.update(instruction.iter_input_items())
         
         # Add output items to DAG
         for item in instruction.get_output_items():
@@ -113,110 +263,286 @@ class Recipe:
     
     def remove_instruction(self, instruction: 'Instruction') -> None:
         """Remove an instruction from the recipe and update DAG."""
-        self._all_instructions.discard(instruction)
+        if instruction not in self._all_instructions:
+            return
+        del self._all_instructions[instruction]
+        instruction._recipes.discard(self)
         self._root_instructions.discard(instruction)
+        if self._by_id.get(instruction.instruction_id) is instruction:
+            del self._by_id[instruction.instruction_id]
+        self._invalidate_derived()
+        (action,), _, _ = self._count_instruction(instruction, -1)
         
         # Remove action from DAG if no other instructions use it
-        action_still_used = any(
-            inst.action == instruction.action 
-            for inst in self._all_instructions 
-            if inst != instruction
-        )
-        if not action_still_used:
-            self._action_nodes.discard(instruction.action)
+        if action not in self._action_counts:
+            self._action_nodes.discard(action)
+
+    def _count_instruction(self, instruction: 'Instruction', step: int
+                           ) -> Tuple[Tuple['Action'], Tuple['Item', ...], Tuple['Item', ...]]:
+        """Adjust the action and produced/consumed item reference counts for an instruction,
+        dropping nodes whose count reaches zero. Counting up records the instruction's current
+        nodes; counting down reverses exactly the recorded ones.
+
+        Returns:
+            Tuple[Tuple[Action], Tuple[Item, ...], Tuple[Item, ...]]: The (action,), produced and
+                consumed nodes that were counted
+        """
+        if step > 0:
+            counted = self._counted[instruction] = (
+                (instruction.action,), tuple(instruction.get_output_items()), tuple(instruction.ingredients))
+        else:
+            counted = self._counted.pop(instruction)
+        for counts, nodes in zip((self._action_counts, self._produced_counts, self._consumed_counts), counted):
+            for node in nodes:
+                counts[node] += step
+                if counts[node] <= 0:
+                    del counts[node]
+        return counted
+    
+    def refresh_instructions(self) -> None:
+        """Recount action and item nodes from the instructions' current contents.
+        Call after editing instructions already in the recipe (e.g. add_ingredient or a new produces),
+        since those edits are not tracked.
+        """
+        self._root_instructions = {i for i in self._all_instructions if i.is_root_instruction()}
+        self._build_dag_from_instructions()
     
     def _build_dag_from_instructions(self) -> None:
         """Build the DAG structure from current instructions."""
+        self._invalidate_derived()
         self._action_nodes.clear()
         self._item_nodes.clear()
+        self._action_counts.clear()
+        self._produced_counts.clear()
+        self._consumed_counts.clear()
+        self._counted.clear()
         
         for instruction in self._all_instructions:
+            self._count_instruction(instruction, 1)
+            self._register(instruction)
+            
             # Add action node
             self._action_nodes.add(instruction.action)
             
             # Add input items
-            for item in instruction.get_input_items():
-                self._item_nodes.add(item)
+            self._item_nodes.update(instruction.iter_input_items())
             
             # Add output items
             for item in instruction.get_output_items():
                 self._item_nodes.add(item)
     
     # Analysis Methods
-    def get_input_items(self) -> Set['Item']:
+    def _get_produced_and_consumed(self) -> Tuple[FrozenSet['Item'], FrozenSet['Item']]:
+        """Get the items produced and consumed by any instruction, read from the incrementally
+        maintained reference counts and cached until instructions are added or removed.
+        """
+        produced = self._derived.get('produced')
+        consumed = self._derived.get('consumed')
+        if produced is None or consumed is None:
+            produced = self._derived['produced'] = frozenset(self._produced_counts)
+            consumed = self._derived['consumed'] = frozenset(self._consumed_counts)
+        return produced, consumed
+
+    def get_input_items(self) -> FrozenSet['Item']:
         """Get items that are inputs to the recipe (not produced by any instruction)."""
-        produced_items = set()
-        for instruction in self._all_instructions:
-            produced_items.update(instruction.get_output_items())
-        
-        consumed_items = set()
-        for instruction in self._all_instructions:
-            consumed_items.update(instruction.get_consumed_items())
-        
+        produced_items, consumed_items = self._get_produced_and_consumed()
         return consumed_items - produced_items
     
-    def get_output_items(self) -> Set['Item']:
+    def get_output_items(self) -> FrozenSet['Item']:
         """Get items that are final outputs of the recipe (produced but not consumed)."""
-        produced_items = set()
-        for instruction in self._all_instructions:
-            produced_items.update(instruction.get_output_items())
-        
-        consumed_items = set()
-        for instruction in self._all_instructions:
-            consumed_items.update(instruction.get_consumed_items())
-        
+        produced_items, consumed_items = self._get_produced_and_consumed()
         return produced_items - consumed_items
     
-    def get_intermediate_items(self) -> Set['Item']:
+    def get_intermediate_items(self) -> FrozenSet['Item']:
         """Get items that are both produced and consumed (intermediate results)."""
-        produced_items = set()
-        consumed_items = set()
-        
-        for instruction in self._all_instructions:
-            produced_items.update(instruction.get_output_items())
-            consumed_items.update(instruction.get_consumed_items())
-        
+        produced_items, consumed_items = self._get_produced_and_consumed()
         return produced_items & consumed_items
     
     def validate_dag_structure(self) -> bool:
-        """Check that instruction dependencies form a DAG (no cycles).
+        """Check that instruction dependencies form a DAG (no cycles), in O(N+E) for the whole recipe.
 
         Returns:
             bool: True if DAG structure is valid, False otherwise
         """
-        for instruction in self._all_instructions:
-            if instruction.has_cycle():
-                return False
-        return True
+        return len(self.get_topological_order()) == len(self._all_instructions)
         
     def get_topological_order(self) -> List['Instruction']:
-        """Get instructions in topological order (dependencies before dependents)."""
-        visited = set()
-        temp_visited = set()
-        result = []
-        
-        def visit(instruction: 'Instruction') -> bool:
-            if instruction in temp_visited:
-                return False  # Cycle detected
-            if instruction in visited:
-                return True
-            
-            temp_visited.add(instruction)
-            for prereq in instruction.prerequisites:
-                if not visit(prereq):
-                    return False
-            temp_visited.remove(instruction)
-            visited.add(instruction)
-            result.append(instruction)
-            return True
+        """Get instructions in topological order (dependencies before dependents).
+        Only edges between instructions of this recipe are followed, and ties are broken
+        by the order instructions were added, so the result is deterministic.
+
+        Returns:
+            List[Instruction]: Ordered instructions, or an empty list if the DAG has a cycle
+        """
+        cached = self._derived.get('topological_order')
+        if cached is not None:
+            return list(cached)
         
+        # Kahn's algorithm: repeatedly take instructions with no remaining prerequisites;
+        # any instruction never taken lies on (or behind) a cycle
+        in_degree = dict.fromkeys(self._all_instructions, 0)
         for instruction in self._all_instructions:
-            if instruction not in visited:
-                if not visit(instruction):
-                    return []  # Cycle detected, return empty list
+            for dependent in instruction.next:
+                if dependent in in_degree:
+                    in_degree[dependent] += 1
+        
+        queue = deque(instruction for instruction, degree in in_degree.items() if degree == 0)
+        result = []
+        while queue:
+            instruction = queue.popleft()
+            result.append(instruction)
+            for dependent in instruction.next:
+                if dependent in in_degree:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        queue.append(dependent)
         
+        if len(result) != len(in_degree):
+            result = []
+        self._derived['topological_order'] = tuple(result)
         return result
 
+    def sort_adjacency(self) -> bool:
+        """Reorder every instruction's prerequisites and next lists into topological order,
+        so ordered consumers can scan them directly instead of sorting per traversal.
+        Run once after the DAG is built; edges added later are appended at the end.
+
+        Returns:
+            bool: True if the adjacency was sorted, False if the DAG has a cycle
+        """
+        ordered = self.get_topological_order()
+        if self._all_instructions and not ordered:
+            return False
+        
+        rank = {instruction: position for position, instruction in enumerate(ordered)}
+        unranked = len(rank)
+        for instruction in ordered:
+            # Empty edge lists may be the shared immutable sentinel, and need no sorting anyway
+            if len(instruction.prerequisites) > 1:
+                instruction.prerequisites.sort(key=lambda p: rank.get(p, unranked))
+            if len(instruction.next) > 1:
+                instruction.next.sort(key=lambda n: rank.get(n, unranked))
+        
+        # Rebuild columns so CSR rows list prerequisites in the same order
+        self._columns = None
+        return True
+
+    # Columnar Analytics
+    def get_instruction_columns(self) -> InstructionColumns:
+        """Get a column-oriented snapshot of the instructions for recipe-wide rollups.
+        The snapshot is cached until instructions or edges change; call
+        refresh_instruction_columns after editing durations or temperatures in place.
+
+        Returns:
+            InstructionColumns: Parallel packed arrays in topological order (empty if the DAG has a cycle)
+        """
+        if self._columns is None:
+            self._columns = self._build_instruction_columns()
+        return self._columns
+
+    def refresh_instruction_columns(self) -> InstructionColumns:
+        """Rebuild the column-oriented snapshot of the instructions.
+
+        Returns:
+            InstructionColumns: The rebuilt snapshot
+        """
+        self._columns = None
+        return self.get_instruction_columns()
+
+    def _build_instruction_columns(self) -> InstructionColumns:
+        """Build parallel arrays and a prerequisite CSR adjacency from the instruction objects."""
+        ordered = self.get_topological_order()
+        row_of = {instruction: row for row, instruction in enumerate(ordered)}
+        nan = math.nan
+
+        prereq_indptr = array('q', [0])
+        prereq_indices = array('q')
+        for instruction in ordered:
+            prereq_indices.extend(row_of[p] for p in instruction.prerequisites if p in row_of)
+            prereq_indptr.append(len(prereq_indices))
+
+        return InstructionColumns(
+            instructions=ordered,
+            instruction_ids=array('q', (i.instruction_id for i in ordered)),
+            durations=array('f', (i.duration.value if isinstance(i.duration, DurationAbs) else nan
+                                  for i in ordered)),
+            temperatures=array('f', (i.temperature.value if isinstance(i.temperature, TemperatureAbs) else nan
+                                     for i in ordered)),
+            sequence_orders=array('d', (nan if i.sequence_order is None else i.sequence_order
+                                        for i in ordered)),
+            prereq_indptr=prereq_indptr,
+            prereq_indices=prereq_indices,
+            row_by_id={instruction.instruction_id: row for instruction, row in row_of.items()},
+        )
+
+    def to_csr(self) -> Tuple[array, array]:
+        """Get the prerequisite adjacency as compressed sparse rows over get_instruction_columns() rows.
+
+        Returns:
+            Tuple[array, array]: (indptr, indices); the prerequisites of row i are indices[indptr[i]:indptr[i + 1]]
+        """
+        columns = self.get_instruction_columns()
+        return columns.prereq_indptr, columns.prereq_indices
+
+    def get_reachability(self) -> List[int]:
+        """Get the prerequisite reachability matrix, one bit-packed row per instruction
+        (bit j of row i is set when row j is a transitive prerequisite of row i).
+        Rows follow get_instruction_columns(); only edges within this recipe are followed.
+
+        Returns:
+            List[int]: Reachability bitmask for each row
+        """
+        indptr, indices = self.to_csr()
+        reach: List[int] = []
+        
+        # Rows are topologically ordered, so each prerequisite's row is already complete and
+        # propagating it is a single integer OR rather than a set union
+        for row in range(len(indptr) - 1):
+            mask = 0
+            for p in indices[indptr[row]:indptr[row + 1]]:
+                mask |= reach[p] | (1 << p)
+            reach.append(mask)
+        return reach
+
+    def get_all_prerequisite_closures(self) -> Dict['Instruction', FrozenSet['Instruction']]:
+        """Get the transitive prerequisites of every instruction in one pass over the DAG,
+        instead of one traversal per instruction. Only edges within this recipe are followed.
+
+        Returns:
+            Dict[Instruction, FrozenSet[Instruction]]: Mapping of each instruction to all of its prerequisites
+        """
+        instructions = self.get_instruction_columns().instructions
+        return {
+            instructions[row]: frozenset(instructions[p] for p in range(mask.bit_length()) if mask >> p & 1)
+            for row, mask in enumerate(self.get_reachability())
+        }
+
+    def get_total_duration(self) -> float:
+        """Get the sum of all absolute instruction durations (instructions without one are skipped).
+
+        Returns:
+            float: Total duration, in the instructions' own time units
+        """
+        return math.fsum(d for d in self.get_instruction_columns().durations if not math.isnan(d))
+
+    def get_critical_path_duration(self) -> float:
+        """Get the longest chain of absolute durations through the DAG, i.e. the minimum
+        total time if independent instructions ran in parallel.
+
+        Returns:
+            float: Critical path duration, in the instructions' own time units
+        """
+        columns = self.get_instruction_columns()
+        indptr, indices = columns.prereq_indptr, columns.prereq_indices
+        finish = array('d', bytes(8 * len(columns.durations)))
+        
+        # Rows are topologically ordered, so every prerequisite's finish time is final when read
+        for row, duration in enumerate(columns.durations):
+            start = max((finish[p] for p in indices[indptr[row]:indptr[row + 1]]), default=0.0)
+            finish[row] = start + (0.0 if math.isnan(duration) else duration)
+        
+        return max(finish, default=0.0)
+
     def __str__(self) -> str:
         """Get string representation of the recipe.
         
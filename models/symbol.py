@@ -3,17 +3,28 @@ as symbolic descriptors in recipes. Each symbol has a 'type' and references
 to hierarchical identities and properties stored separately.
 """
 
-from enum import Enum
-from typing import Optional, Tuple, Set, Dict, Any
+import sys
+from enum import IntEnum
+from typing import AbstractSet, Optional, Tuple, Set, Dict, Any, Iterable
 from abc import ABC
+from types import MappingProxyType
 
 
-class SymbolType(Enum):
-    """Represents different kinds of symbols used in recipe analysis."""
-    ACTION = "action"
-    EQUIPMENT = "equipment"
-    INGREDIENT = "ingredient"
-    UNIT = "unit"
+# Shared by every symbol without identities or properties, so empty containers are not
+# allocated per instance; add_identity/set_property replace them on first insert
+_EMPTY_IDENTITIES: frozenset = frozenset()
+_EMPTY_PROPERTIES = MappingProxyType({})
+
+
+class SymbolType(IntEnum):
+    """Represents different kinds of symbols used in recipe analysis.
+    Integer-valued (starting at 1, so every member is truthy) so comparisons are cheap and
+    types pack into arrays; the member name is the form stored in the database.
+    """
+    ACTION = 1
+    EQUIPMENT = 2
+    INGREDIENT = 3
+    UNIT = 4
 
 
 class Symbol(ABC):
@@ -22,6 +33,8 @@ class Symbol(ABC):
     
     This is an abstract base class that should be inherited by specific symbol types.
     """
+    __slots__ = ('_type', '_name', 'entity_id', '_canonical_form', '_identities', '_primary_identity',
+                 'properties', 'description', '_hash', '__weakref__')
     
     def __init__(
         self,
@@ -29,7 +42,7 @@ class Symbol(ABC):
         name: str,
         entity_id: Optional[int] = None,
         canonical_form: Optional[Tuple[int, str]] = None,
-        identities: Optional[Set[str]] = None,
+        identities: Optional[Iterable[str]] = None,
         properties: Optional[Dict[str, Any]] = None,
         description: str = "",
     ):
@@ -40,18 +53,41 @@ class Symbol(ABC):
             name (str): The name of the symbol
             entity_id (Optional[int], optional): Database ID of the symbol, if known. Defaults to None.
             canonical_form (Optional[Tuple[int, str]], optional): The standard form of the symbol. Defaults to None.
-            identities (Optional[Set[str]]): Set of hierarchical identity strings. Defaults to None.
+            identities (Optional[Iterable[str]]): Hierarchical identity strings, stored as a set. Defaults to None.
             properties (Optional[Dict[str, Any]], optional): Key-value pairs for symbol properties. Defaults to None.
             description (str, optional): Text description of the symbol. Defaults to "".
         """
-        self.type = type
+        # Fields whose setters only reset the cached hash are assigned directly; name (which
+        # subclasses hook), a given canonical form and identities still go through their setters
+        self._type = type
+        self._canonical_form = None
         self.name = name
         self.entity_id = entity_id
-        self.canonical_form = canonical_form
-        self.identities = identities or set()
-        self.properties = properties or {}
+        if canonical_form is not None:
+            self.canonical_form = canonical_form
+        self.identities = identities
+        self.properties = properties if properties else _EMPTY_PROPERTIES
         self.description = description
 
+    @property
+    def type(self) -> SymbolType:
+        """Get the type of the symbol.
+        
+        Returns:
+            SymbolType: The symbol's type
+        """
+        return self._type
+    
+    @type.setter
+    def type(self, value: SymbolType) -> None:
+        """Set the type of the symbol.
+
+        Args:
+            value (SymbolType): The new type of the symbol
+        """
+        self._type = value
+        self._hash = None
+
     @property
     def name(self) -> str:
         """Get the name of the symbol.
@@ -63,12 +99,69 @@ class Symbol(ABC):
     
     @name.setter
     def name(self, value: str) -> None:
-        """Set the name of the symbol.
+        """Set the name of the symbol, interned so the many symbols sharing a name
+        share one string object.
 
         Args:
             value (str): The new name of the symbol
         """
-        self._name = value
+        self._name = sys.intern(value) if type(value) is str else value
+        self._hash = None
+
+    @property
+    def canonical_form(self) -> Optional[Tuple[int, str]]:
+        """Get the standard form of the symbol.
+        
+        Returns:
+            Optional[Tuple[int, str]]: The canonical form, if any
+        """
+        return self._canonical_form
+    
+    @canonical_form.setter
+    def canonical_form(self, value: Optional[Tuple[int, str]]) -> None:
+        """Set the standard form of the symbol.
+
+        Args:
+            value (Optional[Tuple[int, str]]): The new canonical form; its string is interned
+        """
+        if value is not None and type(value[1]) is str:
+            value = (value[0], sys.intern(value[1]))
+        self._canonical_form = value
+        self._hash = None
+
+    @property
+    def identities(self) -> AbstractSet[str]:
+        """Get the hierarchical identities of the symbol.
+        Use add_identity/remove_identity to modify them so primary_identity stays current.
+        
+        Returns:
+            AbstractSet[str]: The symbol's identity strings (a shared empty frozenset when there are none)
+        """
+        return self._identities
+    
+    @identities.setter
+    def identities(self, value: Set[str]) -> None:
+        """Set the hierarchical identities of the symbol.
+        Any other iterable is converted to a set so membership checks stay constant-time.
+
+        Args:
+            value (Set[str]): The new identity strings
+        """
+        if not value:
+            value = _EMPTY_IDENTITIES
+        elif not isinstance(value, set):
+            value = set(value)
+        self._identities = value
+        self._primary_identity = min(value) if value else None
+
+    @property
+    def primary_identity(self) -> Optional[str]:
+        """Get the alphabetically first identity, computed when identities are set.
+        
+        Returns:
+            Optional[str]: The primary identity, or None if the symbol has no identities
+        """
+        return self._primary_identity
     
     # Predicate Methods
     def is_operator(self) -> bool:
@@ -94,7 +187,13 @@ class Symbol(ABC):
         Args:
             identity (str): Hierarchical identity string to add
         """
-        self.identities.add(identity)
+        identity = sys.intern(identity)
+        if self._identities:
+            self._identities.add(identity)
+        else:
+            self._identities = {identity}
+        if self._primary_identity is None or identity < self._primary_identity:
+            self._primary_identity = identity
         
     def remove_identity(self, identity: str) -> bool:
         """Remove a hierarchical identity from this symbol.
@@ -107,6 +206,8 @@ class Symbol(ABC):
         """
         if identity in self.identities:
             self.identities.remove(identity)
+            if identity == self._primary_identity:
+                self._primary_identity = min(self.identities) if self.identities else None
             return True
         return False
 
@@ -117,7 +218,10 @@ class Symbol(ABC):
             key (str): Property key
             value (str): Property value
         """
-        self.properties[key] = value
+        if self.properties:
+            self.properties[key] = value
+        else:
+            self.properties = {key: value}
         
     def remove_property(self, key: str) -> bool:
         """Remove a property from this symbol.
@@ -135,16 +239,24 @@ class Symbol(ABC):
 
     # Equality and Hashing
     def __eq__(self, other) -> bool:
-        """Check equality based on type, canonical form, and entity_id."""
+        """Check equality based on type, canonical form, and entity_id.
+        The same instance matches on the identity check alone.
+        """
+        if self is other:
+            return True
         if not isinstance(other, Symbol):
             return False
-        return (self.type == other.type and 
-                self.canonical_form == other.canonical_form and
+        return (self._type == other._type and 
+                self._canonical_form == other._canonical_form and
                 self.entity_id == other.entity_id)
     
     def __hash__(self) -> int:
-        """Generate hash based on type and canonical form."""
-        return hash((self.type, self.name, self.canonical_form))
+        """Generate hash based on type, name and canonical form.
+        Computed on first use and cached until the type, name or canonical form changes.
+        """
+        if self._hash is None:
+            self._hash = hash((self._type, self._name, self._canonical_form))
+        return self._hash
 
     # String Representations
     def __str__(self) -> str:
@@ -153,7 +265,7 @@ class Symbol(ABC):
         Returns:
             str: String representation of format: canonical_form (type)
         """
-        return f"{self.name} ({self.type.value})"
+        return f"{self.name} ({self.type.name.lower()})"
         
     def __repr__(self) -> str:
         """Get detailed string representation of this symbol for debugging.
@@ -161,7 +273,7 @@ class Symbol(ABC):
         Returns:
             str: Detailed string representation
         """
-        return (f"{self.__class__.__name__}(type={self.type.value}, "
+        return (f"{self.__class__.__name__}(type={self.type.name.lower()}, "
                 f"name='{self.name}', "
                 f"entity_id={self.entity_id}, "
                 f"canonical_form={self.canonical_form}, "
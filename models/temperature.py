@@ -9,11 +9,12 @@ from models.measurement import Unit, Quantification
 
 class Temperature(Quantification):
     """Abstract base class for temperature measurements."""
-    pass
+    __slots__ = ()
 
 
 class TemperatureAbs(Temperature):
     """Absolute temperature with exact value."""
+    __slots__ = ('value',)
     
     def __init__(self, value: float, unit: Unit):
         """Initialize a TemperatureAbs instance.
@@ -28,6 +29,7 @@ class TemperatureAbs(Temperature):
 
 class TemperatureRel(Temperature):
     """Relative temperature with a range or level."""
+    __slots__ = ('value_min', 'value_max', 'level')
     
     def __init__(self, value_min: Optional[float] = None, value_max: Optional[float] = None, 
                  unit: Optional[Unit] = None, level: Optional[str] = None):
@@ -4,13 +4,16 @@
 
 from .connection import MariaDBConnectionManager, MongoDBConnectionManager
 from .base import BaseRepository
-from .recipe_repository import RecipeRepository
-from .symbol_repository import SymbolRepository
+from .recipe_repository import RecipeRepository, get_recipe_repository
+from .symbol_repository import SymbolRepository, get_symbol_repository, get_symbol_cache
 
 __all__ = [
     'MariaDBConnectionManager',
     'MongoDBConnectionManager',
     'BaseRepository',
     'RecipeRepository',
+    'get_recipe_repository',
     'SymbolRepository',
+    'get_symbol_repository',
+    'get_symbol_cache',
 ]
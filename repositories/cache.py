@@ -0,0 +1,81 @@
+"""Provides a small in-process cache used by repositories and controllers
+to avoid repeated database round-trips for read-mostly data.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Bounded least-recently-used cache whose entries optionally expire.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept before evicting the least recently used
+        ttl (Optional[float]): Seconds an entry stays valid, or None for no expiry
+    """
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to 128.
+            ttl (Optional[float], optional): Entry lifetime in seconds. Defaults to None (no expiry).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value.
+
+        Args:
+            key (Hashable): Cache key
+            default (Any, optional): Value returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a single entry.
+
+        Args:
+            key (Hashable): Cache key
+            default (Any, optional): Value returned if the key is not cached. Defaults to None.
+
+        Returns:
+            Any: The removed value, or default
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry is not None else default
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Get the number of stored entries (including any not yet purged as expired)."""
+        return len(self._data)
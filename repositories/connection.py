@@ -17,6 +17,7 @@ from pymongo.collection import Collection
 from pymongo.database import Database
 
 from config.database import get_mariadb_config
+from config.environment import get_environment_config
 
 logger = logging.getLogger(__name__)
 
@@ -26,17 +27,12 @@ class MariaDBConnectionManager:
     Implements the singleton pattern to maintain a single connection per instance.
     
     Attributes:
-        db_config (dict): Database configuration parameters
+        db_config (MariaDBConfig): Database configuration parameters
         _connection (Connection): Active database connection instance
         _instance (MariaDBConnectionManager): Singleton instance reference
     """
     _instance = None
 
-    def __init__(self) -> None:
-        """Initialize the connection manager with configuration settings."""
-        self.db_config = get_mariadb_config()
-        self._connection = None
-
     def __new__(cls):
         """Create or return the singleton instance of the connection manager.
         
@@ -45,9 +41,16 @@ class MariaDBConnectionManager:
         """
         if cls._instance is None:
             cls._instance = super(MariaDBConnectionManager, cls).__new__(cls)
-            cls._instance.__init__()
+            cls._instance._initialize()
         return cls._instance
 
+    def _initialize(self) -> None:
+        """Initialize the connection manager with configuration settings.
+        Called once from __new__; an __init__ would run on every instantiation and drop the open connection.
+        """
+        self.db_config = get_mariadb_config()
+        self._connection = None
+
     def connect(self) -> Connection:
         """Establish a connection to the MariaDB database. If a connection already exists and is open,
         returns the existing connection. Otherwise, creates a new connection using the configured parameters.
@@ -61,16 +64,16 @@ class MariaDBConnectionManager:
         if self._connection is None or not self._connection.open:
             try:
                 self._connection = pymysql.connect(
-                    host=self.db_config['host'],
-                    port=self.db_config['port'],
-                    user=self.db_config['user'],
-                    password=self.db_config['password'],
-                    database=self.db_config['database'],
+                    host=self.db_config.host,
+                    port=self.db_config.port,
+                    user=self.db_config.user,
+                    password=self.db_config.password,
+                    database=self.db_config.database,
                     cursorclass=DictCursor
                 )
                 logger.info("Connected to MariaDB")
             except pymysql.Error as e:
-                logger.error(f"Error connecting to MariaDB: {e}")
+                logger.error("Error connecting to MariaDB: %s", e)
                 raise
         return self._connection
     
@@ -145,33 +148,42 @@ class MongoDBConnectionManager:
     _db: Optional[Database] = None
     _connection_error: Optional[Exception] = None
     
-    # MongoDB configuration for different environments
-    configs = {
-        'dev': {
-            'host': os.environ.get('MONGODB_HOST', 'localhost'),
-            'port': int(os.environ.get('MONGODB_PORT', '27017')),
-            'database': os.environ.get('MONGODB_DATABASE', 'recipe_analysis_dev'),
-            'username': os.environ.get('MONGODB_USER'),
-            'password': os.environ.get('MONGODB_PASSWORD'),
-            'auth_source': os.environ.get('MONGODB_AUTH_SOURCE', 'admin')
-        },
-        'test': {
-            'host': os.environ.get('MONGODB_HOST', 'localhost'),
-            'port': int(os.environ.get('MONGODB_PORT', '27017')),
-            'database': 'recipe_analysis_test',
-            'username': os.environ.get('MONGODB_USER'),
-            'password': os.environ.get('MONGODB_PASSWORD'),
-            'auth_source': os.environ.get('MONGODB_AUTH_SOURCE', 'admin')
-        },
-        'prod': {
-            'host': os.environ.get('MONGODB_HOST', 'localhost'),
-            'port': int(os.environ.get('MONGODB_PORT', '27017')),
-            'database': 'recipe_analysis_prod',
-            'username': os.environ.get('MONGODB_USER'),
-            'password': os.environ.get('MONGODB_PASSWORD'),
-            'auth_source': os.environ.get('MONGODB_AUTH_SOURCE', 'admin')
+    @staticmethod
+    def _build_configs() -> Dict[str, Dict[str, Any]]:
+        """Build the MongoDB configuration for each environment.
+        Deferred until first connection so values from the .env file are available.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Configuration keyed by environment name
+        """
+        get_environment_config()
+        env = dict(os.environ)
+        return {
+            'dev': {
+                'host': env.get('MONGODB_HOST', 'localhost'),
+                'port': int(env.get('MONGODB_PORT', '27017')),
+                'database': env.get('MONGODB_DATABASE', 'recipe_analysis_dev'),
+                'username': env.get('MONGODB_USER'),
+                'password': env.get('MONGODB_PASSWORD'),
+                'auth_source': env.get('MONGODB_AUTH_SOURCE', 'admin')
+            },
+            'test': {
+                'host': env.get('MONGODB_HOST', 'localhost'),
+                'port': int(env.get('MONGODB_PORT', '27017')),
+                'database': 'recipe_analysis_test',
+                'username': env.get('MONGODB_USER'),
+                'password': env.get('MONGODB_PASSWORD'),
+                'auth_source': env.get('MONGODB_AUTH_SOURCE', 'admin')
+            },
+            'prod': {
+                'host': env.get('MONGODB_HOST', 'localhost'),
+                'port': int(env.get('MONGODB_PORT', '27017')),
+                'database': 'recipe_analysis_prod',
+                'username': env.get('MONGODB_USER'),
+                'password': env.get('MONGODB_PASSWORD'),
+                'auth_source': env.get('MONGODB_AUTH_SOURCE', 'admin')
+            }
         }
-    }
     
     def __new__(cls):
         """Ensure only one instance of the connection manager exists.
@@ -195,9 +207,11 @@ class MongoDBConnectionManager:
             bool: True if connection was successful
         """
         try:
+            configs = self._build_configs()
+            
             # Get environment or default to 'dev'
             env = os.environ.get('APP_ENV', 'dev').lower()
-            config = self.configs.get(env, self.configs.get('dev'))
+            config = configs.get(env, configs.get('dev'))
             
             # Connection string with or without authentication
             if config.get('username') and config.get('password'):
@@ -218,13 +232,13 @@ class MongoDBConnectionManager:
             # Test the connection
             self._client.admin.command('ping')
             
-            logger.info(f"Connected to MongoDB database: {config['database']}")
+            logger.info("Connected to MongoDB database: %s", config['database'])
             self._connection_error = None
             return True
             
         except Exception as e:
             self._connection_error = e
-            logger.error(f"Error connecting to MongoDB: {e}")
+            logger.error("Error connecting to MongoDB: %s", e)
             return False
     
     def get_collection(self, collection_name: str) -> Collection:
@@ -5,25 +5,59 @@ maintaining relational metadata in MariaDB for efficient querying and indexing.
 
 import logging
 import json
+import re
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Union
-from bson import ObjectId
+from bson import ObjectId, json_util
+from pymongo import UpdateOne
 
 from repositories.base import BaseRepository
 from repositories.connection import MariaDBConnectionManager, MongoDBConnectionManager
 
 logger = logging.getLogger(__name__)
 
+INGREDIENT_TEXT_INDEX = 'ingredients_text'
+INGREDIENT_NAME_LC_INDEX = 'ingredients.name_lc_1'
+COMPLEXITY_SCORE_INDEX = 'complexity_metrics.complexity_score_1'
+
+# Matches a single instruction step: a run of text between periods or newlines
+_STEP_SPLIT = re.compile(r'[^.\n]+')
+
 
 class RecipeRepository(BaseRepository[Dict[str, Any]]):
     """Provides data access methods for recipe-related operations,
     handles document storage in MongoDB and relational metadata in MariaDB.
     """
+    _indexes_ensured = False
     
     def __init__(self):
         """Initialize the recipe repository with required dependencies."""
         self.mariadb_connection_manager = MariaDBConnectionManager()        
         self.mongo_connection_manager = MongoDBConnectionManager()
 
+    def ensure_indexes(self) -> None:
+        """Create the MongoDB indexes used by recipe searches if they do not exist yet.
+        Not called when the repository is constructed, so construction never blocks on MongoDB;
+        call it once at application startup, e.g. get_recipe_repository().ensure_indexes().
+        Also backfills 'name_lc' on recipes stored without it, so indexed prefix searches find them.
+        Runs once per process; failures are logged and retried on the next call.
+        """
+        if RecipeRepository._indexes_ensured:
+            return
+        
+        try:
+            collection = self.mongo_connection_manager.get_collection('recipes')
+            collection.create_index(
+                [('ingredients.name', 'text'), ('ingredients', 'text')],
+                name=INGREDIENT_TEXT_INDEX
+            )
+            collection.create_index([('ingredients.name_lc', 1)], name=INGREDIENT_NAME_LC_INDEX)
+            collection.create_index([('complexity_metrics.complexity_score', 1)], name=COMPLEXITY_SCORE_INDEX)
+            self._backfill_ingredient_names(collection)
+            RecipeRepository._indexes_ensured = True
+        except Exception as e:
+            logger.warning("Could not ensure recipe indexes: %s", e)
+
     # Read Operations  
     def get_all(self) -> List[Dict[str, Any]]:
         """Retrieve all recipes from MongoDB.
@@ -35,10 +69,10 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             collection = self.mongo_connection_manager.get_collection('recipes')
             return list(collection.find())
         except ConnectionError as e:
-            logger.error(f"MongoDB connection error: {e}")
+            logger.error("MongoDB connection error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error retrieving all recipes: {e}")
+            logger.error("Error retrieving all recipes: %s", e)
             return []
         
     def get_by_id(self, entity_id: Union[str, ObjectId]) -> Optional[Dict[str, Any]]:
@@ -57,10 +91,35 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             collection = self.mongo_connection_manager.get_collection('recipes')
             return collection.find_one({'_id': entity_id})
         except ConnectionError as e:
-            logger.error(f"MongoDB connection error: {e}")
+            logger.error("MongoDB connection error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error retrieving recipe with ID {entity_id}: {e}")
+            logger.error("Error retrieving recipe with ID %s: %s", entity_id, e)
+            return None
+    
+    def get_by_id_projected(self,
+                            entity_id: Union[str, ObjectId],
+                            projection: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Retrieve selected fields of a recipe by MongoDB ObjectId.
+        
+        Args:
+            entity_id (Union[str, ObjectId]): Recipe ObjectId
+            projection (Dict[str, Any]): MongoDB projection selecting the fields to return
+            
+        Returns:
+            Optional[Dict[str, Any]]: The projected recipe if found, None otherwise
+        """
+        try:
+            if isinstance(entity_id, str):
+                entity_id = ObjectId(entity_id)
+                
+            collection = self.mongo_connection_manager.get_collection('recipes')
+            return collection.find_one({'_id': entity_id}, projection)
+        except ConnectionError as e:
+            logger.error("MongoDB connection error: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Error retrieving projected recipe with ID %s: %s", entity_id, e)
             return None
     
     def get_by_relational_id(self, recipe_id: int) -> Optional[Dict[str, Any]]:
@@ -88,15 +147,16 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             # Then get the full document from MongoDB
             return self.get_by_id(ObjectId(object_id))
         except Exception as e:
-            logger.error(f"Error retrieving recipe with relational ID {recipe_id}: {e}")
+            logger.error("Error retrieving recipe with relational ID %s: %s", recipe_id, e)
             return None
     
     # Search Operations
-    def find_by(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def find_by(self, criteria: Dict[str, Any], hint: Optional[str] = None) -> List[Dict[str, Any]]:
         """Find recipes matching specified criteria in MongoDB.
         
         Args:
             criteria (Dict[str, Any]): MongoDB query criteria
+            hint (Optional[str], optional): Name of the index the query should use. Defaults to None.
             
         Returns:
             List[Dict[str, Any]]: Matching recipes
@@ -105,7 +165,7 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             ConnectionError: If MongoDB connection fails
         """
         try:
-            logger.info(f"MongoDB query: {criteria}")
+            logger.info("MongoDB query: %s", criteria)
             
             collection = self.mongo_connection_manager.get_collection('recipes')
             
@@ -113,31 +173,55 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
                 logger.error("Recipe collection is None")
                 return []
                 
-            results = list(collection.find(criteria))
-            logger.info(f"MongoDB query returned {len(results)} results for criteria: {str(criteria)[:100]}")
-            
-            if results:
+            cursor = collection.find(criteria)
+            if hint:
+                cursor = cursor.hint(hint)
+            results = list(cursor)
+            logger.info("MongoDB query returned %s results for criteria: %.100s", len(results), criteria)
+            
+            # Only build the sample summary when it will actually be logged
+            if results and logger.isEnabledFor(logging.INFO):
                 first_result = results[0]
-                title = first_result.get('title', 'Untitled')
-                recipe_id = str(first_result.get('_id', 'unknown'))
-                logger.info(f"First match: {title} (ID: {recipe_id})")
+                logger.info("First match: %s (ID: %s)", first_result.get('title', 'Untitled'), first_result.get('_id', 'unknown'))
                 
                 ingredients = first_result.get('ingredients', [])
                 if ingredients and isinstance(ingredients, list):
                     ingredient_names = [i.get('name', 'Unknown') if isinstance(i, dict) else str(i) 
                                       for i in ingredients[:3]]
-                    logger.info(f"Sample ingredients: {ingredient_names}")
-            else:
-                logger.info(f"No recipes matched the criteria: {str(criteria)[:100]}")
+                    logger.info("Sample ingredients: %s", ingredient_names)
+            elif not results:
+                logger.info("No recipes matched the criteria: %.100s", criteria)
                 
             return results
             
         except ConnectionError as e:
-            logger.error(f"MongoDB connection error: {e}")
+            logger.error("MongoDB connection error: %s", e)
             raise
             
         except Exception as e:
-            logger.error(f"Error finding recipes by criteria {str(criteria)[:100]}: {e}")
+            logger.error("Error finding recipes by criteria %.100s: %s", criteria, e)
+            return []
+
+    def aggregate(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run an aggregation pipeline against the recipes collection.
+        
+        Args:
+            pipeline (List[Dict[str, Any]]): MongoDB aggregation pipeline stages
+            
+        Returns:
+            List[Dict[str, Any]]: Documents produced by the pipeline
+            
+        Raises:
+            ConnectionError: If MongoDB connection fails
+        """
+        try:
+            collection = self.mongo_connection_manager.get_collection('recipes')
+            return list(collection.aggregate(pipeline))
+        except ConnectionError as e:
+            logger.error("MongoDB connection error: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Error running recipe aggregation %s: %s", str(pipeline)[:100], e)
             return []
 
     def find_by_name(self, name: str) -> List[Dict[str, Any]]:
@@ -153,7 +237,7 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             query = {"title": {"$regex": f".*{name}.*", "$options": "i"}}
             return self.find_by(query)
         except Exception as e:
-            logger.error(f"Error searching recipes by name '{name}': {e}")
+            logger.error("Error searching recipes by name '%s': %s", name, e)
             return []
 
     def find_by_relational_criteria(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -186,7 +270,7 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
                         if recipe_doc:
                             recipes.append(recipe_doc)
         except Exception as e:
-            logger.error(f"Error finding recipes by relational criteria: {e}")
+            logger.error("Error finding recipes by relational criteria: %s", e)
         
         return recipes
 
@@ -203,6 +287,8 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
         try:
             # Insert into MongoDB first
             collection = self.mongo_connection_manager.get_collection('recipes')
+            self._normalize_ingredient_names(entity)
+            entity['complexity_metrics'] = self.compute_complexity_metrics(entity)
             result = collection.insert_one(entity)
             entity['_id'] = result.inserted_id
             
@@ -227,14 +313,14 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             except Exception as mariadb_error:
                 # If MariaDB insert fails, remove from MongoDB to maintain consistency
                 collection.delete_one({'_id': result.inserted_id})
-                logger.error(f"MariaDB insert failed, rolled back MongoDB insert: {mariadb_error}")
+                logger.error("MariaDB insert failed, rolled back MongoDB insert: %s", mariadb_error)
                 return None
             
-            logger.info(f"Created recipe '{entity.get('title', 'Untitled')}' with MongoDB ID {result.inserted_id}")
+            logger.info("Created recipe '%s' with MongoDB ID %s", entity.get('title', 'Untitled'), result.inserted_id)
             return entity
             
         except Exception as e:
-            logger.error(f"Error creating recipe: {e}")
+            logger.error("Error creating recipe: %s", e)
             return None
 
     def update(self, entity: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -257,13 +343,7 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             
             # Update MongoDB document
             collection = self.mongo_connection_manager.get_collection('recipes')
-            update_data = entity.copy()
-            if '_id' in update_data:
-                del update_data['_id']
-            if 'relational_id' in update_data:
-                del update_data['relational_id']
-                
-            mongo_result = collection.update_one({'_id': entity_id}, {'$set': update_data})
+            mongo_result = collection.update_one({'_id': entity_id}, self._build_update(entity))
             
             # Update MariaDB metadata
             try:
@@ -281,19 +361,133 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
                         ))
                         connection.commit()
             except Exception as mariadb_error:
-                logger.warning(f"MariaDB update failed for recipe {entity_id}: {mariadb_error}")
+                logger.warning("MariaDB update failed for recipe %s: %s", entity_id, mariadb_error)
             
             if mongo_result.modified_count > 0:
-                logger.info(f"Updated recipe with ID {entity_id}")
+                logger.info("Updated recipe with ID %s", entity_id)
                 return entity
             else:
-                logger.warning(f"No recipe found with ID {entity_id}")
+                logger.warning("No recipe found with ID %s", entity_id)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error updating recipe: {e}")
+            logger.error("Error updating recipe: %s", e)
             return None
     
+    def create_many(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several recipe documents in MongoDB and their metadata in MariaDB,
+        using one bulk write per database instead of one round trip per recipe.
+
+        Args:
+            entities (List[Dict[str, Any]]): Recipe data to create
+            
+        Returns:
+            List[Dict[str, Any]]: The created recipes with IDs assigned, or an empty list if failed
+        """
+        if not entities:
+            return []
+            
+        try:
+            # Insert into MongoDB first
+            collection = self.mongo_connection_manager.get_collection('recipes')
+            for entity in entities:
+                self._normalize_ingredient_names(entity)
+                entity['complexity_metrics'] = self.compute_complexity_metrics(entity)
+            result = collection.insert_many(entities)
+            object_ids = [str(inserted_id) for inserted_id in result.inserted_ids]
+            
+            # Insert metadata into MariaDB
+            try:
+                with self.mariadb_connection_manager.get_connection() as connection:
+                    with connection.cursor() as cursor:
+                        query = """
+                            INSERT INTO recipes (object_id, title, name)
+                            VALUES (%s, %s, %s)
+                        """
+                        cursor.executemany(query, [
+                            (
+                                object_id,
+                                entity.get('title', 'Untitled'),
+                                entity.get('name', entity.get('title', 'Untitled'))
+                            )
+                            for object_id, entity in zip(object_ids, entities)
+                        ])
+                        
+                        # Look up the relational IDs, which are not guaranteed to be consecutive
+                        placeholders = ','.join(['%s'] * len(object_ids))
+                        cursor.execute(f"SELECT id, object_id FROM recipes WHERE object_id IN ({placeholders})", object_ids)
+                        relational_ids = {row['object_id']: row['id'] for row in cursor.fetchall()}
+                        connection.commit()
+                        
+            except Exception as mariadb_error:
+                # If MariaDB insert fails, remove from MongoDB to maintain consistency
+                collection.delete_many({'_id': {'$in': result.inserted_ids}})
+                logger.error("MariaDB bulk insert failed, rolled back MongoDB inserts: %s", mariadb_error)
+                return []
+            
+            for object_id, entity in zip(object_ids, entities):
+                entity['relational_id'] = relational_ids.get(object_id)
+            
+            logger.info("Created %s recipes", len(entities))
+            return entities
+            
+        except Exception as e:
+            logger.error("Error creating recipes: %s", e)
+            return []
+
+    def update_many(self, entities: List[Dict[str, Any]]) -> int:
+        """Update several existing recipes in both MongoDB and MariaDB,
+        using one bulk write per database instead of one round trip per recipe.
+        
+        Args:
+            entities (List[Dict[str, Any]]): Recipe data to update, each with an _id
+            
+        Returns:
+            int: Number of recipe documents modified
+            
+        Raises:
+            ValueError: If any recipe ID is not set
+        """
+        if any('_id' not in entity for entity in entities):
+            raise ValueError("Cannot update recipe without MongoDB _id")
+        if not entities:
+            return 0
+            
+        try:
+            # Update MongoDB documents
+            collection = self.mongo_connection_manager.get_collection('recipes')
+            operations = [UpdateOne({'_id': entity['_id']}, self._build_update(entity)) for entity in entities]
+
+            mongo_result = collection.bulk_write(operations, ordered=False)
+            
+            # Update MariaDB metadata
+            try:
+                with self.mariadb_connection_manager.get_connection() as connection:
+                    with connection.cursor() as cursor:
+                        query = """
+                            UPDATE recipes 
+                            SET title = %s, name = %s 
+                            WHERE object_id = %s
+                        """
+                        cursor.executemany(query, [
+                            (
+                                entity.get('title', 'Untitled'),
+                                entity.get('name', entity.get('title', 'Untitled')),
+                                str(entity['_id'])
+                            )
+                            for entity in entities
+                        ])
+                        connection.commit()
+            except Exception as mariadb_error:
+                logger.warning("MariaDB bulk update failed for %s recipes: %s", len(entities), mariadb_error)
+            
+            logger.info("Updated %s of %s recipes", mongo_result.modified_count, len(entities))
+            return mongo_result.modified_count
+                
+        except Exception as e:
+            logger.error("Error updating recipes: %s", e)
+            return 0
+    
     def delete(self, entity_id: Union[str, ObjectId]) -> bool:
         """Delete a recipe from both MongoDB and MariaDB.
         
@@ -315,7 +509,7 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
                         cursor.execute(query, (str(entity_id),))
                         connection.commit()
             except Exception as mariadb_error:
-                logger.warning(f"MariaDB delete failed for recipe {entity_id}: {mariadb_error}")
+                logger.warning("MariaDB delete failed for recipe %s: %s", entity_id, mariadb_error)
             
             # Delete from MongoDB
             collection = self.mongo_connection_manager.get_collection('recipes')
@@ -323,11 +517,11 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             
             success = result.deleted_count > 0
             if success:
-                logger.info(f"Deleted recipe {entity_id}")
+                logger.info("Deleted recipe %s", entity_id)
             return success
             
         except Exception as e:
-            logger.error(f"Error deleting recipe with ID {entity_id}: {e}")
+            logger.error("Error deleting recipe with ID %s: %s", entity_id, e)
             return False
     
     def delete_by_relational_id(self, recipe_id: int) -> bool:
@@ -354,14 +548,120 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
             if object_id_str:
                 return self.delete(ObjectId(object_id_str))
             else:
-                logger.warning(f"No recipe found with relational ID {recipe_id}")
+                logger.warning("No recipe found with relational ID %s", recipe_id)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error deleting recipe with relational ID {recipe_id}: {e}")
+            logger.error("Error deleting recipe with relational ID %s: %s", recipe_id, e)
             return False
     
     # Helper Methods
+    @staticmethod
+    def _normalize_ingredient_names(entity: Dict[str, Any]) -> None:
+        """Store a lowercase copy of each ingredient name as 'name_lc' for indexed prefix searches.
+        Ingredients stored as plain strings cannot hold the field and are left as they are.
+        
+        Args:
+            entity (Dict[str, Any]): Recipe document, modified in place
+        """
+        ingredients = entity.get('ingredients')
+        if not isinstance(ingredients, list):
+            return
+        for ingredient in ingredients:
+            if isinstance(ingredient, dict) and isinstance(ingredient.get('name'), str):
+                ingredient['name_lc'] = ingredient['name'].lower()
+
+    def _backfill_ingredient_names(self, collection, batch_size: int = 1000) -> int:
+        """Add 'name_lc' to the ingredients of recipes stored without it (e.g. written before
+        the field existed or inserted directly into MongoDB). Each recipe is only rewritten if
+        its ingredients have not changed since they were read, so concurrent updates are kept.
+        
+        Args:
+            collection: The recipes collection
+            batch_size (int, optional): Number of recipes written per bulk write. Defaults to 1000.
+            
+        Returns:
+            int: Number of recipes updated
+        """
+        missing = {'ingredients': {'$elemMatch': {'name': {'$type': 'string'}, 'name_lc': {'$exists': False}}}}
+        updated = 0
+        operations = []
+        for recipe in collection.find(missing, {'ingredients': 1}):
+            original = [dict(ingredient) if isinstance(ingredient, dict) else ingredient
+                        for ingredient in recipe['ingredients']]
+            self._normalize_ingredient_names(recipe)
+            operations.append(UpdateOne({'_id': recipe['_id'], 'ingredients': original},
+                                        {'$set': {'ingredients': recipe['ingredients']}}))
+            if len(operations) >= batch_size:
+                updated += collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            updated += collection.bulk_write(operations, ordered=False).modified_count
+        
+        if updated:
+            logger.info("Backfilled ingredient name_lc on %s recipes", updated)
+        return updated
+
+    @staticmethod
+    def compute_complexity_metrics(recipe: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate the ingredient count, step count and overall complexity score of a recipe.
+        
+        Args:
+            recipe (Dict[str, Any]): Recipe document with 'ingredients' and 'instructions'
+            
+        Returns:
+            Dict[str, Any]: Complexity metrics as stored under 'complexity_metrics'
+        """
+        ingredient_count = len(recipe.get('ingredients') or [])
+        
+        # Count steps by analyzing instructions
+        instructions = recipe.get('instructions', '')
+        if isinstance(instructions, str):
+            # Count non-blank runs between newlines or periods to estimate steps
+            step_count = sum(1 for m in _STEP_SPLIT.finditer(instructions) if not m.group().isspace())
+        elif isinstance(instructions, list):
+            step_count = len(instructions)
+        else:
+            step_count = 0
+        
+        # Calculate complexity score: 0.6 * ingredient_count + 0.4 * step_count
+        complexity_score = 0.6 * ingredient_count + 0.4 * step_count
+        
+        return {
+            'ingredient_count': ingredient_count,
+            'step_count': step_count,
+            'complexity_score': round(complexity_score, 1)
+        }
+
+    def _build_update(self, entity: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the MongoDB update document for a recipe, refreshing derived fields.
+        Complexity metrics are recomputed when both ingredients and instructions are given,
+        and removed when only one of them changes so they are not left stale.
+        
+        Args:
+            entity (Dict[str, Any]): Recipe data to update, modified in place
+            
+        Returns:
+            Dict[str, Any]: Update document for update_one/UpdateOne
+        """
+        self._normalize_ingredient_names(entity)
+        
+        stale_metrics = False
+        if 'ingredients' in entity and 'instructions' in entity:
+            entity['complexity_metrics'] = self.compute_complexity_metrics(entity)
+        elif 'ingredients' in entity or 'instructions' in entity:
+            entity.pop('complexity_metrics', None)
+            stale_metrics = True
+        
+        update_data = entity.copy()
+        update_data.pop('_id', None)
+        update_data.pop('relational_id', None)
+        
+        update = {'$set': update_data}
+        if stale_metrics:
+            update['$unset'] = {'complexity_metrics': ''}
+        return update
+
     def get_relational_metadata(self, object_id: Union[str, ObjectId]) -> Optional[Dict[str, Any]]:
         """Get relational metadata for a recipe by its MongoDB ObjectId.
         
@@ -378,7 +678,7 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
                     cursor.execute(query, (str(object_id),))
                     return cursor.fetchone()
         except Exception as e:
-            logger.error(f"Error getting relational metadata for {object_id}: {e}")
+            logger.error("Error getting relational metadata for %s: %s", object_id, e)
             return None
     
     def sync_metadata_to_relational(self, recipe_doc: Dict[str, Any]) -> bool:
@@ -429,7 +729,7 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
                     return True
                     
         except Exception as e:
-            logger.error(f"Error syncing metadata for recipe {recipe_doc['_id']}: {e}")
+            logger.error("Error syncing metadata for recipe %s: %s", recipe_doc['_id'], e)
             return False
             
     def serialize(self, recipe_id: Union[str, ObjectId]) -> str:
@@ -452,3 +752,41 @@ class RecipeRepository(BaseRepository[Dict[str, Any]]):
         recipe_copy['_id'] = str(recipe_copy['_id'])
         
         return json.dumps(recipe_copy, indent=2)
+
+    def serialize_many(self, recipe_ids: List[Union[str, ObjectId]]) -> str:
+        """Export several recipes as a JSON array string, fetched with a single query.
+        
+        Args:
+            recipe_ids (List[Union[str, ObjectId]]): Recipe IDs, in the order to export them
+            
+        Returns:
+            str: JSON representation of the found recipes; IDs that do not exist are skipped
+        """
+        object_ids = [ObjectId(recipe_id) if isinstance(recipe_id, str) else recipe_id for recipe_id in recipe_ids]
+        
+        collection = self.mongo_connection_manager.get_collection('recipes')
+        recipes_by_id = {recipe['_id']: recipe for recipe in collection.find({'_id': {'$in': object_ids}})}
+        
+        missing = [str(object_id) for object_id in object_ids if object_id not in recipes_by_id]
+        if missing:
+            logger.warning("Recipes not found for export: %s", missing)
+        
+        recipes = []
+        for object_id in dict.fromkeys(object_ids):
+            recipe = recipes_by_id.get(object_id)
+            if recipe is not None:
+                recipe['_id'] = str(recipe['_id'])
+                recipes.append(recipe)
+        
+        return json_util.dumps(recipes, indent=2)
+
+
+@lru_cache(maxsize=1)
+def get_recipe_repository() -> RecipeRepository:
+    """Get the shared RecipeRepository.
+    Controllers share one repository instead of constructing their own.
+
+    Returns:
+        RecipeRepository: The shared repository instance
+    """
+    return RecipeRepository()
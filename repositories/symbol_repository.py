@@ -4,12 +4,19 @@ using the canonical/alias pattern.
 """
 
 import logging
-from typing import List, Optional, Set, Dict, Any, TypeVar
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Optional, Set, Dict, Any, TypeVar, Iterator
 
 from repositories.base import BaseRepository
+from repositories.cache import TTLCache
 from repositories.connection import MariaDBConnectionManager
 from models.symbol import Symbol, SymbolType
-from models.instruction import ActionArity
+from models.instruction import Action, ActionArity
+from models.equipment import Equipment
+from models.ingredient import Ingredient
+from models.measurement import Unit
 
 S = TypeVar('S', bound=Symbol)
 
@@ -49,11 +56,64 @@ class SymbolRepository(BaseRepository[S]):
                 try:
                     symbols.extend(self._get_symbols_by_type(symbol_type))
                 except Exception as e:
-                    logger.warning(f"Error retrieving symbols of type {symbol_type}: {e}")
+                    logger.warning("Error retrieving symbols of type %s: %s", symbol_type, e)
             return symbols
         else:
             return self._get_symbols_by_type(self.symbol_type)
         
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Symbol]:
+        """Iterate over all symbols of the repository's symbol type in ID order, fetched in batches.
+        If no symbol type is set, iterates over symbols of all types.
+        
+        Batches are read with keyset pagination (WHERE id > last ID) rather than an unbuffered
+        cursor, since the shared connection must stay usable while the caller consumes the iterator.
+        
+        Args:
+            batch_size (int, optional): Number of rows fetched per query. Defaults to 1000.
+            
+        Yields:
+            Symbol: Each symbol in turn
+        """
+        symbol_types = [self.symbol_type] if self.symbol_type else list(SymbolType)
+        
+        for symbol_type in symbol_types:
+            table_name = self._get_table_name_for_type(symbol_type)
+            if not table_name:
+                continue
+            
+            last_id = None
+            while True:
+                with self.connection_manager.get_connection() as connection:
+                    with connection.cursor() as cursor:
+                        if last_id is None:
+                            query = f"SELECT * FROM {table_name}_canonical ORDER BY id LIMIT %s"
+                            cursor.execute(query, (batch_size,))
+                        else:
+                            query = f"SELECT * FROM {table_name}_canonical WHERE id > %s ORDER BY id LIMIT %s"
+                            cursor.execute(query, (last_id, batch_size))
+                        rows = cursor.fetchall()
+                
+                if not rows:
+                    break
+                
+                batch_ids = [row['id'] for row in rows]
+                identities_by_id = self._get_identities_by_symbol(symbol_type, batch_ids)
+                properties_by_id = self._get_properties_by_symbol(symbol_type, batch_ids)
+                
+                for row in rows:
+                    symbol = self._map_to_symbol(
+                        row,
+                        symbol_type,
+                        identities=identities_by_id.get(row['id'], set()),
+                        properties=properties_by_id.get(row['id'], {})
+                    )
+                    if symbol:
+                        yield symbol
+                
+                if len(rows) < batch_size:
+                    break
+                last_id = batch_ids[-1]
+
     def get_by_id(self, symbol_id: int) -> Optional[Symbol]:
         """Retrieve a symbol by its database ID.
         
@@ -72,6 +132,28 @@ class SymbolRepository(BaseRepository[S]):
                 return symbol       
         return None
     
+    def get_by_ids(self, symbol_ids: List[int]) -> Dict[int, Symbol]:
+        """Retrieve several symbols by their database IDs, with one query per symbol type searched.
+        If no symbol type is set, IDs not found in one type's table are looked up in the next,
+        matching get_by_id.
+        
+        Args:
+            symbol_ids (List[int]): The database IDs of the symbols
+            
+        Returns:
+            Dict[int, Symbol]: Found symbols keyed by ID; missing IDs are omitted
+        """
+        symbols = {}
+        remaining = list(dict.fromkeys(symbol_ids))
+        symbol_types = [self.symbol_type] if self.symbol_type else list(SymbolType)
+        
+        for symbol_type in symbol_types:
+            if not remaining:
+                break
+            symbols.update(self._get_symbols_by_ids_and_type(remaining, symbol_type))
+            remaining = [symbol_id for symbol_id in remaining if symbol_id not in symbols]
+        return symbols
+    
     def _get_symbols_by_type(self, symbol_type: SymbolType) -> List[Symbol]:
         """Retrieve all symbols of a specific type.
 
@@ -83,7 +165,7 @@ class SymbolRepository(BaseRepository[S]):
         """
         table_name = self._get_table_name_for_type(symbol_type)
         if not table_name:
-            logger.warning(f"No table mapping found for symbol type: {symbol_type}")
+            logger.warning("No table mapping found for symbol type: %s", symbol_type)
             return []
     
         symbols = []
@@ -93,14 +175,23 @@ class SymbolRepository(BaseRepository[S]):
                     query = f"SELECT * FROM {table_name}_canonical ORDER BY name"
                     cursor.execute(query)
                     rows = cursor.fetchall()
-                    
-                    for row in rows:
-                        symbol = self._map_to_symbol(row, symbol_type)
-                        if symbol:
-                            symbols.append(symbol)
+            
+            # Load identities and properties for the whole type up front instead of per row
+            identities_by_id = self._get_identities_by_symbol(symbol_type)
+            properties_by_id = self._get_properties_by_symbol(symbol_type)
+            
+            for row in rows:
+                symbol = self._map_to_symbol(
+                    row,
+                    symbol_type,
+                    identities=identities_by_id.get(row['id'], set()),
+                    properties=properties_by_id.get(row['id'], {})
+                )
+                if symbol:
+                    symbols.append(symbol)
                         
         except Exception as e:
-            logger.error(f"Error retrieving symbols of type {symbol_type}: {e}")
+            logger.error("Error retrieving symbols of type %s: %s", symbol_type, e)
         
         return symbols
 
@@ -123,7 +214,7 @@ class SymbolRepository(BaseRepository[S]):
                             WHERE si.symbol_type = %s
                             ORDER BY si.identity_name
                         """
-                        cursor.execute(query, (self.symbol_type.value.upper(),))
+                        cursor.execute(query, (self.symbol_type.name,))
                     else:
                         query = """
                             SELECT DISTINCT identity_name
@@ -136,7 +227,7 @@ class SymbolRepository(BaseRepository[S]):
                         identities.append(row['identity_name'])
                         
         except Exception as e:
-            logger.error(f"Error retrieving identities for type {self.symbol_type}: {e}")
+            logger.error("Error retrieving identities for type %s: %s", self.symbol_type, e)
             
         return identities
     
@@ -159,7 +250,7 @@ class SymbolRepository(BaseRepository[S]):
                             WHERE sp.symbol_type = %s
                             ORDER BY sp.property_key
                         """
-                        cursor.execute(query, (self.symbol_type.value.upper(),))
+                        cursor.execute(query, (self.symbol_type.name,))
                     else:
                         query = """
                             SELECT DISTINCT property_key
@@ -172,7 +263,7 @@ class SymbolRepository(BaseRepository[S]):
                         properties.append(row['property_key'])
                         
         except Exception as e:
-            logger.error(f"Error retrieving properties for type {self.symbol_type}: {e}")
+            logger.error("Error retrieving properties for type %s: %s", self.symbol_type, e)
             
         return properties
 
@@ -195,8 +286,8 @@ class SymbolRepository(BaseRepository[S]):
                             WHERE symbol_type = %s
                             ORDER BY property_key, property_value
                         """
-                        symbol_type_val = self.symbol_type.value.upper()
-                        logger.debug(f"Executing query with symbol_type={symbol_type_val}: {query}")
+                        symbol_type_val = self.symbol_type.name
+                        logger.debug("Executing query with symbol_type=%s: %s", symbol_type_val, query)
                         cursor.execute(query, (symbol_type_val,))
                     else:
                         query = """
@@ -204,7 +295,7 @@ class SymbolRepository(BaseRepository[S]):
                             FROM symbol_properties
                             ORDER BY property_key, property_value
                         """
-                        logger.debug(f"Executing query: {query}")
+                        logger.debug("Executing query: %s", query)
                         cursor.execute(query)
                     
                     for row in cursor.fetchall():
@@ -215,13 +306,89 @@ class SymbolRepository(BaseRepository[S]):
                         if value is not None:
                             property_values[key].append(value)
                         
-            logger.debug(f"Retrieved property values: {property_values}")
+            logger.debug("Retrieved property values: %s", property_values)
                         
         except Exception as e:
-            logger.error(f"Error retrieving property values for type {self.symbol_type}: {e}")
+            logger.error("Error retrieving property values for type %s: %s", self.symbol_type, e)
             
         return property_values
 
+    def count_by_identity(self) -> Dict[str, int]:
+        """Count symbols per identity, grouped in the database.
+        If no symbol type is set, counts symbols of all types.
+        
+        Returns:
+            Dict[str, int]: Dictionary with identity names as keys and symbol counts as values
+        """
+        counts = {}
+        
+        try:
+            with self.connection_manager.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    if self.symbol_type:
+                        query = """
+                            SELECT si.identity_name, COUNT(*) AS symbol_count
+                            FROM symbol_identity_mapping sim
+                            JOIN symbol_identities si ON sim.identity_id = si.id
+                            WHERE sim.symbol_type = %s
+                            GROUP BY si.identity_name
+                        """
+                        cursor.execute(query, (self.symbol_type.name,))
+                    else:
+                        query = """
+                            SELECT si.identity_name, COUNT(*) AS symbol_count
+                            FROM symbol_identity_mapping sim
+                            JOIN symbol_identities si ON sim.identity_id = si.id
+                            GROUP BY si.identity_name
+                        """
+                        cursor.execute(query)
+                    
+                    for row in cursor.fetchall():
+                        counts[row['identity_name']] = row['symbol_count']
+                        
+        except Exception as e:
+            logger.error("Error counting symbols by identity for type %s: %s", self.symbol_type, e)
+            
+        return counts
+
+    def count_symbols(self, without_identity: bool = False) -> int:
+        """Count symbols of the repository's symbol type in the database.
+        If no symbol type is set, counts symbols of all types.
+        
+        Args:
+            without_identity (bool, optional): Only count symbols that have no identity mapping. Defaults to False.
+            
+        Returns:
+            int: Number of matching symbols
+        """
+        symbol_types = [self.symbol_type] if self.symbol_type else list(SymbolType)
+        total = 0
+        
+        try:
+            with self.connection_manager.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    for symbol_type in symbol_types:
+                        table_name = self._get_table_name_for_type(symbol_type)
+                        if without_identity:
+                            query = f"""
+                                SELECT COUNT(*) AS symbol_count
+                                FROM {table_name}_canonical c
+                                WHERE NOT EXISTS (
+                                    SELECT 1 FROM symbol_identity_mapping sim
+                                    WHERE sim.symbol_id = c.id AND sim.symbol_type = %s
+                                )
+                            """
+                            cursor.execute(query, (symbol_type.name,))
+                        else:
+                            query = f"SELECT COUNT(*) AS symbol_count FROM {table_name}_canonical"
+                            cursor.execute(query)
+                        total += cursor.fetchone()['symbol_count']
+                        
+        except Exception as e:
+            logger.error("Error counting symbols for type %s: %s", self.symbol_type, e)
+            
+        return total
+
     # Search Operations
     def find_symbols_by_name(self, name: str) -> List[Symbol]:
         """Find symbols by name.
@@ -239,16 +406,75 @@ class SymbolRepository(BaseRepository[S]):
             try:
                 symbols.extend(self._search_symbols_in_tables(name, self.symbol_type))
             except Exception as e:
-                logger.warning(f"Error searching symbols of type {self.symbol_type}: {e}")
+                logger.warning("Error searching symbols of type %s: %s", self.symbol_type, e)
         else:
             for symbol_type in SymbolType:
                 try:
                     symbols.extend(self._search_symbols_in_tables(name, symbol_type))
                 except Exception as e:
-                    logger.warning(f"Error searching symbols of type {symbol_type}: {e}")
+                    logger.warning("Error searching symbols of type %s: %s", symbol_type, e)
 
         return symbols
 
+    def find_by_identities(self, identities: List[str]) -> Dict[str, List[Symbol]]:
+        """Find symbols of the repository's symbol type having any of the given identities,
+        using a single query for all identities.
+        
+        Args:
+            identities (List[str]): Identity names to search for (e.g., ["VOLUME", "MASS"])
+            
+        Returns:
+            Dict[str, List[Symbol]]: Dictionary with each requested identity as key and its matching symbols as value
+        """
+        buckets = {identity: [] for identity in identities}
+        table_name = self._get_table_name_for_type(self.symbol_type) if self.symbol_type else ''
+        
+        if not table_name or not identities:
+            return buckets
+        
+        try:
+            with self.connection_manager.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    placeholders = ','.join(['%s'] * len(identities))
+                    query = f"""
+                        SELECT c.*, si.identity_name AS matched_identity
+                        FROM {table_name}_canonical c
+                        JOIN symbol_identity_mapping sim ON sim.symbol_id = c.id AND sim.symbol_type = %s
+                        JOIN symbol_identities si ON sim.identity_id = si.id
+                        WHERE si.identity_name IN ({placeholders})
+                        ORDER BY c.name
+                    """
+                    cursor.execute(query, [self.symbol_type.name] + list(identities))
+                    rows = cursor.fetchall()
+            
+            if not rows:
+                return buckets
+            # Only load identities and properties of the matched symbols, not the whole type
+            matched_ids = list(dict.fromkeys(row['id'] for row in rows))
+            identities_by_id = self._get_identities_by_symbol(self.symbol_type, matched_ids)
+            properties_by_id = self._get_properties_by_symbol(self.symbol_type, matched_ids)
+            
+            # A symbol with several requested identities is mapped once and shared between buckets
+            symbols_by_id = {}
+            for row in rows:
+                symbol = symbols_by_id.get(row['id'])
+                if symbol is None:
+                    symbol = self._map_to_symbol(
+                        row,
+                        self.symbol_type,
+                        identities=identities_by_id.get(row['id'], set()),
+                        properties=properties_by_id.get(row['id'], {})
+                    )
+                    if not symbol:
+                        continue
+                    symbols_by_id[row['id']] = symbol
+                buckets[row['matched_identity']].append(symbol)
+                
+        except Exception as e:
+            logger.error("Error finding symbols by identities %s for type %s: %s", identities, self.symbol_type, e)
+            
+        return buckets
+
     def find_identities_by_name(self, name_pattern: str) -> List[str]:
         """Find identities by name pattern.
         
@@ -270,7 +496,7 @@ class SymbolRepository(BaseRepository[S]):
                             WHERE si.symbol_type = %s AND si.identity_name LIKE %s
                             ORDER BY si.identity_name
                         """
-                        cursor.execute(query, (self.symbol_type.value.upper(), f"%{name_pattern}%"))
+                        cursor.execute(query, (self.symbol_type.name, f"%{name_pattern}%"))
                     else:
                         query = """
                             SELECT DISTINCT identity_name
@@ -284,7 +510,7 @@ class SymbolRepository(BaseRepository[S]):
                         identities.append(row['identity_name'])
                         
         except Exception as e:
-            logger.error(f"Error finding identities by pattern '{name_pattern}' for type {self.symbol_type}: {e}")
+            logger.error("Error finding identities by pattern '%s' for type %s: %s", name_pattern, self.symbol_type, e)
             
         return identities
     
@@ -309,7 +535,7 @@ class SymbolRepository(BaseRepository[S]):
                             WHERE sp.symbol_type = %s AND sp.property_key LIKE %s
                             ORDER BY sp.property_key
                         """
-                        cursor.execute(query, (self.symbol_type.value.upper(), f"%{name_pattern}%"))
+                        cursor.execute(query, (self.symbol_type.name, f"%{name_pattern}%"))
                     else:
                         query = """
                             SELECT DISTINCT property_key
@@ -323,7 +549,7 @@ class SymbolRepository(BaseRepository[S]):
                         properties.append(row['property_key'])
                         
         except Exception as e:
-            logger.error(f"Error finding properties by pattern '{name_pattern}' for type {self.symbol_type}: {e}")
+            logger.error("Error finding properties by pattern '%s' for type %s: %s", name_pattern, self.symbol_type, e)
             
         return properties
 
@@ -352,9 +578,8 @@ class SymbolRepository(BaseRepository[S]):
                         
                     # Insert into canonical table with type-specific columns
                     if entity_type == SymbolType.ACTION:
-                        arity_value = None
-                        if hasattr(entity, 'arity') and getattr(entity, 'arity'):
-                            arity_value = getattr(entity, 'arity').value.upper()
+                        arity = getattr(entity, 'arity', None)
+                        arity_value = arity.name if arity else None
                         
                         query = f"""
                             INSERT INTO {table_name}_canonical
@@ -386,12 +611,14 @@ class SymbolRepository(BaseRepository[S]):
                     # Add identities and properties if present
                     self._create_identities_and_properties(entity)
                     
-                    logger.info(f"Created symbol {entity.name} with ID {entity.entity_id}")
+                    logger.info("Created symbol %s with ID %s", entity.name, entity.entity_id)
                     return entity
                     
         except Exception as e:
-            logger.error(f"Error creating symbol {entity.name}: {e}")
+            logger.error("Error creating symbol %s: %s", entity.name, e)
             return None
+        finally:
+            _invalidate_symbol_caches(entity_type)
     
     def update(self, entity: Symbol) -> Optional[Symbol]:
         """Update an existing symbol.
@@ -423,9 +650,8 @@ class SymbolRepository(BaseRepository[S]):
                         
                     # Update canonical table with type-specific columns
                     if entity_type == SymbolType.ACTION:
-                        arity_value = None
-                        if hasattr(entity, 'arity') and getattr(entity, 'arity'):
-                            arity_value = getattr(entity, 'arity').value.upper()
+                        arity = getattr(entity, 'arity', None)
+                        arity_value = arity.name if arity else None
                         
                         query = f"""
                             UPDATE {table_name}_canonical
@@ -446,15 +672,17 @@ class SymbolRepository(BaseRepository[S]):
                     if cursor.rowcount > 0:
                         # Update identities and properties
                         self._update_identities_and_properties(entity)
-                        logger.info(f"Updated symbol {entity.entity_id}")
+                        logger.info("Updated symbol %s", entity.entity_id)
                         return entity
                     else:
-                        logger.warning(f"No symbol found with ID {entity.entity_id}")
+                        logger.warning("No symbol found with ID %s", entity.entity_id)
                         return None
                     
         except Exception as e:
-            logger.error(f"Error updating symbol {entity.entity_id}: {e}")
+            logger.error("Error updating symbol %s: %s", entity.entity_id, e)
             return None
+        finally:
+            _invalidate_symbol_caches(entity_type)
     
     def delete(self, entity_id: int) -> bool:
         """Delete a symbol.
@@ -486,23 +714,26 @@ class SymbolRepository(BaseRepository[S]):
                         cursor.execute(query, (entity_id,))
                         
                         if cursor.fetchone():
-                            # Delete mappings first
-                            self._delete_identities_and_properties(entity_id, symbol_type)
-                            
-                            # Delete from canonical table (cascading will handle aliases)
-                            query = f"""
-                                DELETE FROM {table_name}_canonical
-                                WHERE id = %s
-                            """
-                            cursor.execute(query, (entity_id,))
-                            
-                            connection.commit()
+                            try:
+                                # Delete mappings first
+                                self._delete_identities_and_properties(entity_id, symbol_type)
+                                
+                                # Delete from canonical table (cascading will handle aliases)
+                                query = f"""
+                                    DELETE FROM {table_name}_canonical
+                                    WHERE id = %s
+                                """
+                                cursor.execute(query, (entity_id,))
+                                
+                                connection.commit()
+                            finally:
+                                _invalidate_symbol_caches(symbol_type)
                             if cursor.rowcount > 0:
                                 success = True
-                                logger.info(f"Deleted symbol {entity_id} of type {symbol_type.value}")
+                                logger.info("Deleted symbol %s of type %s", entity_id, symbol_type.name)
                                 break
             except Exception as e:
-                logger.error(f"Error deleting from {table_name}: {e}")
+                logger.error("Error deleting from %s: %s", table_name, e)
                 
         return success
 
@@ -533,7 +764,7 @@ class SymbolRepository(BaseRepository[S]):
                 if key == 'arity' and symbol_type == SymbolType.ACTION:
                     if isinstance(value, ActionArity):
                         where_parts.append("arity = %s")
-                        query_params.append(value.value.upper())
+                        query_params.append(value.name)
                     else:
                         where_parts.append("arity = %s")
                         query_params.append(str(value).upper())
@@ -557,16 +788,22 @@ class SymbolRepository(BaseRepository[S]):
                         if symbol:
                             results.append(symbol)
         except Exception as e:
-            logger.error(f"Error finding symbols in table {table_name}: {e}")
+            logger.error("Error finding symbols in table %s: %s", table_name, e)
                 
         return results
         
-    def _map_to_symbol(self, row: Dict[str, Any], symbol_type: SymbolType) -> Optional[Symbol]:
+    def _map_to_symbol(self,
+                       row: Dict[str, Any],
+                       symbol_type: SymbolType,
+                       identities: Optional[Set[str]] = None,
+                       properties: Optional[Dict[str, Any]] = None) -> Optional[Symbol]:
         """Map a database row to a Symbol object.
         
         Args:
             row (Dict[str, Any]): Database row
             symbol_type (SymbolType): Type of symbol
+            identities (Optional[Set[str]], optional): Preloaded identities; queried per row if None. Defaults to None.
+            properties (Optional[Dict[str, Any]], optional): Preloaded properties; queried per row if None. Defaults to None.
             
         Returns:
             Optional[Symbol]: Mapped concrete Symbol subclass instance
@@ -580,19 +817,20 @@ class SymbolRepository(BaseRepository[S]):
             elif not isinstance(description, str):
                 description = str(description)
                 
-            # Get identities and properties from mapping tables
-            identities = self._get_identities(row['id'], symbol_type)
-            properties = self._get_properties(row['id'], symbol_type)
+            # Get identities and properties from mapping tables unless preloaded
+            if identities is None:
+                identities = self._get_identities(row['id'], symbol_type)
+            if properties is None:
+                properties = self._get_properties(row['id'], symbol_type)
             
             # Create the appropriate symbol subclass based on type
             if symbol_type == SymbolType.ACTION:
-                from models.instruction import Action, ActionArity
                 arity = None
                 if 'arity' in row and row['arity']:
                     try:
-                        arity = ActionArity(row['arity'].lower())
+                        arity = ActionArity[row['arity'].upper()]
                     except (ValueError, KeyError) as e:
-                        logger.warning(f"Invalid arity value '{row['arity']}': {e}")
+                        logger.warning("Invalid arity value '%s': %s", row['arity'], e)
                         # Try to recover with default
                         try:
                             arity = ActionArity.VARIABLE
@@ -608,7 +846,6 @@ class SymbolRepository(BaseRepository[S]):
                     arity=arity
                 )
             elif symbol_type == SymbolType.EQUIPMENT:
-                from models.equipment import Equipment
                 return Equipment(
                     name=name,
                     entity_id=row['id'],
@@ -617,7 +854,6 @@ class SymbolRepository(BaseRepository[S]):
                     description=description
                 )
             elif symbol_type == SymbolType.INGREDIENT:
-                from models.ingredient import Ingredient
                 return Ingredient(
                     name=name,
                     entity_id=row['id'],
@@ -626,7 +862,6 @@ class SymbolRepository(BaseRepository[S]):
                     description=description
                 )
             elif symbol_type == SymbolType.UNIT:
-                from models.measurement import Unit
                 return Unit(
                     name=name,
                     entity_id=row['id'],
@@ -635,11 +870,11 @@ class SymbolRepository(BaseRepository[S]):
                     description=description
                 )
             else:
-                logger.error(f"Unknown symbol type: {symbol_type}")
+                logger.error("Unknown symbol type: %s", symbol_type)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error mapping symbol row for {row.get('id', 'unknown')}: {e}")
+            logger.error("Error mapping symbol row for %s: %s", row.get('id', 'unknown'), e)
             return None
     
     def _get_identities(self, symbol_id: int, symbol_type: SymbolType) -> Set[str]:
@@ -655,12 +890,12 @@ class SymbolRepository(BaseRepository[S]):
                         JOIN symbol_identities si ON sim.identity_id = si.id
                         WHERE sim.symbol_id = %s AND sim.symbol_type = %s
                     """
-                    cursor.execute(query, (symbol_id, symbol_type.value.upper()))
+                    cursor.execute(query, (symbol_id, symbol_type.name))
                     
                     for row in cursor.fetchall():
-                        identities.add(row['identity_name'])
+                        identities.add(sys.intern(row['identity_name']))
         except Exception as e:
-            logger.debug(f"Error getting identities for symbol {symbol_id}: {e}")
+            logger.debug("Error getting identities for symbol %s: %s", symbol_id, e)
                 
         return identities
     
@@ -677,12 +912,68 @@ class SymbolRepository(BaseRepository[S]):
                         JOIN symbol_properties sp ON spm.property_id = sp.id
                         WHERE spm.symbol_id = %s AND sp.symbol_type = %s
                     """
-                    cursor.execute(query, (symbol_id, symbol_type.value.upper()))
+                    cursor.execute(query, (symbol_id, symbol_type.name))
+                    
+                    for row in cursor.fetchall():
+                        properties[sys.intern(row['property_key'])] = row['property_value']
+        except Exception as e:
+            logger.debug("Error getting properties for symbol %s: %s", symbol_id, e)
+            
+        return properties
+
+    def _get_identities_by_symbol(self,
+                                  symbol_type: SymbolType,
+                                  symbol_ids: Optional[List[int]] = None) -> Dict[int, Set[str]]:
+        """Get identities for every symbol of a type, or only the given symbols, in a single query."""
+        identities = defaultdict(set)
+        
+        try:
+            with self.connection_manager.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    query = """
+                        SELECT sim.symbol_id, si.identity_name
+                        FROM symbol_identity_mapping sim
+                        JOIN symbol_identities si ON sim.identity_id = si.id
+                        WHERE sim.symbol_type = %s
+                    """
+                    params = [symbol_type.name]
+                    if symbol_ids is not None:
+                        query += f" AND sim.symbol_id IN ({','.join(['%s'] * len(symbol_ids))})"
+                        params.extend(symbol_ids)
+                    cursor.execute(query, params)
+                    
+                    for row in cursor.fetchall():
+                        identities[row['symbol_id']].add(sys.intern(row['identity_name']))
+        except Exception as e:
+            logger.debug("Error getting identities for symbol type %s: %s", symbol_type, e)
+                
+        return identities
+    
+    def _get_properties_by_symbol(self,
+                                  symbol_type: SymbolType,
+                                  symbol_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, Any]]:
+        """Get properties for every symbol of a type, or only the given symbols, in a single query."""
+        properties = defaultdict(dict)
+        
+        try:
+            with self.connection_manager.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    query = """
+                        SELECT spm.symbol_id, sp.property_key, sp.property_value
+                        FROM symbol_property_mapping spm
+                        JOIN symbol_properties sp ON spm.property_id = sp.id
+                        WHERE sp.symbol_type = %s
+                    """
+                    params = [symbol_type.name]
+                    if symbol_ids is not None:
+                        query += f" AND spm.symbol_id IN ({','.join(['%s'] * len(symbol_ids))})"
+                        params.extend(symbol_ids)
+                    cursor.execute(query, params)
                     
                     for row in cursor.fetchall():
-                        properties[row['property_key']] = row['property_value']
+                        properties[row['symbol_id']][sys.intern(row['property_key'])] = row['property_value']
         except Exception as e:
-            logger.debug(f"Error getting properties for symbol {symbol_id}: {e}")
+            logger.debug("Error getting properties for symbol type %s: %s", symbol_type, e)
             
         return properties
 
@@ -711,7 +1002,7 @@ class SymbolRepository(BaseRepository[S]):
                             INSERT IGNORE INTO symbol_identity_mapping 
                             (symbol_id, symbol_type, identity_id)
                             VALUES (%s, %s, %s)
-                        """, (entity.entity_id, entity_type.value.upper(), identity_id))
+                        """, (entity.entity_id, entity_type.name, identity_id))
                     
                     # Create properties
                     for key, value in entity.properties.items():
@@ -732,11 +1023,11 @@ class SymbolRepository(BaseRepository[S]):
                             INSERT IGNORE INTO symbol_property_mapping 
                             (symbol_id, symbol_type, property_id)
                             VALUES (%s, %s, %s)
-                        """, (entity.entity_id, entity_type.value.upper(), property_id))
+                        """, (entity.entity_id, entity_type.name, property_id))
                     
                     connection.commit()
         except Exception as e:
-            logger.error(f"Error creating identities and properties for symbol {entity.entity_id}: {e}")
+            logger.error("Error creating identities and properties for symbol %s: %s", entity.entity_id, e)
 
     def _update_identities_and_properties(self, entity: Symbol) -> None:
         """Update identity and property mappings for a symbol."""
@@ -749,12 +1040,12 @@ class SymbolRepository(BaseRepository[S]):
                     cursor.execute("""
                         DELETE FROM symbol_identity_mapping 
                         WHERE symbol_id = %s AND symbol_type = %s
-                    """, (entity.entity_id, entity_type.value.upper()))
+                    """, (entity.entity_id, entity_type.name))
                     
                     cursor.execute("""
                         DELETE FROM symbol_property_mapping 
                         WHERE symbol_id = %s AND symbol_type = %s
-                    """, (entity.entity_id, entity_type.value.upper()))
+                    """, (entity.entity_id, entity_type.name))
                     
                     connection.commit()
                     
@@ -762,7 +1053,7 @@ class SymbolRepository(BaseRepository[S]):
                     self._create_identities_and_properties(entity)
                     
         except Exception as e:
-            logger.error(f"Error updating identities and properties for symbol {entity.entity_id}: {e}")
+            logger.error("Error updating identities and properties for symbol %s: %s", entity.entity_id, e)
 
     def _delete_identities_and_properties(self, symbol_id: int, symbol_type: SymbolType) -> None:
         """Delete identity and property mappings for a symbol."""
@@ -772,15 +1063,15 @@ class SymbolRepository(BaseRepository[S]):
                     cursor.execute("""
                         DELETE FROM symbol_identity_mapping 
                         WHERE symbol_id = %s AND symbol_type = %s
-                    """, (symbol_id, symbol_type.value.upper()))
+                    """, (symbol_id, symbol_type.name))
                     
                     cursor.execute("""
                         DELETE FROM symbol_property_mapping 
                         WHERE symbol_id = %s AND symbol_type = %s
-                    """, (symbol_id, symbol_type.value.upper()))
+                    """, (symbol_id, symbol_type.name))
                     
         except Exception as e:
-            logger.error(f"Error deleting identities and properties for symbol {symbol_id}: {e}")
+            logger.error("Error deleting identities and properties for symbol %s: %s", symbol_id, e)
 
     def _get_symbol_by_id_and_type(self, symbol_id: int, symbol_type: SymbolType) -> Optional[Symbol]:
         """Get a symbol by ID from a specific symbol type table."""
@@ -797,9 +1088,45 @@ class SymbolRepository(BaseRepository[S]):
                     return self._map_to_symbol(row, symbol_type) if row else None
                         
         except Exception as e:
-            logger.error(f"Error retrieving symbol {symbol_id} of type {symbol_type}: {e}")
+            logger.error("Error retrieving symbol %s of type %s: %s", symbol_id, symbol_type, e)
             return None
         
+    def _get_symbols_by_ids_and_type(self, symbol_ids: List[int], symbol_type: SymbolType) -> Dict[int, Symbol]:
+        """Get symbols by ID from a specific symbol type table in a single query."""
+        symbols = {}
+        table_name = self._get_table_name_for_type(symbol_type)
+        if not table_name or not symbol_ids:
+            return symbols
+            
+        try:
+            with self.connection_manager.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    placeholders = ','.join(['%s'] * len(symbol_ids))
+                    query = f"SELECT * FROM {table_name}_canonical WHERE id IN ({placeholders})"
+                    cursor.execute(query, list(symbol_ids))
+                    rows = cursor.fetchall()
+            
+            if not rows:
+                return symbols
+            found_ids = [row['id'] for row in rows]
+            identities_by_id = self._get_identities_by_symbol(symbol_type, found_ids)
+            properties_by_id = self._get_properties_by_symbol(symbol_type, found_ids)
+            
+            for row in rows:
+                symbol = self._map_to_symbol(
+                    row,
+                    symbol_type,
+                    identities=identities_by_id.get(row['id'], set()),
+                    properties=properties_by_id.get(row['id'], {})
+                )
+                if symbol:
+                    symbols[row['id']] = symbol
+                        
+        except Exception as e:
+            logger.error("Error retrieving symbols %s of type %s: %s", symbol_ids, symbol_type, e)
+            
+        return symbols
+        
     def _get_table_name_for_type(self, symbol_type: SymbolType) -> str:
         """Convert symbol type enum to corresponding database table name.
             
@@ -889,6 +1216,45 @@ class SymbolRepository(BaseRepository[S]):
                             symbols.append(symbol)
                             
         except Exception as e:
-            logger.error(f"Error searching symbols for '{name}' of type {symbol_type}: {e}")
+            logger.error("Error searching symbols for '%s' of type %s: %s", name, symbol_type, e)
             
         return symbols
+
+
+@lru_cache(maxsize=None)
+def get_symbol_repository(symbol_type: Optional[SymbolType] = None) -> SymbolRepository:
+    """Get the shared SymbolRepository for a symbol type.
+    Controllers share one repository per type instead of constructing their own.
+
+    Args:
+        symbol_type (Optional[SymbolType], optional): The type of symbol the repository handles. Defaults to None.
+
+    Returns:
+        SymbolRepository: The shared repository instance
+    """
+    return SymbolRepository(symbol_type)
+
+
+@lru_cache(maxsize=None)
+def get_symbol_cache(symbol_type: Optional[SymbolType] = None) -> TTLCache:
+    """Get the shared read cache for a symbol type.
+    Controllers cache query results here instead of per instance. Every SymbolRepository clears the
+    cache of the written type, and the untyped (None) cache, after each create, update or delete,
+    so no controller keeps serving symbols written through another controller or repository.
+    Cached values are shared between callers and must not be modified.
+
+    Args:
+        symbol_type (Optional[SymbolType], optional): The symbol type cached, or None for
+            lookups not tied to a type. Defaults to None.
+
+    Returns:
+        TTLCache: The shared cache
+    """
+    return TTLCache(maxsize=512, ttl=60)
+
+
+def _invalidate_symbol_caches(symbol_type: Optional[SymbolType]) -> None:
+    """Clear the shared caches a write to a symbol type can make stale."""
+    if symbol_type is not None:
+        get_symbol_cache(symbol_type).clear()
+    get_symbol_cache(None).clear()
@@ -0,0 +1,114 @@
+"""
+Cache tests
+
+Covers the TTLCache used by repositories and controllers to cache read-mostly data.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from repositories import cache as cache_module
+from repositories.cache import TTLCache
+
+
+class FakeClock:
+    """Stands in for time.monotonic so expiry can be tested without sleeping."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, 'monotonic', fake)
+    return fake
+
+
+# TTLCache
+def test_cache_get_and_set():
+    cache = TTLCache()
+    cache['a'] = 1
+
+    assert cache.get('a') == 1
+    assert cache.get('missing') is None
+    assert cache.get('missing', 'default') == 'default'
+    assert len(cache) == 1
+
+
+def test_cache_stores_falsy_values():
+    cache = TTLCache()
+    cache['empty'] = []
+
+    assert cache.get('empty', 'default') == []
+
+
+def test_cache_entries_expire_after_ttl(clock):
+    cache = TTLCache(ttl=60)
+    cache['a'] = 1
+
+    clock.now += 59
+    assert cache.get('a') == 1
+
+    clock.now += 1
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_cache_without_ttl_never_expires(clock):
+    cache = TTLCache()
+    cache['a'] = 1
+
+    clock.now += 10 ** 9
+
+    assert cache.get('a') == 1
+
+
+def test_cache_overwrite_restarts_ttl(clock):
+    cache = TTLCache(ttl=60)
+    cache['a'] = 1
+    clock.now += 50
+    cache['a'] = 2
+    clock.now += 50
+
+    assert cache.get('a') == 2
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache.get('a')
+    cache['c'] = 3
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+
+def test_cache_pop():
+    cache = TTLCache()
+    cache['a'] = 1
+
+    assert cache.pop('a') == 1
+    assert cache.get('a') is None
+    assert cache.pop('a') is None
+    assert cache.pop('a', 'default') == 'default'
+
+
+def test_cache_clear():
+    cache = TTLCache()
+    cache['a'] = 1
+    cache['b'] = 2
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get('a') is None
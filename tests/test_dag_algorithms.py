@@ -0,0 +1,363 @@
+"""
+Recipe DAG algorithm tests
+
+Covers ordering, cycle rejection, closure caching, bulk construction from edges
+and the columnar rollups on small chain, diamond and cyclic graphs.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from models.duration import DurationAbs
+from models.instruction import Action, Instruction
+from models.measurement import Unit
+from models.recipe import Recipe
+
+MINUTE = Unit("minute")
+
+
+def make_instructions(count, durations=None):
+    """Create unconnected instructions with IDs 0..count-1."""
+    action = Action("mix")
+    durations = durations or {}
+    return [
+        Instruction(i, action, duration=DurationAbs(durations[i], MINUTE) if i in durations else None)
+        for i in range(count)
+    ]
+
+
+def make_chain(count):
+    """Create instructions 0 -> 1 -> ... -> count-1 linked with add_prerequisite."""
+    instructions = make_instructions(count)
+    for prev, curr in zip(instructions, instructions[1:]):
+        curr.add_prerequisite(prev)
+    return instructions
+
+
+def make_diamond(durations=None):
+    """Create the diamond 0 -> {1, 2} -> 3 linked with add_prerequisite."""
+    instructions = make_instructions(4, durations)
+    top, left, right, bottom = instructions
+    left.add_prerequisite(top)
+    right.add_prerequisite(top)
+    bottom.add_prerequisite(left)
+    bottom.add_prerequisite(right)
+    return instructions
+
+
+def ids(instructions):
+    return [instruction.instruction_id for instruction in instructions]
+
+
+def assert_topological(order, instructions):
+    position = {instruction: index for index, instruction in enumerate(order)}
+    assert set(order) == set(instructions)
+    for instruction in instructions:
+        for prerequisite in instruction.prerequisites:
+            assert position[prerequisite] < position[instruction]
+
+
+# Topological order and DAG validation
+def test_chain_topological_order():
+    instructions = make_chain(5)
+    recipe = Recipe(1, "chain", reversed(instructions))
+
+    assert ids(recipe.get_topological_order()) == [0, 1, 2, 3, 4]
+    assert recipe.validate_dag_structure()
+
+
+def test_diamond_topological_order():
+    instructions = make_diamond()
+    recipe = Recipe(1, "diamond", instructions)
+
+    order = recipe.get_topological_order()
+    assert_topological(order, instructions)
+    assert order[0].instruction_id == 0 and order[-1].instruction_id == 3
+
+
+def test_topological_order_breaks_ties_by_insertion_order():
+    instructions = make_instructions(3)
+    recipe = Recipe(1, "independent", [instructions[2], instructions[0], instructions[1]])
+
+    assert ids(recipe.get_topological_order()) == [2, 0, 1]
+
+
+def test_topological_order_ignores_edges_leaving_the_recipe():
+    instructions = make_chain(3)
+    recipe = Recipe(1, "partial", instructions[1:])
+
+    assert ids(recipe.get_topological_order()) == [1, 2]
+    assert recipe.validate_dag_structure()
+
+
+def test_cycle_fails_validation():
+    instructions = make_chain(3)
+    # Force a back edge past add_prerequisite's check, as loaded data could
+    instructions[0].prerequisites = [instructions[2]]
+    instructions[2].next = [instructions[0]]
+    recipe = Recipe(1, "cycle", instructions)
+
+    assert recipe.get_topological_order() == []
+    assert not recipe.validate_dag_structure()
+
+
+def test_topological_order_follows_edge_changes():
+    instructions = make_instructions(2)
+    recipe = Recipe(1, "edges", instructions)
+    assert ids(recipe.get_topological_order()) == [0, 1]
+
+    instructions[0].add_prerequisite(instructions[1])
+
+    assert ids(recipe.get_topological_order()) == [1, 0]
+
+
+def test_root_instructions_follow_edge_changes():
+    first, second = make_instructions(2)
+    recipe = Recipe(1, "roots", [first, second])
+    assert recipe.root_instructions == {first, second}
+
+    second.add_prerequisite(first)
+    assert recipe.root_instructions == {first}
+
+    second.remove_prerequisite(first)
+    assert recipe.root_instructions == {first, second}
+
+
+def test_removed_instruction_no_longer_updates_recipe():
+    first, second = make_instructions(2)
+    recipe = Recipe(1, "removed", [first, second])
+    recipe.remove_instruction(second)
+
+    second.add_prerequisite(first)
+
+    assert recipe.root_instructions == {first}
+    assert ids(recipe.get_topological_order()) == [0]
+
+
+# Cycle rejection
+def test_add_prerequisite_rejects_self_loop():
+    instruction = make_instructions(1)[0]
+
+    with pytest.raises(ValueError):
+        instruction.add_prerequisite(instruction)
+    assert list(instruction.prerequisites) == []
+
+
+def test_add_prerequisite_rejects_cycle_and_leaves_edges_unchanged():
+    instructions = make_chain(3)
+
+    with pytest.raises(ValueError):
+        instructions[0].add_prerequisite(instructions[2])
+    assert list(instructions[0].prerequisites) == []
+    assert list(instructions[2].next) == []
+
+
+def test_add_prerequisite_rejects_cycle_through_diamond():
+    top, left, right, bottom = make_diamond()
+
+    with pytest.raises(ValueError):
+        top.add_prerequisite(bottom)
+    assert list(top.prerequisites) == []
+
+
+def test_add_prerequisite_does_not_fill_closure_caches():
+    instructions = make_chain(4)
+
+    assert all(instruction._prerequisite_closure is None and instruction._dependent_closure is None
+               for instruction in instructions)
+
+
+def test_add_prerequisite_is_idempotent():
+    first, second = make_instructions(2)
+    second.add_prerequisite(first)
+    second.add_prerequisite(first)
+
+    assert second.prerequisites == [first]
+    assert first.next == [second]
+
+
+# Closure caching
+def test_closures_on_diamond():
+    top, left, right, bottom = make_diamond()
+
+    assert bottom.get_all_prerequisites() == {top, left, right}
+    assert top.get_all_dependents() == {left, right, bottom}
+    assert not bottom.has_cycle()
+
+
+def test_closures_invalidated_by_add_prerequisite():
+    instructions = make_instructions(3)
+    first, second, third = instructions
+    second.add_prerequisite(first)
+    assert third.get_all_prerequisites() == frozenset()
+    assert first.get_all_dependents() == {second}
+
+    third.add_prerequisite(second)
+
+    assert third.get_all_prerequisites() == {first, second}
+    assert first.get_all_dependents() == {second, third}
+
+
+def test_closures_invalidated_by_remove_prerequisite():
+    first, second, third = make_chain(3)
+    assert third.get_all_prerequisites() == {first, second}
+    assert first.get_all_dependents() == {second, third}
+
+    second.remove_prerequisite(first)
+
+    assert third.get_all_prerequisites() == {second}
+    assert first.get_all_dependents() == frozenset()
+    assert first.next == [] and second.prerequisites == []
+
+
+def test_edge_change_keeps_unrelated_closures():
+    first, second, third, fourth = make_instructions(4)
+    second.add_prerequisite(first)
+    fourth.add_prerequisite(third)
+    unrelated = fourth.get_all_prerequisites()
+    affected = second.get_all_prerequisites()
+
+    second.add_prerequisite(third)
+
+    assert fourth.get_all_prerequisites() is unrelated
+    assert second.get_all_prerequisites() is not affected
+    assert second.get_all_prerequisites() == {first, third}
+    assert third.get_all_dependents() == {second, fourth}
+
+
+def test_removed_edge_no_longer_blocks_reverse_edge():
+    first, second = make_chain(2)
+    second.remove_prerequisite(first)
+
+    first.add_prerequisite(second)
+
+    assert first.get_all_prerequisites() == {second}
+
+
+# Bulk construction from edges
+def test_from_edges_builds_diamond():
+    instructions = make_instructions(4)
+    recipe = Recipe.from_edges(1, "diamond", instructions, [(0, 1), (0, 2), (1, 3), (2, 3), (0, 1)])
+
+    top, left, right, bottom = instructions
+    assert top.next == [left, right]
+    assert bottom.prerequisites == [left, right]
+    assert recipe.root_instructions == {top}
+    assert_topological(recipe.get_topological_order(), instructions)
+    assert bottom.get_all_prerequisites() == {top, left, right}
+
+
+def test_from_edges_replaces_existing_edges():
+    instructions = make_chain(3)
+    recipe = Recipe.from_edges(1, "reversed", instructions, [(2, 1), (1, 0)])
+
+    assert ids(recipe.get_topological_order()) == [2, 1, 0]
+    assert instructions[0].get_all_prerequisites() == {instructions[1], instructions[2]}
+
+
+def test_from_edges_rejects_cycle_without_modifying_instructions():
+    first, second = make_chain(2)
+
+    with pytest.raises(ValueError):
+        Recipe.from_edges(1, "cycle", [first, second], [(0, 1), (1, 0)])
+    assert second.prerequisites == [first]
+    assert list(first.prerequisites) == []
+
+
+def test_from_edges_rejects_unknown_instruction():
+    instructions = make_instructions(2)
+
+    with pytest.raises(KeyError):
+        Recipe.from_edges(1, "unknown", instructions, [(0, 5)])
+    assert list(instructions[1].prerequisites) == []
+
+
+def test_from_edges_detaches_outside_instructions():
+    outside, inside, other = make_instructions(3)
+    inside.add_prerequisite(outside)
+    assert outside.get_all_dependents() == {inside}
+
+    Recipe.from_edges(1, "detached", [inside, other], [(2, 1)])
+
+    assert list(outside.next) == []
+    assert outside.get_all_dependents() == frozenset()
+    assert inside.prerequisites == [other]
+
+
+# Columnar rollups
+def test_reachability_on_diamond():
+    instructions = make_diamond()
+    recipe = Recipe(1, "diamond", instructions)
+
+    rows = recipe.get_instruction_columns().row_by_id
+    reach = recipe.get_reachability()
+    bit = {instruction_id: 1 << row for instruction_id, row in rows.items()}
+    assert reach[rows[0]] == 0
+    assert reach[rows[1]] == bit[0]
+    assert reach[rows[2]] == bit[0]
+    assert reach[rows[3]] == bit[0] | bit[1] | bit[2]
+
+
+def test_all_prerequisite_closures_match_per_instruction_closures():
+    instructions = make_diamond()
+    recipe = Recipe(1, "diamond", instructions)
+
+    closures = recipe.get_all_prerequisite_closures()
+    assert closures == {instruction: instruction.get_all_prerequisites() for instruction in instructions}
+
+
+def test_csr_rows_follow_topological_order():
+    instructions = make_chain(3)
+    recipe = Recipe(1, "chain", instructions)
+
+    indptr, indices = recipe.to_csr()
+    assert list(indptr) == [0, 0, 1, 2]
+    assert list(indices) == [0, 1]
+
+
+def test_critical_path_duration_takes_longest_branch():
+    instructions = make_diamond(durations={0: 5, 1: 10, 2: 3, 3: 2})
+    recipe = Recipe(1, "diamond", instructions)
+
+    assert recipe.get_critical_path_duration() == pytest.approx(17.0)
+    assert recipe.get_total_duration() == pytest.approx(20.0)
+
+
+def test_critical_path_duration_skips_missing_durations():
+    instructions = make_diamond(durations={0: 5, 2: 3})
+    recipe = Recipe(1, "diamond", instructions)
+
+    assert recipe.get_critical_path_duration() == pytest.approx(8.0)
+
+
+def test_critical_path_duration_of_empty_recipe():
+    assert Recipe(1, "empty").get_critical_path_duration() == 0.0
+
+
+# Adjacency sorting
+def test_sort_adjacency_orders_edges_topologically():
+    instructions = make_instructions(4)
+    a, b, c, d = instructions
+    b.add_prerequisite(a)
+    c.add_prerequisite(b)
+    # Insert d's prerequisites in reverse topological order
+    d.add_prerequisite(c)
+    d.add_prerequisite(a)
+    a.next.reverse()
+    recipe = Recipe(1, "sorted", instructions)
+
+    assert recipe.sort_adjacency()
+    assert d.prerequisites == [a, c]
+    assert a.next == [b, d]
+
+
+def test_sort_adjacency_fails_on_cycle():
+    instructions = make_chain(2)
+    instructions[0].prerequisites = [instructions[1]]
+    instructions[1].next = [instructions[0]]
+    recipe = Recipe(1, "cycle", instructions)
+
+    assert not recipe.sort_adjacency()
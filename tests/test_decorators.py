@@ -0,0 +1,87 @@
+"""
+Controller decorator tests
+
+Covers the safe_repo_call error-handling decorator shared by controllers.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import logging
+
+from controllers.decorators import safe_repo_call
+
+
+# safe_repo_call
+class Repo:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    @safe_repo_call(default=list, message="Error finding {name} (limit {limit})")
+    def find(self, name, limit=10):
+        if self.fail:
+            raise RuntimeError("connection lost")
+        return [name] * limit
+
+    @safe_repo_call(default=None, message="Error retrieving {entity_id}")
+    def get(self, entity_id):
+        raise RuntimeError("not found")
+
+
+def test_safe_repo_call_passes_through_result():
+    assert Repo().find("salt", limit=2) == ["salt", "salt"]
+
+
+def test_safe_repo_call_builds_fresh_default_on_failure():
+    repo = Repo(fail=True)
+
+    first = repo.find("salt")
+    second = repo.find("salt")
+
+    assert first == [] and second == []
+    assert first is not second
+
+
+def test_safe_repo_call_returns_plain_default_on_failure():
+    assert Repo().get(7) is None
+
+
+def test_safe_repo_call_formats_message_with_bound_arguments(caplog):
+    with caplog.at_level(logging.ERROR):
+        Repo(fail=True).find("pepper")
+
+    assert caplog.records[-1].getMessage() == "Error finding pepper (limit 10): connection lost"
+    assert caplog.records[-1].name == __name__
+
+
+def test_safe_repo_call_formats_keyword_arguments(caplog):
+    with caplog.at_level(logging.ERROR):
+        Repo(fail=True).find(name="basil", limit=3)
+
+    assert caplog.records[-1].getMessage() == "Error finding basil (limit 3): connection lost"
+
+
+def test_safe_repo_call_preserves_metadata():
+    assert Repo.find.__name__ == "find"
+
+
+def test_safe_repo_call_logs_raw_template_when_arguments_do_not_bind(caplog):
+    with caplog.at_level(logging.ERROR):
+        assert Repo().get() is None
+
+    message = caplog.records[-1].getMessage()
+    assert message.startswith("Error retrieving {entity_id}: ")
+    assert "entity_id" in message.split(": ", 1)[1]
+
+
+def test_safe_repo_call_logs_raw_template_when_placeholder_is_unknown(caplog):
+    class Broken:
+        @safe_repo_call(default=None, message="Error loading {missing}")
+        def load(self):
+            raise RuntimeError("boom")
+
+    with caplog.at_level(logging.ERROR):
+        Broken().load()
+
+    assert caplog.records[-1].getMessage() == "Error loading {missing}: boom"